@@ -0,0 +1,69 @@
+import hashlib
+import os
+from collections.abc import Sequence
+
+from fastapi import HTTPException, Request, Response
+
+from app.core.settings import get_cache_max_age_seconds, get_normalized_data_dir
+from app.domain.analytics.backend import get_backend
+from app.services.market_data.asset_catalog import get_asset_catalog
+
+
+def conditional_get(
+    request: Request,
+    response: Response,
+    symbols: Sequence[str],
+    timeframe: str,
+) -> None:
+    # Series responses depend only on the request and the files they read, so a strong ETag
+    # over both lets an unchanged request be answered with 304 before anything is loaded.
+    etag = series_etag(request, symbols, timeframe)
+    if etag is None:
+        return
+
+    # The representation is negotiated from Accept, so caches must key on it too.
+    headers = {"ETag": etag, "Cache-Control": cache_control(), "Vary": "Accept"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+
+def series_etag(request: Request, symbols: Sequence[str], timeframe: str) -> str | None:
+    # None when a series is missing: the route reports that itself and nothing is cached.
+    normalized_dir = get_normalized_data_dir()
+    catalog = get_asset_catalog(normalized_dir)
+
+    accept = request.headers.get("accept", "")
+    digest = hashlib.sha256()
+    # The app version and analytics backend change results without changing the data.
+    for part in (request.app.version, get_backend(), request.url.path, request.url.query, accept):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    for symbol in symbols:
+        if not catalog.contains(symbol, timeframe):
+            return None
+        try:
+            stat = os.stat(normalized_dir / f"{symbol}_{timeframe}.csv")
+        except FileNotFoundError:
+            return None
+        digest.update(f"{symbol}_{timeframe}:{stat.st_size}:{stat.st_mtime_ns}\0".encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def cache_control() -> str:
+    # Without a max age, caches may store responses but must revalidate them with the ETag.
+    max_age = get_cache_max_age_seconds()
+    if max_age <= 0:
+        return "public, no-cache"
+    return f"public, max-age={max_age}"
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    # If-None-Match uses the weak comparison: a W/ prefix is ignored.
+    if header is None:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
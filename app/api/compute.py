@@ -0,0 +1,23 @@
+from collections.abc import Callable
+
+from fastapi import HTTPException
+
+from app.core.compute import ComputeBusyError, ComputeTimeoutError, get_compute
+
+
+def run_compute[T](fn: Callable[..., T], /, *args: object) -> T:
+    # `fn` and its arguments must be picklable when the process executor is configured: a
+    # module-level function taking frames, symbols and plain values.
+    try:
+        return get_compute().run(fn, *args)
+    except ComputeBusyError:
+        raise HTTPException(
+            status_code=503,
+            detail="Analytics capacity exhausted, retry later",
+            headers={"Retry-After": "1"},
+        ) from None
+    except ComputeTimeoutError as error:
+        raise HTTPException(status_code=504, detail=str(error)) from None
+    except ValueError as error:
+        # Domain checks (too few observations, invalid base values) reject the request.
+        raise HTTPException(status_code=422, detail=str(error)) from None
@@ -0,0 +1,150 @@
+import json
+import math
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Annotated
+
+from fastapi import Header, Response
+from fastapi.responses import StreamingResponse
+
+from app.domain.analytics.frame import SeriesFrame, epoch_to_datetime
+
+JSON_MEDIA_TYPE = "application/json"
+BINARY_MEDIA_TYPE = "application/octet-stream"
+CSV_MEDIA_TYPE = "text/csv"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Row formats that can be written block by block while the series is still being read.
+STREAM_MEDIA_TYPES = (CSV_MEDIA_TYPE, NDJSON_MEDIA_TYPE)
+# Preferred first when an Accept header rates several of them equally.
+_MEDIA_TYPES = (JSON_MEDIA_TYPE, BINARY_MEDIA_TYPE, CSV_MEDIA_TYPE, NDJSON_MEDIA_TYPE)
+
+# Binary layout, all little-endian: header (magic, rows, column count), then per value column a
+# uint16 name length and its UTF-8 name, zero padding to a multiple of 8 bytes, then the columns
+# one after another: timestamps as int64 epoch seconds, each value column as float64.
+BINARY_MAGIC = b"QLSER\x00\x01\x00"
+BINARY_HEADER = struct.Struct("<8sQI")
+_CHUNK_BYTES = 1 << 20
+_ROW_CHUNK_ROWS = 4096
+
+
+def accepted_media_type(accept: Annotated[str | None, Header()] = None) -> str:
+    # The best of JSON, binary, CSV and NDJSON by the Accept header's q-values; JSON when none
+    # fits.
+    if accept is None:
+        return JSON_MEDIA_TYPE
+
+    ranges: list[tuple[str, float]] = []
+    for entry in accept.split(","):
+        media_range, *params = (part.strip() for part in entry.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_range:
+            ranges.append((media_range.lower(), quality))
+
+    best = JSON_MEDIA_TYPE
+    best_quality = 0.0
+    for media_type in _MEDIA_TYPES:
+        quality = _quality(media_type, ranges)
+        if quality > best_quality:
+            best, best_quality = media_type, quality
+    return best
+
+
+def frame_stream_response(
+    response: Response,
+    media_type: str,
+    frame: SeriesFrame,
+    **fields: str,
+) -> StreamingResponse:
+    # `fields` maps exported column names to frame columns, as in frame_points. Headers set on
+    # the injected response (ETag) are kept.
+    if media_type != BINARY_MEDIA_TYPE:
+        return blocks_stream_response(response, media_type, frame.blocks(_ROW_CHUNK_ROWS), **fields)
+
+    headers = dict(response.headers)
+    header = _binary_header(len(frame), list(fields))
+    headers["Content-Length"] = str(len(header) + frame.timestamps.nbytes * (1 + len(fields)))
+    body = _binary_chunks(header, frame, fields)
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
+def blocks_stream_response(
+    response: Response,
+    media_type: str,
+    blocks: Iterable[SeriesFrame],
+    **fields: str,
+) -> StreamingResponse:
+    # CSV or NDJSON written one block at a time, so the first rows go out before the last
+    # ones are read.
+    encode = _ndjson_chunks if media_type == NDJSON_MEDIA_TYPE else _csv_chunks
+    return StreamingResponse(
+        encode(blocks, fields), media_type=media_type, headers=dict(response.headers)
+    )
+
+
+def _quality(media_type: str, ranges: list[tuple[str, float]]) -> float:
+    # The most specific matching range decides: type/subtype, then type/*, then */*.
+    main_type = media_type.split("/")[0]
+    for candidate in (media_type, f"{main_type}/*", "*/*"):
+        for media_range, quality in ranges:
+            if media_range == candidate:
+                return quality
+    return 0.0
+
+
+def _binary_header(rows: int, names: list[str]) -> bytes:
+    parts = [BINARY_HEADER.pack(BINARY_MAGIC, rows, len(names))]
+    for name in names:
+        encoded = name.encode("utf-8")
+        parts.append(struct.pack("<H", len(encoded)) + encoded)
+    header = b"".join(parts)
+    return header + b"\0" * (-len(header) % 8)
+
+
+def _binary_chunks(
+    header: bytes, frame: SeriesFrame, fields: dict[str, str]
+) -> Iterator[bytes | memoryview]:
+    yield header
+    for column in (frame.timestamps, *(frame.column(name) for name in fields.values())):
+        # Little-endian hosts send the frame's buffers (memory-mapped sidecars included) as is.
+        if sys.byteorder == "little":
+            data = column.cast("B")
+        else:
+            swapped = array(column.format, column)
+            swapped.byteswap()
+            data = memoryview(swapped).cast("B")
+        for start in range(0, len(data), _CHUNK_BYTES):
+            yield data[start : start + _CHUNK_BYTES]
+
+
+def _csv_chunks(blocks: Iterable[SeriesFrame], fields: dict[str, str]) -> Iterator[bytes]:
+    yield ("timestamp_utc," + ",".join(fields) + "\n").encode("utf-8")
+    for block in blocks:
+        columns = [block.column(name) for name in fields.values()]
+        lines = []
+        for ts, *row in zip(block.timestamps, *columns, strict=True):
+            values = ",".join(repr(value) if math.isfinite(value) else "" for value in row)
+            lines.append(f"{epoch_to_datetime(ts).isoformat()},{values}\n")
+        yield "".join(lines).encode("utf-8")
+
+
+def _ndjson_chunks(blocks: Iterable[SeriesFrame], fields: dict[str, str]) -> Iterator[bytes]:
+    # One JSON object per line with the same fields and timestamp format as the point lists.
+    names = list(fields)
+    for block in blocks:
+        columns = [block.column(fields[name]) for name in names]
+        lines = []
+        for ts, *row in zip(block.timestamps, *columns, strict=True):
+            item = {"timestamp_utc": epoch_to_datetime(ts).isoformat().replace("+00:00", "Z")}
+            for name, value in zip(names, row, strict=True):
+                item[name] = value if math.isfinite(value) else None
+            lines.append(json.dumps(item, separators=(",", ":")) + "\n")
+        yield "".join(lines).encode("utf-8")
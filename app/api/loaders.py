@@ -0,0 +1,28 @@
+from fastapi import HTTPException
+
+from app.api.params import TimeRange
+from app.core.settings import get_normalized_data_dir
+from app.domain.analytics.frame import SeriesFrame
+from app.services.market_data.reader import NormalizedCsvReader
+
+
+def read_close_frames(
+    symbols: list[str],
+    timeframe: str,
+    limit: int,
+    period: TimeRange,
+) -> dict[str, SeriesFrame]:
+    reader = NormalizedCsvReader(normalized_dir=get_normalized_data_dir())
+    result = reader.read_many(symbols, timeframe, limit, start=period.start, end=period.end)
+
+    # Errors are reported for the first failing symbol in request order.
+    for symbol in symbols:
+        error = result.errors.get(symbol)
+        if isinstance(error, FileNotFoundError):
+            raise HTTPException(
+                status_code=404,
+                detail=f"Normalized data not found for {symbol} {timeframe}",
+            )
+        if error is not None:
+            raise error
+    return result.frames
@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import HTTPException, Query
+
+from app.api.export import JSON_MEDIA_TYPE
+from app.domain.analytics.alignment import INNER_JOIN, ForwardFillJoin, JoinPolicy
+from app.domain.analytics.downsampling import LTTB
+from app.services.market_data.timestamps import as_utc
+
+MAX_WINDOWS = 8
+MAX_JSON_LIMIT = 5000
+# Binary and CSV exports stream from the series buffers, so they may return whole histories.
+MAX_EXPORT_LIMIT = 1_000_000
+
+
+@dataclass(frozen=True)
+class TimeRange:
+    start: datetime | None
+    end: datetime | None
+
+
+def time_range(
+    start: Annotated[datetime | None, Query()] = None,
+    end: Annotated[datetime | None, Query()] = None,
+) -> TimeRange:
+    # Naive values such as "2008-01-01" are read as UTC, like the normalized data itself.
+    start_utc = as_utc(start) if start is not None else None
+    end_utc = as_utc(end) if end is not None else None
+    if start_utc is not None and end_utc is not None and start_utc > end_utc:
+        raise HTTPException(status_code=422, detail="start must not be after end")
+    return TimeRange(start=start_utc, end=end_utc)
+
+
+def join_policy(
+    join: Annotated[str, Query(pattern="^(inner|ffill)$")] = "inner",
+    max_gap: Annotated[int | None, Query(ge=0)] = None,
+) -> JoinPolicy:
+    # `max_gap` is in seconds and only applies to forward filling.
+    if join == "ffill":
+        return ForwardFillJoin(max_gap_seconds=max_gap)
+    return INNER_JOIN
+
+
+def parse_windows(window: list[int] | None, default: int, maximum: int = 1000) -> list[int]:
+    windows = list(dict.fromkeys(window or [default]))
+    if len(windows) > MAX_WINDOWS:
+        raise HTTPException(status_code=422, detail=f"At most {MAX_WINDOWS} windows are allowed")
+    if any(w < 2 or w > maximum for w in windows):
+        raise HTTPException(status_code=422, detail=f"window must be between 2 and {maximum}")
+    return windows
+
+
+POINTS_FORMAT = "points"
+COLUMNAR_FORMAT = "columnar"
+
+
+def series_format(
+    format: Annotated[str, Query(pattern="^(points|columnar)$")] = POINTS_FORMAT,
+) -> str:
+    # `columnar` returns parallel `timestamps` (epoch seconds) and `values` arrays per series.
+    return format
+
+
+@dataclass(frozen=True)
+class Downsampling:
+    max_points: int
+    method: str
+
+
+def downsampling(
+    max_points: Annotated[int | None, Query(ge=3, le=MAX_JSON_LIMIT)] = None,
+    downsample: Annotated[str, Query(pattern="^(lttb|minmax)$")] = LTTB,
+) -> Downsampling | None:
+    # Charts need a point or two per pixel: `max_points` thins the selected rows down to that,
+    # keeping extremes and the maximum drawdown.
+    if max_points is None:
+        return None
+    return Downsampling(max_points=max_points, method=downsample)
+
+
+def check_limit(limit: int, media_type: str, sampling: Downsampling | None = None) -> None:
+    # Downsampled responses stay small however many rows they are drawn from.
+    if sampling is not None:
+        return
+    if media_type == JSON_MEDIA_TYPE and limit > MAX_JSON_LIMIT:
+        raise HTTPException(
+            status_code=422,
+            detail=f"limit must be at most {MAX_JSON_LIMIT} for JSON responses",
+        )
@@ -8,6 +8,7 @@ from app.api.routes.health import router as health_router
 from app.api.routes.prices import router as prices_router
 from app.api.routes.returns import router as returns_router
 from app.api.routes.risk import router as risk_router
+from app.api.routes.rolling import router as rolling_router
 from app.api.routes.volatility import router as volatility_router
 
 router = APIRouter(prefix="/api/v1")
@@ -18,5 +19,6 @@ router.include_router(volatility_router)
 router.include_router(correlation_router)
 router.include_router(compare_router)
 router.include_router(risk_router)
+router.include_router(rolling_router)
 router.include_router(assets_router)
 router.include_router(drawdown_router)
@@ -1,15 +1,19 @@
 from fastapi import APIRouter
 
-from app.schemas.assets import AssetsOverviewOut
+from app.schemas.assets import AssetsOverviewOut, OverviewRefreshOut
 from app.services.market_data.assets_inventory import build_assets_inventory
-from app.services.market_data.assets_summary import build_assets_overview
+from app.services.market_data.assets_summary import (
+    build_assets_overview,
+    refresh_assets_overview,
+)
 
 router = APIRouter(tags=["assets"])
 
 
 @router.get("/assets")
-def list_assets() -> dict:
-    assets = build_assets_inventory()
+def list_assets(details: bool = False) -> dict:
+    # `details=true` adds row count, first/last timestamp, size and mtime for every file.
+    assets = build_assets_inventory(details=details)
     return {"assets": assets}
 
 
@@ -17,3 +21,9 @@ def list_assets() -> dict:
 def assets_overview() -> dict:
     assets = build_assets_overview()
     return {"assets": assets}
+
+
+@router.post("/assets/overview/refresh", response_model=OverviewRefreshOut)
+def refresh_overview() -> dict:
+    # Recomputes only the overview rows whose data changed since they were materialized.
+    return {"refreshed": refresh_assets_overview()}
@@ -1,64 +1,81 @@
+import sys
 from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
-from app.core.settings import get_normalized_data_dir
-from app.domain.analytics.normalized_performance import (
-    align_price_series,
-    aligned_timestamps,
-    normalize_series,
+from app.api.caching import conditional_get
+from app.api.compute import run_compute
+from app.api.export import JSON_MEDIA_TYPE, accepted_media_type, frame_stream_response
+from app.api.loaders import read_close_frames
+from app.api.params import (
+    COLUMNAR_FORMAT,
+    MAX_EXPORT_LIMIT,
+    Downsampling,
+    TimeRange,
+    check_limit,
+    downsampling,
+    join_policy,
+    series_format,
+    time_range,
 )
+from app.api.serialization import columnar_response, frame_columns, frame_points
+from app.domain.analytics.alignment import JoinPolicy, align_frames
+from app.domain.analytics.downsampling import downsample_frame
+from app.domain.analytics.frame import SeriesFrame
+from app.domain.analytics.normalized_performance import normalize_frame
 from app.schemas.compare import NormalizedPerformanceOut
-from app.services.market_data.reader import NormalizedCsvReader
 
 router = APIRouter(tags=["compare"])
 
 DEFAULT_BASE_VALUE = 100.0
+DEFAULT_LIMIT = 365
 
 
 @router.get("/analytics/normalized-performance", response_model=NormalizedPerformanceOut)
 def get_normalized_performance(
+    request: Request,
+    response: Response,
     symbols: Annotated[list[str], Query(min_length=2)],
+    period: Annotated[TimeRange, Depends(time_range)],
+    policy: Annotated[JoinPolicy, Depends(join_policy)],
+    output: Annotated[str, Depends(series_format)],
+    media_type: Annotated[str, Depends(accepted_media_type)],
+    sampling: Annotated[Downsampling | None, Depends(downsampling)],
     timeframe: Annotated[str, Query(min_length=1)] = "1d",
-    limit: Annotated[int, Query(ge=2, le=5000)] = 365,
+    limit: Annotated[int | None, Query(ge=2, le=MAX_EXPORT_LIMIT)] = None,
     base_value: Annotated[float, Query(gt=0)] = DEFAULT_BASE_VALUE,
 ):
     normalized_symbols = [symbol.strip().upper() for symbol in symbols if symbol.strip() != ""]
     deduped_symbols = list(dict.fromkeys(normalized_symbols))
+    # Downsampling without a limit covers the whole range.
+    if limit is None and sampling is None:
+        limit = DEFAULT_LIMIT
+    check_limit(limit or sys.maxsize, media_type, sampling)
 
     if len(deduped_symbols) < 2:
         raise HTTPException(status_code=422, detail="At least two unique symbols are required")
 
-    reader = NormalizedCsvReader(normalized_dir=get_normalized_data_dir())
-
-    prices_by_symbol: dict[str, list[tuple[object, float]]] = {}
-    for symbol in deduped_symbols:
-        try:
-            points = reader.read_close_series(symbol=symbol, timeframe=timeframe, limit=limit)
-        except FileNotFoundError:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Normalized data not found for {symbol} {timeframe}",
-            ) from None
-
-        prices_by_symbol[symbol] = [(point.timestamp_utc, point.close) for point in points]
-
-    aligned_prices = align_price_series(prices_by_symbol)
-    timestamps = aligned_timestamps(prices_by_symbol)
-    observations = len(timestamps)
-
-    if observations < 2:
-        raise HTTPException(
-            status_code=422,
-            detail="Not enough overlapping observations to compute normalized performance",
+    conditional_get(request, response, deduped_symbols, timeframe)
+    prices_by_symbol = read_close_frames(deduped_symbols, timeframe, limit or sys.maxsize, period)
+    if media_type != JSON_MEDIA_TYPE:
+        # Exported as one aligned frame with a column per symbol.
+        _, normalized = run_compute(
+            _normalized_frame, deduped_symbols, prices_by_symbol, policy, base_value, sampling
         )
+        fields = {symbol: symbol for symbol in deduped_symbols}
+        return frame_stream_response(response, media_type, normalized, **fields)
 
-    try:
-        series = normalize_series(deduped_symbols, timestamps, aligned_prices, base_value)
-    except ValueError as error:
-        raise HTTPException(status_code=422, detail=str(error)) from error
+    observations, series = run_compute(
+        _normalized_series,
+        deduped_symbols,
+        prices_by_symbol,
+        policy,
+        base_value,
+        sampling,
+        output,
+    )
 
-    return {
+    content = {
         "symbols": deduped_symbols,
         "timeframe": timeframe,
         "limit": limit,
@@ -66,3 +83,49 @@ def get_normalized_performance(
         "base_value": base_value,
         "series": series,
     }
+    if output == COLUMNAR_FORMAT:
+        return columnar_response(response, content)
+    return content
+
+
+# Runs in a compute worker process when one is configured, so it takes and returns only
+# picklable values.
+def _normalized_series(
+    symbols: list[str],
+    prices_by_symbol: dict[str, SeriesFrame],
+    policy: JoinPolicy,
+    base_value: float,
+    sampling: Downsampling | None,
+    output: str,
+) -> tuple[int, list[dict[str, object]]]:
+    observations, normalized = _normalized_frame(
+        symbols, prices_by_symbol, policy, base_value, sampling
+    )
+    if output == COLUMNAR_FORMAT:
+        series = [
+            {"symbol": symbol, **frame_columns(normalized, value=symbol)} for symbol in symbols
+        ]
+    else:
+        series = [
+            {"symbol": symbol, "points": frame_points(normalized, value=symbol)}
+            for symbol in symbols
+        ]
+    return observations, series
+
+
+def _normalized_frame(
+    symbols: list[str],
+    prices_by_symbol: dict[str, SeriesFrame],
+    policy: JoinPolicy,
+    base_value: float,
+    sampling: Downsampling | None,
+) -> tuple[int, SeriesFrame]:
+    # `observations` counts the aligned rows before any downsampling.
+    aligned_prices = align_frames(prices_by_symbol, column="close", policy=policy)
+    observations = len(aligned_prices)
+    if observations < 2:
+        raise ValueError("Not enough overlapping observations to compute normalized performance")
+    normalized = normalize_frame(aligned_prices, symbols, base_value)
+    if sampling is not None:
+        normalized = downsample_frame(normalized, sampling.max_points, sampling.method, symbols)
+    return observations, normalized
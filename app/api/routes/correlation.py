@@ -1,58 +1,101 @@
 from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
-from app.core.settings import get_normalized_data_dir
-from app.domain.analytics.correlation import align_series, correlation_matrix
-from app.domain.analytics.returns import log_returns
+from app.api.caching import conditional_get
+from app.api.compute import run_compute
+from app.api.loaders import read_close_frames
+from app.api.params import TimeRange, join_policy, time_range
+from app.domain.analytics.alignment import (
+    ForwardFillJoin,
+    JoinPolicy,
+    OuterJoin,
+)
+from app.domain.analytics.correlation import comoment_matrix, pairwise_comoments
+from app.domain.analytics.frame import SeriesFrame
+from app.domain.analytics.returns import aligned_log_returns
 from app.schemas.correlation import CorrelationMatrixOut
-from app.services.market_data.reader import NormalizedCsvReader
 
 router = APIRouter(tags=["correlation"])
 
+MAX_SYMBOLS = 500
+
 
 @router.get("/analytics/correlation", response_model=CorrelationMatrixOut)
 def get_correlation(
-    symbols: Annotated[list[str], Query(min_length=2)],
+    request: Request,
+    response: Response,
+    symbols: Annotated[list[str], Query(min_length=2, max_length=MAX_SYMBOLS)],
+    period: Annotated[TimeRange, Depends(time_range)],
+    policy: Annotated[JoinPolicy, Depends(join_policy)],
     timeframe: Annotated[str, Query(min_length=1)] = "1d",
     limit: Annotated[int, Query(ge=2, le=5000)] = 365,
+    include_covariance: bool = False,
+    pairwise: bool = False,
 ):
     normalized_symbols = [symbol.strip().upper() for symbol in symbols if symbol.strip() != ""]
     deduped_symbols = list(dict.fromkeys(normalized_symbols))
 
     if len(deduped_symbols) < 2:
         raise HTTPException(status_code=422, detail="At least two unique symbols are required")
+    if pairwise and isinstance(policy, ForwardFillJoin):
+        raise HTTPException(status_code=422, detail="pairwise cannot be combined with join=ffill")
 
-    reader = NormalizedCsvReader(normalized_dir=get_normalized_data_dir())
+    conditional_get(request, response, deduped_symbols, timeframe)
+    prices_by_symbol = read_close_frames(deduped_symbols, timeframe, limit, period)
+    compute = _pairwise_correlation if pairwise else _correlation
+    result = run_compute(compute, deduped_symbols, prices_by_symbol, policy, include_covariance)
 
-    returns_by_symbol: dict[str, list[tuple[object, float]]] = {}
-    for symbol in deduped_symbols:
-        try:
-            points = reader.read_close_series(symbol=symbol, timeframe=timeframe, limit=limit)
-        except FileNotFoundError:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Normalized data not found for {symbol} {timeframe}",
-            ) from None
+    return {
+        "symbols": deduped_symbols,
+        "timeframe": timeframe,
+        "limit": limit,
+        **result,
+    }
 
-        close_points = [(p.timestamp_utc, p.close) for p in points]
-        returns_points = log_returns(close_points)
-        returns_by_symbol[symbol] = [(point.timestamp_utc, point.value) for point in returns_points]
 
-    aligned_returns = align_series(returns_by_symbol)
-    observations = len(aligned_returns[deduped_symbols[0]])
+# The computations below may run in a compute worker process: they take and return only
+# picklable values and report an unusable request with ValueError.
+def _correlation(
+    symbols: list[str],
+    prices_by_symbol: dict[str, SeriesFrame],
+    policy: JoinPolicy,
+    include_covariance: bool,
+) -> dict[str, object]:
+    aligned_returns = aligned_log_returns(prices_by_symbol, policy=policy)
+    observations = len(aligned_returns)
     if observations < 2:
-        raise HTTPException(
-            status_code=422,
-            detail="Not enough overlapping observations to compute correlation",
-        )
-
-    rows = correlation_matrix(deduped_symbols, aligned_returns)
+        raise ValueError("Not enough overlapping observations to compute correlation")
 
+    matrix = comoment_matrix(symbols, aligned_returns.columns)
     return {
-        "symbols": deduped_symbols,
-        "timeframe": timeframe,
-        "limit": limit,
         "observations": observations,
-        "rows": rows,
+        "rows": matrix.correlation_rows(),
+        "covariance_rows": matrix.covariance_rows() if include_covariance else None,
+    }
+
+
+def _pairwise_correlation(
+    symbols: list[str],
+    prices_by_symbol: dict[str, SeriesFrame],
+    policy: JoinPolicy,
+    include_covariance: bool,
+) -> dict[str, object]:
+    # Every pair is correlated over its own overlap, so one short history only limits the
+    # pairs it belongs to. The outer join marks missing returns with NaN; `policy` is always
+    # the inner join here, as ffill is rejected up front.
+    outer_returns = aligned_log_returns(prices_by_symbol, policy=OuterJoin())
+    matrix = pairwise_comoments(symbols, outer_returns.columns)
+
+    overlaps = [
+        matrix.observations[i][j] for i in range(len(symbols)) for j in range(i + 1, len(symbols))
+    ]
+    if max(overlaps) < 2:
+        raise ValueError("Not enough overlapping observations to compute correlation")
+
+    return {
+        "observations": min(overlaps),
+        "rows": matrix.correlation_rows(),
+        "covariance_rows": matrix.covariance_rows() if include_covariance else None,
+        "observation_rows": matrix.observation_rows(),
     }
@@ -1,7 +1,20 @@
-from fastapi import APIRouter, HTTPException, Query
+from typing import Annotated
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+
+from app.api.caching import conditional_get
+from app.api.export import JSON_MEDIA_TYPE, accepted_media_type, frame_stream_response
+from app.api.params import (
+    COLUMNAR_FORMAT,
+    MAX_EXPORT_LIMIT,
+    TimeRange,
+    check_limit,
+    series_format,
+    time_range,
+)
+from app.api.serialization import columnar_response, frame_columns, frame_points
 from app.core.settings import get_normalized_data_dir
-from app.domain.analytics.drawdown import drawdown_series
+from app.domain.analytics.drawdown import drawdown_frame
 from app.schemas.series import DrawdownSeriesOut
 from app.services.market_data.reader import NormalizedCsvReader
 
@@ -11,17 +24,26 @@ router = APIRouter()
 @router.get("/assets/{symbol}/drawdown", response_model=DrawdownSeriesOut)
 def get_drawdown(
     symbol: str,
+    request: Request,
+    response: Response,
+    period: Annotated[TimeRange, Depends(time_range)],
+    output: Annotated[str, Depends(series_format)],
+    media_type: Annotated[str, Depends(accepted_media_type)],
     timeframe: str = Query(default="1d", min_length=1),
-    limit: int = Query(default=500, ge=2, le=5000),
+    limit: int = Query(default=500, ge=2, le=MAX_EXPORT_LIMIT),
 ):
     normalized_symbol = symbol.strip().upper()
+    check_limit(limit, media_type)
 
+    conditional_get(request, response, [normalized_symbol], timeframe)
     reader = NormalizedCsvReader(normalized_dir=get_normalized_data_dir())
     try:
-        points = reader.read_close_series(
+        prices = reader.read_close_frame(
             symbol=normalized_symbol,
             timeframe=timeframe,
             limit=limit,
+            start=period.start,
+            end=period.end,
         )
     except FileNotFoundError:
         raise HTTPException(
@@ -29,17 +51,16 @@ def get_drawdown(
             detail=f"Normalized data not found for {normalized_symbol} {timeframe}",
         ) from None
 
-    close_points = [(p.timestamp_utc, p.close) for p in points]
-    dd_points = drawdown_series(close_points)
+    drawdowns = drawdown_frame(prices)
 
+    if media_type != JSON_MEDIA_TYPE:
+        return frame_stream_response(
+            response, media_type, drawdowns, value="value", peak_close="peak_close"
+        )
+    if output == COLUMNAR_FORMAT:
+        columns = frame_columns(drawdowns, value="value", peak_close="peak_close")
+        return columnar_response(response, {"symbol": normalized_symbol, **columns})
     return {
         "symbol": normalized_symbol,
-        "points": [
-            {
-                "timestamp_utc": d.timestamp_utc,
-                "value": d.value,
-                "peak_close": d.peak_close,
-            }
-            for d in dd_points
-        ],
+        "points": frame_points(drawdowns, value="value", peak_close="peak_close"),
     }
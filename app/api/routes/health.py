@@ -1,8 +1,20 @@
-from fastapi import APIRouter
+from dataclasses import asdict
+
+from fastapi import APIRouter, Response
+
+from app.services.market_data.warmup import WARMUP_DISABLED, WARMUP_WARMING, get_warmup
 
 router = APIRouter()
 
 
 @router.get("/health")
-def health():
-    return {"status": "ok"}
+def health(response: Response):
+    status = get_warmup().status()
+    if status.state == WARMUP_DISABLED:
+        return {"status": "ok"}
+
+    # Not ready while warming, so load balancers keep traffic on warmed instances.
+    if status.state == WARMUP_WARMING:
+        response.status_code = 503
+        return {"status": "warming", "warmup": asdict(status)}
+    return {"status": "ok", "warmup": asdict(status)}
@@ -1,13 +1,37 @@
+import sys
 from datetime import datetime
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 
+from app.api.caching import conditional_get
+from app.api.export import (
+    JSON_MEDIA_TYPE,
+    STREAM_MEDIA_TYPES,
+    accepted_media_type,
+    blocks_stream_response,
+    frame_stream_response,
+)
+from app.api.params import (
+    COLUMNAR_FORMAT,
+    MAX_EXPORT_LIMIT,
+    Downsampling,
+    TimeRange,
+    check_limit,
+    downsampling,
+    series_format,
+    time_range,
+)
+from app.api.serialization import columnar_response, frame_columns, frame_points
 from app.core.settings import get_normalized_data_dir
+from app.domain.analytics.downsampling import downsample_frame
 from app.services.market_data.reader import NormalizedCsvReader
 
 router = APIRouter()
 
+DEFAULT_LIMIT = 500
+
 
 class PricePointOut(BaseModel):
     timestamp_utc: datetime
@@ -22,17 +46,37 @@ class PricesOut(BaseModel):
 @router.get("/assets/{symbol}/prices", response_model=PricesOut)
 def get_prices(
     symbol: str,
+    request: Request,
+    response: Response,
+    period: Annotated[TimeRange, Depends(time_range)],
+    output: Annotated[str, Depends(series_format)],
+    media_type: Annotated[str, Depends(accepted_media_type)],
+    sampling: Annotated[Downsampling | None, Depends(downsampling)],
     timeframe: str = Query(default="1h", min_length=1),
-    limit: int = Query(default=500, ge=1, le=5000),
+    limit: Annotated[int | None, Query(ge=1, le=MAX_EXPORT_LIMIT)] = None,
 ):
     normalized_symbol = symbol.strip().upper()
+    # Without a limit, CSV and NDJSON stream the whole range straight from the reader, and
+    # downsampling is applied to the whole range.
+    unbounded = limit is None and sampling is None and media_type in STREAM_MEDIA_TYPES
+    if limit is None:
+        limit = sys.maxsize if sampling is not None else DEFAULT_LIMIT
+    check_limit(limit, media_type, sampling)
+    conditional_get(request, response, [normalized_symbol], timeframe)
     reader = NormalizedCsvReader(normalized_dir=get_normalized_data_dir())
 
     try:
-        points = reader.read_close_series(
+        if unbounded:
+            blocks = reader.iter_close_blocks(
+                normalized_symbol, timeframe, start=period.start, end=period.end
+            )
+            return blocks_stream_response(response, media_type, blocks, close="close")
+        prices = reader.read_close_frame(
             symbol=normalized_symbol,
             timeframe=timeframe,
             limit=limit,
+            start=period.start,
+            end=period.end,
         )
     except FileNotFoundError:
         raise HTTPException(
@@ -40,7 +84,15 @@ def get_prices(
             detail=f"Normalized data not found for {normalized_symbol} {timeframe}",
         ) from None
 
+    if sampling is not None:
+        prices = downsample_frame(prices, sampling.max_points, sampling.method)
+    if media_type != JSON_MEDIA_TYPE:
+        return frame_stream_response(response, media_type, prices, close="close")
+    if output == COLUMNAR_FORMAT:
+        return columnar_response(
+            response, {"symbol": normalized_symbol, **frame_columns(prices, value="close")}
+        )
     return {
         "symbol": normalized_symbol,
-        "points": [{"timestamp_utc": p.timestamp_utc, "close": p.close} for p in points],
+        "points": frame_points(prices, close="close"),
     }
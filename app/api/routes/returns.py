@@ -1,28 +1,73 @@
-from fastapi import APIRouter, HTTPException, Query
+from typing import Annotated
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+
+from app.api.caching import conditional_get
+from app.api.export import (
+    JSON_MEDIA_TYPE,
+    STREAM_MEDIA_TYPES,
+    accepted_media_type,
+    blocks_stream_response,
+    frame_stream_response,
+)
+from app.api.params import (
+    COLUMNAR_FORMAT,
+    MAX_EXPORT_LIMIT,
+    TimeRange,
+    check_limit,
+    series_format,
+    time_range,
+)
+from app.api.serialization import columnar_response, frame_columns, frame_points
 from app.core.settings import get_normalized_data_dir
-from app.domain.analytics.returns import log_returns, simple_returns
+from app.domain.analytics.returns import (
+    log_returns_frame,
+    simple_returns_frame,
+    stream_log_returns,
+    stream_simple_returns,
+)
 from app.schemas.series import SeriesOut
 from app.services.market_data.reader import NormalizedCsvReader
 
 router = APIRouter()
 
+DEFAULT_LIMIT = 500
+
 
 @router.get("/assets/{symbol}/returns", response_model=SeriesOut)
 def get_returns(
     symbol: str,
+    request: Request,
+    response: Response,
+    period: Annotated[TimeRange, Depends(time_range)],
+    output: Annotated[str, Depends(series_format)],
+    media_type: Annotated[str, Depends(accepted_media_type)],
     timeframe: str = Query(default="1h", min_length=1),
     type: str = Query(default="log", pattern="^(log|simple)$"),
-    limit: int = Query(default=500, ge=2, le=5000),
+    limit: Annotated[int | None, Query(ge=2, le=MAX_EXPORT_LIMIT)] = None,
 ):
     normalized_symbol = symbol.strip().upper()
+    # Without a limit, CSV and NDJSON stream the whole range straight from the reader.
+    unbounded = limit is None and media_type in STREAM_MEDIA_TYPES
+    limit = limit if limit is not None else DEFAULT_LIMIT
+    check_limit(limit, media_type)
 
+    conditional_get(request, response, [normalized_symbol], timeframe)
     reader = NormalizedCsvReader(normalized_dir=get_normalized_data_dir())
     try:
-        points = reader.read_close_series(
+        if unbounded:
+            blocks = reader.iter_close_blocks(
+                normalized_symbol, timeframe, start=period.start, end=period.end
+            )
+            # Returns are computed block by block as the prices are read.
+            stream = stream_simple_returns if type == "simple" else stream_log_returns
+            return blocks_stream_response(response, media_type, stream(blocks), value="value")
+        prices = reader.read_close_frame(
             symbol=normalized_symbol,
             timeframe=timeframe,
             limit=limit,
+            start=period.start,
+            end=period.end,
         )
     except FileNotFoundError:
         raise HTTPException(
@@ -30,13 +75,18 @@ def get_returns(
             detail=f"Normalized data not found for {normalized_symbol} {timeframe}",
         ) from None
 
-    close_points = [(p.timestamp_utc, p.close) for p in points]
     if type == "simple":
-        ret_points = simple_returns(close_points)
+        returns = simple_returns_frame(prices)
     else:
-        ret_points = log_returns(close_points)
+        returns = log_returns_frame(prices)
 
+    if media_type != JSON_MEDIA_TYPE:
+        return frame_stream_response(response, media_type, returns, value="value")
+    if output == COLUMNAR_FORMAT:
+        return columnar_response(
+            response, {"symbol": normalized_symbol, **frame_columns(returns, value="value")}
+        )
     return {
         "symbol": normalized_symbol,
-        "points": [{"timestamp_utc": r.timestamp_utc, "value": r.value} for r in ret_points],
+        "points": frame_points(returns, value="value"),
     }
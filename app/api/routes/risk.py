@@ -1,17 +1,12 @@
+from collections.abc import Sequence
 from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
+from app.api.caching import conditional_get
+from app.api.params import TimeRange, time_range
 from app.core.settings import get_normalized_data_dir
-from app.domain.analytics.drawdown import drawdown_series
-from app.domain.analytics.returns import log_returns, simple_returns
-from app.domain.analytics.risk import (
-    downside_deviation,
-    mean,
-    sharpe_ratio,
-    sortino_ratio,
-    stddev,
-)
+from app.domain.analytics.risk import risk_summary
 from app.schemas.risk import RiskSummaryOut
 from app.services.market_data.reader import NormalizedCsvReader
 
@@ -21,6 +16,9 @@ router = APIRouter(tags=["risk"])
 @router.get("/assets/{symbol}/risk-summary", response_model=RiskSummaryOut)
 def get_risk_summary(
     symbol: str,
+    request: Request,
+    response: Response,
+    period: Annotated[TimeRange, Depends(time_range)],
     timeframe: Annotated[str, Query(min_length=1)] = "1d",
     type: Annotated[str, Query(pattern="^(log|simple)$")] = "log",
     limit: Annotated[int, Query(ge=2, le=5000)] = 365,
@@ -29,25 +27,22 @@ def get_risk_summary(
 ):
     normalized_symbol = symbol.strip().upper()
 
+    conditional_get(request, response, [normalized_symbol], timeframe)
     reader = NormalizedCsvReader(normalized_dir=get_normalized_data_dir())
     try:
-        points = reader.read_close_series(
-            symbol=normalized_symbol,
-            timeframe=timeframe,
-            limit=limit,
-        )
+        closes = _read_closes(reader, normalized_symbol, timeframe, limit, period)
     except FileNotFoundError:
         raise HTTPException(
             status_code=404,
             detail=f"Normalized data not found for {normalized_symbol} {timeframe}",
         ) from None
 
-    close_points = [(point.timestamp_utc, point.close) for point in points]
-    returns_points = simple_returns(close_points) if type == "simple" else log_returns(close_points)
-    returns_values = [point.value for point in returns_points]
-
-    drawdowns = drawdown_series(close_points)
-    max_drawdown = min((point.value for point in drawdowns), default=None)
+    summary = risk_summary(
+        closes,
+        return_type=type,
+        risk_free_rate=risk_free_rate,
+        downside_target=downside_target,
+    )
 
     return {
         "symbol": normalized_symbol,
@@ -56,21 +51,36 @@ def get_risk_summary(
         "return_type": type,
         "risk_free_rate": risk_free_rate,
         "downside_target": downside_target,
-        "observations": len(returns_values),
-        "mean_return": mean(returns_values),
-        "volatility": stddev(returns_values),
-        "downside_volatility": downside_deviation(
-            returns_values,
-            target=downside_target,
-        ),
-        "sharpe_ratio": sharpe_ratio(
-            returns_values,
-            risk_free_rate=risk_free_rate,
-        ),
-        "sortino_ratio": sortino_ratio(
-            returns_values,
-            risk_free_rate=risk_free_rate,
-            target=downside_target,
-        ),
-        "max_drawdown": max_drawdown,
+        "observations": summary.observations,
+        "mean_return": summary.mean_return,
+        "volatility": summary.volatility,
+        "downside_volatility": summary.downside_volatility,
+        "sharpe_ratio": summary.sharpe_ratio,
+        "sortino_ratio": summary.sortino_ratio,
+        "max_drawdown": summary.max_drawdown,
     }
+
+
+def _read_closes(
+    reader: NormalizedCsvReader,
+    symbol: str,
+    timeframe: str,
+    limit: int,
+    period: TimeRange,
+) -> Sequence[float]:
+    # The persisted analytics state holds the newest closes, so an unbounded request for
+    # the latest rows is answered without reading the series.
+    if period.start is None and period.end is None:
+        state = reader.read_series_state(symbol, timeframe)
+        closes = state.tail(limit) if state is not None else None
+        if closes is not None:
+            return closes
+
+    prices = reader.read_close_frame(
+        symbol=symbol,
+        timeframe=timeframe,
+        limit=limit,
+        start=period.start,
+        end=period.end,
+    )
+    return prices.column("close")
@@ -0,0 +1,122 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+
+from app.api.caching import conditional_get
+from app.api.compute import run_compute
+from app.api.loaders import read_close_frames
+from app.api.params import TimeRange, join_policy, parse_windows, time_range
+from app.api.serialization import frame_points
+from app.domain.analytics.alignment import JoinPolicy
+from app.domain.analytics.frame import SeriesFrame
+from app.domain.analytics.returns import aligned_log_returns
+from app.domain.analytics.rolling import rolling_comoments_frame
+from app.schemas.rolling import RollingBetaOut, RollingCorrelationOut
+
+router = APIRouter(tags=["rolling"])
+
+DEFAULT_WINDOW = 60
+
+
+# Runs in a compute worker process when one is configured, so it takes and returns only
+# picklable values.
+def _rolling_windows(
+    prices_by_symbol: dict[str, SeriesFrame],
+    policy: JoinPolicy,
+    x_symbol: str,
+    y_symbol: str,
+    windows: list[int],
+    column: str,
+) -> tuple[int, list[dict[str, object]]]:
+    aligned = aligned_log_returns(prices_by_symbol, policy=policy)
+    if len(aligned) < 2:
+        raise ValueError("Not enough overlapping observations to compute rolling statistics")
+
+    # Each window is one linear pass of the co-moment engine over the same aligned returns.
+    series = [
+        {
+            "window": window,
+            "points": frame_points(
+                rolling_comoments_frame(aligned, x_symbol, y_symbol, window),
+                value=column,
+            ),
+        }
+        for window in windows
+    ]
+    return len(aligned), series
+
+
+@router.get("/analytics/rolling-correlation", response_model=RollingCorrelationOut)
+def get_rolling_correlation(
+    request: Request,
+    response: Response,
+    symbols: Annotated[list[str], Query(min_length=2, max_length=2)],
+    period: Annotated[TimeRange, Depends(time_range)],
+    policy: Annotated[JoinPolicy, Depends(join_policy)],
+    timeframe: Annotated[str, Query(min_length=1)] = "1d",
+    limit: Annotated[int, Query(ge=2, le=5000)] = 365,
+    window: Annotated[list[int] | None, Query()] = None,
+):
+    normalized_symbols = [symbol.strip().upper() for symbol in symbols if symbol.strip() != ""]
+    deduped_symbols = list(dict.fromkeys(normalized_symbols))
+    if len(deduped_symbols) != 2:
+        raise HTTPException(status_code=422, detail="Exactly two unique symbols are required")
+    windows = parse_windows(window, default=DEFAULT_WINDOW)
+
+    conditional_get(request, response, deduped_symbols, timeframe)
+    prices_by_symbol = read_close_frames(deduped_symbols, timeframe, limit, period)
+    first, second = deduped_symbols
+    observations, series = run_compute(
+        _rolling_windows, prices_by_symbol, policy, first, second, windows, "correlation"
+    )
+
+    return {
+        "symbols": deduped_symbols,
+        "timeframe": timeframe,
+        "limit": limit,
+        "observations": observations,
+        "windows": series,
+    }
+
+
+@router.get("/analytics/rolling-beta", response_model=RollingBetaOut)
+def get_rolling_beta(
+    request: Request,
+    response: Response,
+    symbol: Annotated[str, Query(min_length=1)],
+    benchmark: Annotated[str, Query(min_length=1)],
+    period: Annotated[TimeRange, Depends(time_range)],
+    policy: Annotated[JoinPolicy, Depends(join_policy)],
+    timeframe: Annotated[str, Query(min_length=1)] = "1d",
+    limit: Annotated[int, Query(ge=2, le=5000)] = 365,
+    window: Annotated[list[int] | None, Query()] = None,
+):
+    normalized_symbol = symbol.strip().upper()
+    normalized_benchmark = benchmark.strip().upper()
+    if normalized_symbol == normalized_benchmark:
+        raise HTTPException(status_code=422, detail="symbol and benchmark must differ")
+    windows = parse_windows(window, default=DEFAULT_WINDOW)
+
+    conditional_get(request, response, [normalized_symbol, normalized_benchmark], timeframe)
+    prices_by_symbol = read_close_frames(
+        [normalized_symbol, normalized_benchmark], timeframe, limit, period
+    )
+    # Beta of the asset's returns on the benchmark's: cov(benchmark, asset) / var(benchmark).
+    observations, series = run_compute(
+        _rolling_windows,
+        prices_by_symbol,
+        policy,
+        normalized_benchmark,
+        normalized_symbol,
+        windows,
+        "beta",
+    )
+
+    return {
+        "symbol": normalized_symbol,
+        "benchmark": normalized_benchmark,
+        "timeframe": timeframe,
+        "limit": limit,
+        "observations": observations,
+        "windows": series,
+    }
@@ -1,29 +1,50 @@
-from fastapi import APIRouter, HTTPException, Query
+from typing import Annotated
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+
+from app.api.caching import conditional_get
+from app.api.params import (
+    COLUMNAR_FORMAT,
+    TimeRange,
+    parse_windows,
+    series_format,
+    time_range,
+)
+from app.api.serialization import columnar_response, frame_columns, frame_points
 from app.core.settings import get_normalized_data_dir
-from app.domain.analytics.returns import log_returns
-from app.domain.analytics.volatility import rolling_std
-from app.schemas.series import SeriesOut
+from app.domain.analytics.returns import log_returns_frame
+from app.domain.analytics.volatility import rolling_std_frames
+from app.schemas.series import VolatilityOut
 from app.services.market_data.reader import NormalizedCsvReader
 
 router = APIRouter()
 
+DEFAULT_WINDOW = 24
+
 
-@router.get("/assets/{symbol}/volatility", response_model=SeriesOut)
+@router.get("/assets/{symbol}/volatility", response_model=VolatilityOut)
 def get_volatility(
     symbol: str,
+    request: Request,
+    response: Response,
+    period: Annotated[TimeRange, Depends(time_range)],
+    output: Annotated[str, Depends(series_format)],
     timeframe: str = Query(default="1h", min_length=1),
-    window: int = Query(default=24, ge=2, le=1000),
+    window: Annotated[list[int] | None, Query()] = None,
     limit: int = Query(default=500, ge=2, le=5000),
 ):
     normalized_symbol = symbol.strip().upper()
+    windows = parse_windows(window, default=DEFAULT_WINDOW)
 
+    conditional_get(request, response, [normalized_symbol], timeframe)
     reader = NormalizedCsvReader(normalized_dir=get_normalized_data_dir())
     try:
-        points = reader.read_close_series(
+        prices = reader.read_close_frame(
             symbol=normalized_symbol,
             timeframe=timeframe,
             limit=limit,
+            start=period.start,
+            end=period.end,
         )
     except FileNotFoundError:
         raise HTTPException(
@@ -31,12 +52,26 @@ def get_volatility(
             detail=f"Normalized data not found for {normalized_symbol} {timeframe}",
         ) from None
 
-    close_points = [(p.timestamp_utc, p.close) for p in points]
-    returns_points = log_returns(close_points)
-    values = [(r.timestamp_utc, r.value) for r in returns_points]
-    vol_points = rolling_std(values=values, window=window)
+    returns = log_returns_frame(prices)
+    # One read and one returns pass feed every requested window.
+    volatility = rolling_std_frames(returns, windows=windows)
+
+    if output == COLUMNAR_FORMAT:
+        content = {
+            "symbol": normalized_symbol,
+            **frame_columns(volatility[0], value="value"),
+            "windows": [
+                {"window": w, **frame_columns(frame, value="value")}
+                for w, frame in zip(windows, volatility, strict=True)
+            ],
+        }
+        return columnar_response(response, content)
 
     return {
         "symbol": normalized_symbol,
-        "points": [{"timestamp_utc": v.timestamp_utc, "value": v.value} for v in vol_points],
+        "points": frame_points(volatility[0], value="value"),
+        "windows": [
+            {"window": w, "points": frame_points(frame, value="value")}
+            for w, frame in zip(windows, volatility, strict=True)
+        ],
     }
@@ -0,0 +1,43 @@
+import math
+from collections.abc import Sequence
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+from app.domain.analytics.frame import SeriesFrame, epoch_to_datetime
+
+
+def frame_points(frame: SeriesFrame, **fields: str) -> list[dict[str, Any]]:
+    # `fields` maps response field names to frame columns, e.g. close="close" or value="value".
+    names = list(fields)
+    columns = [frame.column(fields[name]) for name in names]
+    return [
+        {"timestamp_utc": epoch_to_datetime(ts), **dict(zip(names, row, strict=True))}
+        for ts, *row in zip(frame.timestamps, *columns, strict=True)
+    ]
+
+
+def frame_columns(frame: SeriesFrame, value: str, **fields: str) -> dict[str, list[Any]]:
+    # Columnar form of frame_points: epoch-second `timestamps`, the `value` column as `values`
+    # and any further `fields` as parallel arrays, copied straight from the frame's buffers.
+    columns = {
+        "timestamps": frame.timestamps.tolist(),
+        "values": _json_floats(frame.column(value)),
+    }
+    for name, column in fields.items():
+        columns[name] = _json_floats(frame.column(column))
+    return columns
+
+
+def columnar_response(response: Response, content: dict[str, Any]) -> JSONResponse:
+    # Skips response_model validation; headers set on the injected response (ETag) are kept.
+    return JSONResponse(content, headers=dict(response.headers))
+
+
+def _json_floats(column: Sequence[float]) -> list[float | None]:
+    values = column.tolist() if isinstance(column, memoryview) else list(column)
+    # JSON has no NaN or infinity; like the point models, they are written as null.
+    if all(map(math.isfinite, values)):
+        return values
+    return [value if math.isfinite(value) else None for value in values]
@@ -0,0 +1,106 @@
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from app.core.settings import (
+    get_compute_executor,
+    get_compute_max_pending,
+    get_compute_timeout_seconds,
+    get_compute_workers,
+)
+from app.domain.analytics.backend import get_backend, set_backend
+
+INLINE_EXECUTOR = "inline"
+PROCESS_EXECUTOR = "process"
+
+
+class ComputeBusyError(RuntimeError):
+    pass
+
+
+class ComputeTimeoutError(TimeoutError):
+    pass
+
+
+# Runs CPU-heavy analytics. Inline, a task runs on the calling (request) thread. With the
+# process executor, it runs in a worker process so it does not hold this process' GIL.
+# At most `max_pending` tasks may be queued or running; beyond that a task is rejected
+# instead of waiting.
+class ComputeExecutor:
+    def __init__(
+        self,
+        mode: str,
+        workers: int,
+        max_pending: int,
+        timeout_seconds: float,
+    ) -> None:
+        if mode not in (INLINE_EXECUTOR, PROCESS_EXECUTOR):
+            raise ValueError(f"unknown compute executor: {mode}")
+
+        self._pool: ProcessPoolExecutor | None = None
+        if mode == PROCESS_EXECUTOR:
+            # Spawned rather than forked (the server runs threads); workers use the same
+            # analytics backend as this process.
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=set_backend,
+                initargs=(get_backend(),),
+            )
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._timeout = timeout_seconds
+
+    def run[T](self, fn: Callable[..., T], /, *args: object) -> T:
+        if self._pool is None:
+            return fn(*args)
+
+        if not self._slots.acquire(blocking=False):
+            raise ComputeBusyError("compute queue is full")
+        try:
+            future: Future[T] = self._pool.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # A slot is held until the task really finishes: a task that timed out keeps its
+        # worker busy, so it still counts against the queue.
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            return future.result(timeout=self._timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise ComputeTimeoutError(
+                f"computation did not finish within {self._timeout:g}s"
+            ) from None
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+_shared_executor: ComputeExecutor | None = None
+_shared_executor_lock = threading.Lock()
+
+
+def get_compute() -> ComputeExecutor:
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            _shared_executor = ComputeExecutor(
+                mode=get_compute_executor(),
+                workers=get_compute_workers(),
+                max_pending=get_compute_max_pending(),
+                timeout_seconds=get_compute_timeout_seconds(),
+            )
+        return _shared_executor
+
+
+def shutdown_compute() -> None:
+    # Stops the shared pool, if one was started; a later get_compute() starts a new one.
+    global _shared_executor
+    with _shared_executor_lock:
+        executor, _shared_executor = _shared_executor, None
+    if executor is not None:
+        executor.shutdown()
@@ -1,7 +1,74 @@
 import os
 from pathlib import Path
 
+DEFAULT_SERIES_CACHE_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_READ_WORKERS = 8
+DEFAULT_COMPUTE_TIMEOUT_SECONDS = 30.0
+DEFAULT_WARMUP_MAX_BYTES = 64 * 1024 * 1024
+
 
 def get_normalized_data_dir() -> Path:
     value = os.getenv("NORMALIZED_DATA_DIR", "data/normalized")
     return Path(value)
+
+
+def get_series_cache_max_bytes() -> int:
+    value = os.getenv("SERIES_CACHE_MAX_BYTES", str(DEFAULT_SERIES_CACHE_MAX_BYTES))
+    return int(value)
+
+
+def get_analytics_backend() -> str:
+    return os.getenv("ANALYTICS_BACKEND", "python").strip().lower()
+
+
+def get_read_workers() -> int:
+    value = os.getenv("READ_WORKERS", str(DEFAULT_READ_WORKERS))
+    return max(1, int(value))
+
+
+def get_read_processes() -> int:
+    # Worker processes for parsing large CSV files; 0 parses in the calling thread.
+    value = os.getenv("READ_PROCESSES", "0")
+    return max(0, int(value))
+
+
+def get_compute_executor() -> str:
+    return os.getenv("COMPUTE_EXECUTOR", "inline").strip().lower()
+
+
+def get_compute_workers() -> int:
+    value = os.getenv("COMPUTE_WORKERS", str(os.cpu_count() or 1))
+    return max(1, int(value))
+
+
+def get_compute_max_pending() -> int:
+    # Tasks queued or running in the compute pool before new ones are rejected.
+    value = os.getenv("COMPUTE_MAX_PENDING", str(4 * get_compute_workers()))
+    return max(1, int(value))
+
+
+def get_compute_timeout_seconds() -> float:
+    value = os.getenv("COMPUTE_TIMEOUT_SECONDS", str(DEFAULT_COMPUTE_TIMEOUT_SECONDS))
+    return float(value)
+
+
+def get_shared_series_store_enabled() -> bool:
+    # Build series sidecars on first read and share them between server processes.
+    return os.getenv("SHARED_SERIES_STORE", "0").strip().lower() in ("1", "true", "yes")
+
+
+def get_warmup_series() -> str:
+    # Comma-separated `<SYMBOL>_<TIMEFRAME>` names, or "auto" for the most-read series;
+    # empty disables the startup warm-up.
+    return os.getenv("WARMUP_SERIES", "").strip()
+
+
+def get_warmup_max_bytes() -> int:
+    value = os.getenv("WARMUP_MAX_BYTES", str(DEFAULT_WARMUP_MAX_BYTES))
+    return max(0, int(value))
+
+
+def get_cache_max_age_seconds() -> int:
+    # Cache-Control max-age of series responses; 0 makes caches revalidate every time.
+    value = os.getenv("CACHE_MAX_AGE_SECONDS", "0")
+    return max(0, int(value))
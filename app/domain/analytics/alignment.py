@@ -0,0 +1,140 @@
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+
+from app.domain.analytics.frame import SeriesFrame
+
+
+@dataclass(frozen=True)
+class InnerJoin:
+    pass
+
+
+# Keeps every timestamp seen by any series and carries each series' last value forward, as
+# long as that value is at most `max_gap_seconds` old (no limit when None).
+@dataclass(frozen=True)
+class ForwardFillJoin:
+    max_gap_seconds: int | None = None
+
+
+# Keeps every timestamp seen by any series; a series without a row there gets NaN.
+@dataclass(frozen=True)
+class OuterJoin:
+    pass
+
+
+JoinPolicy = InnerJoin | ForwardFillJoin | OuterJoin
+
+INNER_JOIN = InnerJoin()
+
+_NAN = float("nan")
+
+
+def align_frames(
+    frames: dict[str, SeriesFrame],
+    column: str = "value",
+    policy: JoinPolicy = INNER_JOIN,
+) -> SeriesFrame:
+    # Frames are sorted by timestamp, so alignment is a k-way merge over their timestamp
+    # buffers. For duplicate timestamps the last row wins. The result has one column per key.
+    symbols = list(frames)
+    if not symbols:
+        return SeriesFrame.empty()
+
+    timestamps = [frames[symbol].timestamps for symbol in symbols]
+    if isinstance(policy, ForwardFillJoin):
+        shared, positions = _forward_fill_positions(timestamps, policy.max_gap_seconds)
+    elif isinstance(policy, OuterJoin):
+        shared, positions = _outer_positions(timestamps)
+    else:
+        shared, positions = _inner_positions(timestamps)
+
+    columns: dict[str, memoryview] = {}
+    for symbol, rows in zip(symbols, positions, strict=True):
+        values = frames[symbol].column(column)
+        columns[symbol] = memoryview(array("d", (values[i] if i >= 0 else _NAN for i in rows)))
+    return SeriesFrame(timestamps=memoryview(shared), columns=columns)
+
+
+def _inner_positions(timestamps: list[memoryview]) -> tuple[array, list[array]]:
+    shared = array("q")
+    positions = [array("q") for _ in timestamps]
+    if any(len(series) == 0 for series in timestamps):
+        return shared, positions
+
+    cursors = [0] * len(timestamps)
+    target = max(series[0] for series in timestamps)
+    while True:
+        # Gallop every cursor to the candidate timestamp; a miss raises the candidate.
+        for i, series in enumerate(timestamps):
+            cursor = bisect_left(series, target, cursors[i])
+            if cursor == len(series):
+                return shared, positions
+            cursors[i] = cursor
+            if series[cursor] != target:
+                target = series[cursor]
+                break
+        else:
+            shared.append(target)
+            for i, series in enumerate(timestamps):
+                cursors[i] = bisect_right(series, target, cursors[i])
+                positions[i].append(cursors[i] - 1)
+            if any(cursors[i] == len(series) for i, series in enumerate(timestamps)):
+                return shared, positions
+            target = max(series[cursors[i]] for i, series in enumerate(timestamps))
+
+
+def _forward_fill_positions(
+    timestamps: list[memoryview],
+    max_gap_seconds: int | None,
+) -> tuple[array, list[array]]:
+    shared = array("q")
+    positions = [array("q") for _ in timestamps]
+    cursors = [0] * len(timestamps)
+    previous: int | None = None
+    for ts in heapq.merge(*timestamps):
+        if ts == previous:
+            continue
+        previous = ts
+
+        rows: list[int] = []
+        for i, series in enumerate(timestamps):
+            cursor = cursors[i]
+            while cursor < len(series) and series[cursor] <= ts:
+                cursor += 1
+            cursors[i] = cursor
+            if cursor == 0:
+                break
+            if max_gap_seconds is not None and ts - series[cursor - 1] > max_gap_seconds:
+                break
+            rows.append(cursor - 1)
+        else:
+            shared.append(ts)
+            for row_positions, row in zip(positions, rows, strict=True):
+                row_positions.append(row)
+
+    return shared, positions
+
+
+def _outer_positions(timestamps: list[memoryview]) -> tuple[array, list[array]]:
+    shared = array("q")
+    positions = [array("q") for _ in timestamps]
+    cursors = [0] * len(timestamps)
+    previous: int | None = None
+    for ts in heapq.merge(*timestamps):
+        if ts == previous:
+            continue
+        previous = ts
+
+        shared.append(ts)
+        for i, series in enumerate(timestamps):
+            cursor = cursors[i]
+            if cursor < len(series) and series[cursor] == ts:
+                cursor = bisect_right(series, ts, cursor)
+                cursors[i] = cursor
+                positions[i].append(cursor - 1)
+            else:
+                positions[i].append(-1)
+
+    return shared, positions
@@ -0,0 +1,30 @@
+from types import ModuleType
+
+PYTHON_BACKEND = "python"
+NUMPY_BACKEND = "numpy"
+
+_numpy_kernels: ModuleType | None = None
+
+
+def set_backend(name: str) -> None:
+    global _numpy_kernels
+    if name == PYTHON_BACKEND:
+        _numpy_kernels = None
+        return
+    if name != NUMPY_BACKEND:
+        raise ValueError(f"unknown analytics backend: {name}")
+
+    # NumPy is optional and only imported once its backend is selected.
+    try:
+        from app.domain.analytics import numpy_kernels
+    except ImportError as error:
+        raise RuntimeError("the numpy analytics backend requires numpy to be installed") from error
+    _numpy_kernels = numpy_kernels
+
+
+def get_backend() -> str:
+    return PYTHON_BACKEND if _numpy_kernels is None else NUMPY_BACKEND
+
+
+def numpy_kernels() -> ModuleType | None:
+    return _numpy_kernels
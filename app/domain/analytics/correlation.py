@@ -1,39 +1,28 @@
 import math
-from collections import defaultdict
+import operator
+from collections.abc import Sequence
 from dataclasses import dataclass
-from datetime import datetime
+
+from app.domain.analytics.backend import numpy_kernels
 
 
 @dataclass(frozen=True)
 class CorrelationRow:
     symbol: str
-    values: list[float]
-
-
-def align_series(
-    series_by_symbol: dict[str, list[tuple[datetime, float]]],
-) -> dict[str, list[float]]:
-    values_by_timestamp: dict[datetime, dict[str, float]] = defaultdict(dict)
-    for symbol, points in series_by_symbol.items():
-        for timestamp_utc, value in points:
-            values_by_timestamp[timestamp_utc][symbol] = value
+    values: list[float | None]
 
-    aligned_timestamps = sorted(
-        timestamp
-        for timestamp, values in values_by_timestamp.items()
-        if len(values) == len(series_by_symbol)
-    )
 
-    aligned: dict[str, list[float]] = {symbol: [] for symbol in series_by_symbol}
-    for timestamp in aligned_timestamps:
-        row = values_by_timestamp[timestamp]
-        for symbol in series_by_symbol:
-            aligned[symbol].append(row[symbol])
+@dataclass(frozen=True)
+class ObservationRow:
+    symbol: str
+    values: list[int]
 
-    return aligned
 
+def pearson_correlation(left: Sequence[float], right: Sequence[float]) -> float:
+    kernels = numpy_kernels()
+    if kernels is not None:
+        return kernels.pearson_correlation(left, right)
 
-def pearson_correlation(left: list[float], right: list[float]) -> float:
     if len(left) != len(right) or len(left) < 2:
         raise ValueError("correlation requires at least two aligned values")
 
@@ -56,23 +45,151 @@ def pearson_correlation(left: list[float], right: list[float]) -> float:
     return numerator / math.sqrt(left_var * right_var)
 
 
-def correlation_matrix(
+# Sums of products of deviations from the mean for every pair of aligned series: the
+# diagonal holds each series' sum of squared deviations. Correlation and covariance are both
+# read off this one matrix.
+@dataclass(frozen=True)
+class ComomentMatrix:
+    symbols: list[str]
+    observations: int
+    comoments: list[list[float]]
+
+    def correlation_rows(self) -> list[CorrelationRow]:
+        scale = [math.sqrt(self.comoments[i][i]) for i in range(len(self.symbols))]
+        rows: list[CorrelationRow] = []
+        for i, symbol in enumerate(self.symbols):
+            values: list[float] = []
+            for j in range(len(self.symbols)):
+                if i == j:
+                    values.append(1.0)
+                elif scale[i] == 0.0 or scale[j] == 0.0:
+                    values.append(0.0)
+                else:
+                    values.append(self.comoments[i][j] / (scale[i] * scale[j]))
+            rows.append(CorrelationRow(symbol=symbol, values=values))
+        return rows
+
+    def covariance_rows(self) -> list[CorrelationRow]:
+        # Population covariance, like the variance used throughout the risk metrics.
+        return [
+            CorrelationRow(symbol=symbol, values=[value / self.observations for value in row])
+            for symbol, row in zip(self.symbols, self.comoments, strict=True)
+        ]
+
+
+def comoment_matrix(
     symbols: list[str],
-    aligned_returns: dict[str, list[float]],
-) -> list[CorrelationRow]:
-    rows: list[CorrelationRow] = []
-    for row_symbol in symbols:
-        values: list[float] = []
-        for col_symbol in symbols:
-            if row_symbol == col_symbol:
-                values.append(1.0)
-                continue
+    aligned_returns: dict[str, Sequence[float]],
+) -> ComomentMatrix:
+    observations = len(aligned_returns[symbols[0]]) if symbols else 0
+    if observations < 2:
+        raise ValueError("correlation requires at least two aligned values")
 
-            values.append(
-                pearson_correlation(
-                    aligned_returns[row_symbol],
-                    aligned_returns[col_symbol],
-                )
+    kernels = numpy_kernels()
+    if kernels is not None:
+        comoments = kernels.comoment_matrix([aligned_returns[symbol] for symbol in symbols])
+        return ComomentMatrix(symbols=symbols, observations=observations, comoments=comoments)
+
+    # Each series is centred once; every unordered pair is then a single dot product.
+    deviations: list[list[float]] = []
+    for symbol in symbols:
+        values = aligned_returns[symbol]
+        if len(values) != observations:
+            raise ValueError("aligned series must have equal lengths")
+        avg = sum(values) / observations
+        deviations.append([value - avg for value in values])
+
+    size = len(symbols)
+    comoments = [[0.0] * size for _ in range(size)]
+    for i in range(size):
+        for j in range(i, size):
+            value = sum(map(operator.mul, deviations[i], deviations[j]))
+            comoments[i][j] = value
+            comoments[j][i] = value
+
+    return ComomentMatrix(symbols=symbols, observations=observations, comoments=comoments)
+
+
+# Pairwise-complete co-moments: each pair is centred and summed over its own overlap, so
+# `squares[i][j]` is the sum of squared deviations of series i over the rows it shares with j.
+@dataclass(frozen=True)
+class PairwiseComoments:
+    symbols: list[str]
+    observations: list[list[int]]
+    comoments: list[list[float]]
+    squares: list[list[float]]
+
+    def correlation_rows(self) -> list[CorrelationRow]:
+        rows: list[CorrelationRow] = []
+        for i, symbol in enumerate(self.symbols):
+            values: list[float | None] = []
+            for j in range(len(self.symbols)):
+                if i == j:
+                    values.append(1.0)
+                elif self.observations[i][j] < 2:
+                    values.append(None)
+                elif self.squares[i][j] == 0.0 or self.squares[j][i] == 0.0:
+                    values.append(0.0)
+                else:
+                    scale = math.sqrt(self.squares[i][j] * self.squares[j][i])
+                    values.append(self.comoments[i][j] / scale)
+            rows.append(CorrelationRow(symbol=symbol, values=values))
+        return rows
+
+    def covariance_rows(self) -> list[CorrelationRow]:
+        return [
+            CorrelationRow(
+                symbol=symbol,
+                values=[
+                    value / count if count > 0 else None
+                    for value, count in zip(row, counts, strict=True)
+                ],
             )
-        rows.append(CorrelationRow(symbol=row_symbol, values=values))
-    return rows
+            for symbol, row, counts in zip(
+                self.symbols, self.comoments, self.observations, strict=True
+            )
+        ]
+
+    def observation_rows(self) -> list[ObservationRow]:
+        return [
+            ObservationRow(symbol=symbol, values=list(counts))
+            for symbol, counts in zip(self.symbols, self.observations, strict=True)
+        ]
+
+
+def pairwise_comoments(
+    symbols: list[str],
+    outer_returns: dict[str, Sequence[float]],
+) -> PairwiseComoments:
+    # `outer_returns` holds outer-joined columns where NaN marks a missing row.
+    kernels = numpy_kernels()
+    if kernels is not None:
+        observations, comoments, squares = kernels.pairwise_comoments(
+            [outer_returns[symbol] for symbol in symbols]
+        )
+        return PairwiseComoments(symbols, observations, comoments, squares)
+
+    size = len(symbols)
+    observations = [[0] * size for _ in range(size)]
+    comoments = [[0.0] * size for _ in range(size)]
+    squares = [[0.0] * size for _ in range(size)]
+    columns = [outer_returns[symbol] for symbol in symbols]
+    for i in range(size):
+        for j in range(i, size):
+            pairs = [
+                (x, y) for x, y in zip(columns[i], columns[j], strict=True) if x == x and y == y
+            ]
+            count = len(pairs)
+            observations[i][j] = observations[j][i] = count
+            if count == 0:
+                continue
+
+            mean_x = sum(x for x, _ in pairs) / count
+            mean_y = sum(y for _, y in pairs) / count
+            dx = [x - mean_x for x, _ in pairs]
+            dy = [y - mean_y for _, y in pairs]
+            comoments[i][j] = comoments[j][i] = sum(map(operator.mul, dx, dy))
+            squares[i][j] = sum(map(operator.mul, dx, dx))
+            squares[j][i] = sum(map(operator.mul, dy, dy))
+
+    return PairwiseComoments(symbols, observations, comoments, squares)
@@ -0,0 +1,149 @@
+from collections.abc import Sequence
+from itertools import pairwise
+
+from app.domain.analytics.drawdown import drawdown_trough
+from app.domain.analytics.frame import SeriesFrame
+
+LTTB = "lttb"
+MIN_MAX = "minmax"
+
+
+def downsample_frame(
+    frame: SeriesFrame,
+    max_points: int,
+    method: str = LTTB,
+    columns: Sequence[str] | None = None,
+) -> SeriesFrame:
+    # At most `max_points` rows of `frame` chosen for charting `columns` (all by default), in
+    # linear time. The first and last rows, each column's minimum and maximum and the peak and
+    # trough of its maximum drawdown are always kept; the rows between them are picked by
+    # Largest-Triangle-Three-Buckets or by per-bucket minimum and maximum.
+    if method not in (LTTB, MIN_MAX):
+        raise ValueError(f"Unknown downsampling method: {method}")
+    if max_points < 2:
+        raise ValueError("max_points must be at least 2")
+    if len(frame) <= max_points:
+        return frame
+
+    names = list(frame.columns) if columns is None else list(columns)
+    # The first and last rows are shared, so every column gets an equal share of the rest.
+    budget = (max_points - 2) // max(1, len(names))
+    selected = {0, len(frame) - 1}
+    for name in names:
+        selected.update(downsample_indices(frame.timestamps, frame.column(name), budget, method))
+    return frame.take(sorted(selected))
+
+
+def downsample_indices(
+    timestamps: Sequence[int],
+    values: Sequence[float],
+    budget: int,
+    method: str = LTTB,
+) -> list[int]:
+    # Sorted indices of the first and last points plus at most `budget` points between them.
+    n = len(values)
+    if n <= budget + 2:
+        return list(range(n))
+
+    anchors = {0, n - 1}
+    for i in _extremes(values):
+        if len(anchors) - 2 >= budget:
+            break
+        anchors.add(i)
+    ordered = sorted(anchors)
+    budgets = _split_budget(ordered, budget - (len(ordered) - 2))
+
+    indices = [ordered[0]]
+    for (left, right), count in zip(pairwise(ordered), budgets, strict=True):
+        if method == MIN_MAX and count >= 2:
+            indices.extend(_min_max(values, left, right, count))
+        else:
+            indices.extend(_lttb(timestamps, values, left, right, count))
+        indices.append(right)
+    return indices
+
+
+def _extremes(values: Sequence[float]) -> list[int]:
+    # Points a chart must not lose, most important first.
+    lowest = min(range(len(values)), key=values.__getitem__)
+    highest = max(range(len(values)), key=values.__getitem__)
+    extremes = [lowest, highest]
+    trough = drawdown_trough(values)
+    if trough is not None:
+        extremes.extend(reversed(trough))
+    return extremes
+
+
+def _split_budget(anchors: list[int], budget: int) -> list[int]:
+    # The budget shared between the gaps of consecutive anchors in proportion to their size.
+    gaps = [right - left - 1 for left, right in pairwise(anchors)]
+    total = sum(gaps)
+    if total <= budget:
+        return gaps
+
+    shares = [budget * gap // total for gap in gaps]
+    spare = budget - sum(shares)
+    for i, gap in enumerate(gaps):
+        if spare == 0:
+            break
+        if shares[i] < gap:
+            shares[i] += 1
+            spare -= 1
+    return shares
+
+
+def _lttb(
+    timestamps: Sequence[int],
+    values: Sequence[float],
+    left: int,
+    right: int,
+    count: int,
+) -> list[int]:
+    # One point per bucket of the rows strictly between `left` and `right`: the one spanning the
+    # largest triangle with the point kept before it and the average of the next bucket.
+    size = right - left - 1
+    if count >= size:
+        return list(range(left + 1, right))
+    if count == 0:
+        return []
+
+    bounds = [left + 1 + size * j // count for j in range(count + 1)]
+    chosen: list[int] = []
+    previous = left
+    for j in range(count):
+        if j + 1 < count:
+            lo, hi = bounds[j + 1], bounds[j + 2]
+            next_x = sum(timestamps[lo:hi]) / (hi - lo)
+            next_y = sum(values[lo:hi]) / (hi - lo)
+        else:
+            next_x, next_y = timestamps[right], values[right]
+
+        prev_x, prev_y = timestamps[previous], values[previous]
+        best = bounds[j]
+        best_area = -1.0
+        for i in range(bounds[j], bounds[j + 1]):
+            area = abs(
+                (prev_x - next_x) * (values[i] - prev_y)
+                - (prev_x - timestamps[i]) * (next_y - prev_y)
+            )
+            if area > best_area:
+                best, best_area = i, area
+        chosen.append(best)
+        previous = best
+    return chosen
+
+
+def _min_max(values: Sequence[float], left: int, right: int, count: int) -> list[int]:
+    # The lowest and highest point of each of count // 2 buckets, in time order.
+    size = right - left - 1
+    if count >= size:
+        return list(range(left + 1, right))
+
+    buckets = count // 2
+    bounds = [left + 1 + size * j // buckets for j in range(buckets + 1)]
+    chosen: list[int] = []
+    for lo, hi in pairwise(bounds):
+        lowest = min(range(lo, hi), key=values.__getitem__)
+        highest = max(range(lo, hi), key=values.__getitem__)
+        chosen.extend(sorted({lowest, highest}))
+    return chosen
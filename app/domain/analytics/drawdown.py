@@ -1,7 +1,11 @@
-from collections.abc import Iterable
+from array import array
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 
+from app.domain.analytics.backend import numpy_kernels
+from app.domain.analytics.frame import SeriesFrame
+
 
 @dataclass(frozen=True)
 class DrawdownPoint:
@@ -10,15 +14,18 @@ class DrawdownPoint:
     peak_close: float
 
 
-def drawdown_series(close_points: Iterable[tuple[datetime, float]]) -> list[DrawdownPoint]:
-    points = list(close_points)
-    if len(points) == 0:
-        return []
+def drawdown_values(closes: Sequence[float]) -> tuple[array, array]:
+    kernels = numpy_kernels()
+    if kernels is not None:
+        return kernels.drawdown_values(closes)
 
-    result: list[DrawdownPoint] = []
-    peak = points[0][1]
+    drawdowns = array("d")
+    peaks = array("d")
+    if len(closes) == 0:
+        return drawdowns, peaks
 
-    for ts, close in points:
+    peak = closes[0]
+    for close in closes:
         if close > peak:
             peak = close
 
@@ -27,6 +34,64 @@ def drawdown_series(close_points: Iterable[tuple[datetime, float]]) -> list[Draw
         else:
             dd = (close / peak) - 1.0
 
-        result.append(DrawdownPoint(timestamp_utc=ts, value=dd, peak_close=peak))
+        drawdowns.append(dd)
+        peaks.append(peak)
+
+    return drawdowns, peaks
+
+
+def max_drawdown(closes: Sequence[float]) -> float | None:
+    kernels = numpy_kernels()
+    if kernels is not None:
+        return kernels.max_drawdown(closes)
+
+    if len(closes) == 0:
+        return None
+
+    peak = closes[0]
+    worst = 0.0
+    for close in closes:
+        if close > peak:
+            peak = close
+        if peak > 0:
+            dd = (close / peak) - 1.0
+            if dd < worst:
+                worst = dd
+    return worst
+
+
+def drawdown_trough(closes: Sequence[float]) -> tuple[int, int] | None:
+    # Indices of the peak and the trough of the maximum drawdown; None without a drawdown.
+    if len(closes) == 0:
+        return None
+
+    peak_index = 0
+    worst = 0.0
+    span: tuple[int, int] | None = None
+    for i, close in enumerate(closes):
+        if close > closes[peak_index]:
+            peak_index = i
+        peak = closes[peak_index]
+        if peak > 0:
+            dd = (close / peak) - 1.0
+            if dd < worst:
+                worst = dd
+                span = (peak_index, i)
+    return span
+
+
+def drawdown_frame(prices: SeriesFrame, column: str = "close") -> SeriesFrame:
+    drawdowns, peaks = drawdown_values(prices.column(column))
+    return SeriesFrame(
+        timestamps=prices.timestamps,
+        columns={"value": memoryview(drawdowns), "peak_close": memoryview(peaks)},
+    )
+
 
-    return result
+def drawdown_series(close_points: Iterable[tuple[datetime, float]]) -> list[DrawdownPoint]:
+    points = list(close_points)
+    drawdowns, peaks = drawdown_values([close for _, close in points])
+    return [
+        DrawdownPoint(timestamp_utc=ts, value=dd, peak_close=peak)
+        for (ts, _), dd, peak in zip(points, drawdowns, peaks, strict=True)
+    ]
@@ -0,0 +1,98 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def epoch_to_datetime(ts: int) -> datetime:
+    # Arithmetic instead of fromtimestamp() so pre-1970 history works on every platform.
+    return _EPOCH + timedelta(seconds=ts)
+
+
+# A series as contiguous columns: int64 epoch-second timestamps plus named float64 columns of
+# the same length. Slicing returns views over the same buffers, so a frame read from a
+# memory-mapped sidecar or the series cache is never copied on its way to serialization.
+@dataclass(frozen=True)
+class SeriesFrame:
+    timestamps: memoryview
+    columns: dict[str, memoryview]
+
+    @classmethod
+    def from_columns(
+        cls,
+        timestamps: Iterable[int],
+        **columns: Iterable[float],
+    ) -> "SeriesFrame":
+        return cls(
+            timestamps=memoryview(array("q", timestamps)),
+            columns={name: memoryview(array("d", values)) for name, values in columns.items()},
+        )
+
+    @classmethod
+    def empty(cls, *names: str) -> "SeriesFrame":
+        return cls.from_columns([], **{name: [] for name in names})
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __reduce__(self) -> tuple[object, ...]:
+        # Memoryviews cannot be pickled, so a frame sent to another process travels as arrays.
+        return (
+            _frame_from_arrays,
+            (
+                _copy_array("q", self.timestamps),
+                {name: _copy_array("d", column) for name, column in self.columns.items()},
+            ),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return self.timestamps.nbytes + sum(column.nbytes for column in self.columns.values())
+
+    def column(self, name: str = "value") -> memoryview:
+        return self.columns[name]
+
+    def slice(self, start: int, stop: int) -> "SeriesFrame":
+        return SeriesFrame(
+            timestamps=self.timestamps[start:stop],
+            columns={name: column[start:stop] for name, column in self.columns.items()},
+        )
+
+    def blocks(self, size: int) -> Iterator["SeriesFrame"]:
+        # Consecutive views of at most `size` rows, for streaming a frame out piece by piece.
+        for start in range(0, len(self), size):
+            yield self.slice(start, start + size)
+
+    def take(self, indices: Sequence[int]) -> "SeriesFrame":
+        # A copy holding only the rows at `indices`, in the given order.
+        return SeriesFrame.from_columns(
+            [self.timestamps[i] for i in indices],
+            **{name: [column[i] for i in indices] for name, column in self.columns.items()},
+        )
+
+    def tail(self, limit: int) -> "SeriesFrame":
+        return self.slice(max(0, len(self) - limit), len(self))
+
+    def between(self, start: int | None, end: int | None) -> "SeriesFrame":
+        lo = 0 if start is None else bisect_left(self.timestamps, start)
+        hi = len(self) if end is None else bisect_right(self.timestamps, end)
+        return self.slice(lo, max(lo, hi))
+
+    def datetimes(self) -> list[datetime]:
+        return [epoch_to_datetime(ts) for ts in self.timestamps]
+
+
+def _copy_array(typecode: str, view: memoryview) -> array:
+    values = array(typecode)
+    values.frombytes(view.cast("B"))
+    return values
+
+
+def _frame_from_arrays(timestamps: array, columns: dict[str, array]) -> SeriesFrame:
+    return SeriesFrame(
+        timestamps=memoryview(timestamps),
+        columns={name: memoryview(column) for name, column in columns.items()},
+    )
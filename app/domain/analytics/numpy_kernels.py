@@ -0,0 +1,248 @@
+# Vectorized counterparts of the pure-Python kernels. Each function keeps the edge-case
+# behaviour of the original: 0.0 returns around non-positive prices, None for too few
+# observations, population variance.
+import math
+from array import array
+from collections.abc import Sequence
+
+import numpy as np
+
+from app.domain.analytics.risk import RiskSummary
+from app.domain.analytics.rolling import FLAT_TOLERANCE
+
+
+def _as_float64(values: Sequence[float]) -> np.ndarray:
+    # Zero-copy for float64 memoryviews and arrays.
+    return np.asarray(values, dtype=np.float64)
+
+
+def _to_array(values: np.ndarray) -> array:
+    out = array("d")
+    out.frombytes(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+    return out
+
+
+def simple_return_values(closes: Sequence[float]) -> array:
+    prices = _as_float64(closes)
+    if len(prices) < 2:
+        return array("d")
+
+    prev, current = prices[:-1], prices[1:]
+    out = np.zeros(len(current))
+    valid = prev != 0
+    out[valid] = (current[valid] / prev[valid]) - 1.0
+    return _to_array(out)
+
+
+def log_return_values(closes: Sequence[float]) -> array:
+    prices = _as_float64(closes)
+    if len(prices) < 2:
+        return array("d")
+
+    prev, current = prices[:-1], prices[1:]
+    out = np.zeros(len(current))
+    # NaN compares false on both sides, so it flows into np.log like it does into math.log.
+    valid = ~((prev <= 0) | (current <= 0))
+    out[valid] = np.log(current[valid] / prev[valid])
+    return _to_array(out)
+
+
+def _drawdowns(prices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # fmax skips NaN closes, like the `close > peak` comparison in the Python kernel.
+    peaks = np.fmax.accumulate(prices)
+    drawdowns = np.zeros(len(prices))
+    valid = ~(peaks <= 0)
+    drawdowns[valid] = (prices[valid] / peaks[valid]) - 1.0
+    return drawdowns, peaks
+
+
+def drawdown_values(closes: Sequence[float]) -> tuple[array, array]:
+    prices = _as_float64(closes)
+    if len(prices) == 0:
+        return array("d"), array("d")
+
+    drawdowns, peaks = _drawdowns(prices)
+    return _to_array(drawdowns), _to_array(peaks)
+
+
+def max_drawdown(closes: Sequence[float]) -> float | None:
+    prices = _as_float64(closes)
+    if len(prices) == 0:
+        return None
+    drawdowns, _ = _drawdowns(prices)
+    return float(drawdowns.min())
+
+
+def rolling_std_values(values: Sequence[float], window: int) -> array:
+    data = _as_float64(values)
+    if window <= 1 or len(data) < window:
+        return array("d")
+
+    # Window sums from prefix sums keep this O(n) in time and memory; centring on the series
+    # mean keeps the sums small, as in rolling_comoment_values.
+    data = data - data.mean()
+    totals = np.concatenate(([0.0], np.cumsum(data)))
+    squares = np.concatenate(([0.0], np.cumsum(data * data)))
+    sums = totals[window:] - totals[:-window]
+    sums_sq = squares[window:] - squares[:-window]
+    m2 = sums_sq - sums * sums / window
+    # What the prefix sums leave in a flat window is rounding noise, not variance.
+    m2[m2 <= FLAT_TOLERANCE * sums_sq] = 0.0
+    return _to_array(np.sqrt(m2 / window))
+
+
+def rolling_comoment_values(
+    x: Sequence[float],
+    y: Sequence[float],
+    window: int,
+) -> tuple[array, array]:
+    xs = _as_float64(x)
+    ys = _as_float64(y)
+    if len(xs) != len(ys):
+        raise ValueError("rolling co-moments require aligned series of equal length")
+    if window <= 1 or len(xs) < window:
+        return array("d"), array("d")
+
+    xs = xs - xs.mean()
+    ys = ys - ys.mean()
+
+    def window_sums(values: np.ndarray) -> np.ndarray:
+        totals = np.concatenate(([0.0], np.cumsum(values)))
+        return totals[window:] - totals[:-window]
+
+    sx, sy = window_sums(xs), window_sums(ys)
+    sxx, syy = window_sums(xs * xs), window_sums(ys * ys)
+    cov = window_sums(xs * ys) - sx * sy / window
+    var_x = sxx - sx * sx / window
+    var_y = syy - sy * sy / window
+
+    correlations = np.zeros(len(cov))
+    betas = np.zeros(len(cov))
+    has_x = var_x > FLAT_TOLERANCE * sxx
+    both = has_x & (var_y > FLAT_TOLERANCE * syy)
+    correlations[both] = np.clip(cov[both] / np.sqrt(var_x[both] * var_y[both]), -1.0, 1.0)
+    betas[has_x] = cov[has_x] / var_x[has_x]
+    return _to_array(correlations), _to_array(betas)
+
+
+def pearson_correlation(left: Sequence[float], right: Sequence[float]) -> float:
+    if len(left) != len(right) or len(left) < 2:
+        raise ValueError("correlation requires at least two aligned values")
+
+    left_delta = _as_float64(left) - np.mean(left)
+    right_delta = _as_float64(right) - np.mean(right)
+    left_var = float(np.dot(left_delta, left_delta))
+    right_var = float(np.dot(right_delta, right_delta))
+    if left_var == 0.0 or right_var == 0.0:
+        return 0.0
+
+    return float(np.dot(left_delta, right_delta)) / math.sqrt(left_var * right_var)
+
+
+def comoment_matrix(columns: list[Sequence[float]]) -> list[list[float]]:
+    data = np.column_stack([_as_float64(column) for column in columns])
+    deviations = data - data.mean(axis=0)
+    return (deviations.T @ deviations).tolist()
+
+
+def pairwise_comoments(
+    columns: list[Sequence[float]],
+) -> tuple[list[list[int]], list[list[float]], list[list[float]]]:
+    data = np.column_stack([_as_float64(column) for column in columns])
+    present = ~np.isnan(data)
+    mask = present.astype(np.float64)
+    # Centring on each column's own mean is a shift, which leaves every pair's moments intact
+    # but keeps the raw sums small; missing rows become zeros and drop out of all products.
+    counts = present.sum(axis=0)
+    means = np.divide(np.nansum(data, axis=0), counts, out=np.zeros(len(columns)), where=counts > 0)
+    values = np.where(present, data - means, 0.0)
+
+    observations = mask.T @ mask
+    sums = values.T @ mask  # sums[i, j]: sum of series i over rows shared with j
+    sums_sq = (values * values).T @ mask
+    cross = values.T @ values
+    with np.errstate(divide="ignore", invalid="ignore"):
+        comoments = np.where(observations > 0, cross - sums * sums.T / observations, 0.0)
+        squares = np.where(observations > 0, sums_sq - sums * sums / observations, 0.0)
+
+    return (
+        observations.astype(np.int64).tolist(),
+        comoments.tolist(),
+        np.maximum(squares, 0.0).tolist(),
+    )
+
+
+def mean(values: Sequence[float]) -> float | None:
+    if len(values) == 0:
+        return None
+    return float(np.mean(_as_float64(values)))
+
+
+def stddev(values: Sequence[float]) -> float | None:
+    if len(values) < 2:
+        return None
+    return float(np.std(_as_float64(values)))
+
+
+def downside_deviation(values: Sequence[float], target: float = 0.0) -> float | None:
+    if len(values) == 0:
+        return None
+
+    downside = np.minimum(0.0, _as_float64(values) - target)
+    return math.sqrt(float(np.mean(downside * downside)))
+
+
+def sharpe_ratio(values: Sequence[float], risk_free_rate: float = 0.0) -> float | None:
+    if len(values) < 2:
+        return None
+
+    avg_excess = float(np.mean(_as_float64(values) - risk_free_rate))
+    volatility = stddev(values)
+    if volatility in (None, 0.0):
+        return None
+
+    return avg_excess / volatility
+
+
+def sortino_ratio(
+    values: Sequence[float],
+    risk_free_rate: float = 0.0,
+    target: float = 0.0,
+) -> float | None:
+    if len(values) < 2:
+        return None
+
+    avg_excess = float(np.mean(_as_float64(values) - risk_free_rate))
+    downside_volatility = downside_deviation(values, target=target)
+    if downside_volatility in (None, 0.0):
+        return None
+
+    return avg_excess / downside_volatility
+
+
+def risk_summary(
+    closes: Sequence[float],
+    return_type: str = "log",
+    risk_free_rate: float = 0.0,
+    downside_target: float = 0.0,
+) -> RiskSummary:
+    if len(closes) == 0:
+        return RiskSummary(0, None, None, None, None, None, None)
+
+    if return_type == "simple":
+        values = _as_float64(simple_return_values(closes))
+    else:
+        values = _as_float64(log_return_values(closes))
+    worst = max_drawdown(closes)
+    if len(values) == 0:
+        return RiskSummary.from_sums(0, 0.0, 0.0, 0.0, 0.0, worst)
+
+    shortfall = np.minimum(0.0, values - downside_target)
+    return RiskSummary.from_sums(
+        count=len(values),
+        total=float(values.sum()),
+        excess_total=float((values - risk_free_rate).sum()),
+        downside_total=float(np.dot(shortfall, shortfall)),
+        m2=float(np.var(values)) * len(values),
+        max_drawdown=worst,
+    )
@@ -1,7 +1,13 @@
 import math
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 
+from app.domain.analytics.alignment import INNER_JOIN, ForwardFillJoin, JoinPolicy, align_frames
+from app.domain.analytics.backend import numpy_kernels
+from app.domain.analytics.frame import SeriesFrame
+
 
 @dataclass(frozen=True)
 class ReturnPoint:
@@ -9,33 +15,130 @@ class ReturnPoint:
     value: float
 
 
-def simple_returns(points: list[tuple[datetime, float]]) -> list[ReturnPoint]:
-    if len(points) < 2:
-        return []
-    out: list[ReturnPoint] = []
-    prev_price = points[0][1]
-    for i in range(1, len(points)):
-        ts, price = points[i]
+def simple_return_values(closes: Sequence[float]) -> array:
+    kernels = numpy_kernels()
+    if kernels is not None:
+        return kernels.simple_return_values(closes)
+
+    out = array("d")
+    if len(closes) < 2:
+        return out
+    prev_price = closes[0]
+    for i in range(1, len(closes)):
+        price = closes[i]
         if prev_price == 0:
             r = 0.0
         else:
             r = (price / prev_price) - 1.0
-        out.append(ReturnPoint(timestamp_utc=ts, value=r))
+        out.append(r)
         prev_price = price
     return out
 
 
-def log_returns(points: list[tuple[datetime, float]]) -> list[ReturnPoint]:
-    if len(points) < 2:
-        return []
-    out: list[ReturnPoint] = []
-    prev_price = points[0][1]
-    for i in range(1, len(points)):
-        ts, price = points[i]
+def log_return_values(closes: Sequence[float]) -> array:
+    kernels = numpy_kernels()
+    if kernels is not None:
+        return kernels.log_return_values(closes)
+
+    out = array("d")
+    if len(closes) < 2:
+        return out
+    prev_price = closes[0]
+    for i in range(1, len(closes)):
+        price = closes[i]
         if prev_price <= 0 or price <= 0:
             r = 0.0
         else:
             r = math.log(price / prev_price)
-        out.append(ReturnPoint(timestamp_utc=ts, value=r))
+        out.append(r)
         prev_price = price
     return out
+
+
+def simple_returns_frame(prices: SeriesFrame, column: str = "close") -> SeriesFrame:
+    if len(prices) < 2:
+        return SeriesFrame.empty("value")
+    values = simple_return_values(prices.column(column))
+    return SeriesFrame(timestamps=prices.timestamps[1:], columns={"value": memoryview(values)})
+
+
+def log_returns_frame(prices: SeriesFrame, column: str = "close") -> SeriesFrame:
+    if len(prices) < 2:
+        return SeriesFrame.empty("value")
+    values = log_return_values(prices.column(column))
+    return SeriesFrame(timestamps=prices.timestamps[1:], columns={"value": memoryview(values)})
+
+
+def stream_simple_returns(
+    blocks: Iterable[SeriesFrame], column: str = "close"
+) -> Iterator[SeriesFrame]:
+    return _stream_returns(blocks, column, simple_return_values)
+
+
+def stream_log_returns(
+    blocks: Iterable[SeriesFrame], column: str = "close"
+) -> Iterator[SeriesFrame]:
+    return _stream_returns(blocks, column, log_return_values)
+
+
+def _stream_returns(
+    blocks: Iterable[SeriesFrame],
+    column: str,
+    return_values: Callable[[Sequence[float]], array],
+) -> Iterator[SeriesFrame]:
+    # Returns of consecutive price blocks, one block at a time: each block is prefixed with the
+    # last close of the one before, so the output equals the returns of the whole series.
+    previous: float | None = None
+    for block in blocks:
+        if len(block) == 0:
+            continue
+        closes = block.column(column)
+        if previous is None:
+            timestamps = block.timestamps[1:]
+            values = return_values(closes)
+        else:
+            joined = array("d", (previous,))
+            joined.frombytes(closes.cast("B"))
+            timestamps = block.timestamps
+            values = return_values(joined)
+        previous = closes[-1]
+        if len(values) > 0:
+            yield SeriesFrame(timestamps=timestamps, columns={"value": memoryview(values)})
+
+
+def aligned_log_returns(
+    prices_by_symbol: dict[str, SeriesFrame],
+    policy: JoinPolicy = INNER_JOIN,
+) -> SeriesFrame:
+    # One log-return column per symbol on shared timestamps. Forward filling is applied to
+    # prices, not returns, so a stale price contributes a zero return instead of a repeat.
+    if isinstance(policy, ForwardFillJoin):
+        prices = align_frames(prices_by_symbol, column="close", policy=policy)
+        if len(prices) < 2:
+            return SeriesFrame.empty(*prices_by_symbol)
+        return SeriesFrame(
+            timestamps=prices.timestamps[1:],
+            columns={
+                symbol: memoryview(log_return_values(prices.column(symbol)))
+                for symbol in prices_by_symbol
+            },
+        )
+
+    returns = {symbol: log_returns_frame(frame) for symbol, frame in prices_by_symbol.items()}
+    return align_frames(returns, policy=policy)
+
+
+def simple_returns(points: list[tuple[datetime, float]]) -> list[ReturnPoint]:
+    values = simple_return_values([price for _, price in points])
+    return [
+        ReturnPoint(timestamp_utc=ts, value=r)
+        for (ts, _), r in zip(points[1:], values, strict=True)
+    ]
+
+
+def log_returns(points: list[tuple[datetime, float]]) -> list[ReturnPoint]:
+    values = log_return_values([price for _, price in points])
+    return [
+        ReturnPoint(timestamp_utc=ts, value=r)
+        for (ts, _), r in zip(points[1:], values, strict=True)
+    ]
@@ -1,13 +1,25 @@
 import math
+from collections.abc import Sequence
+from dataclasses import dataclass
 
+from app.domain.analytics.backend import numpy_kernels
+
+
+def mean(values: Sequence[float]) -> float | None:
+    kernels = numpy_kernels()
+    if kernels is not None:
+        return kernels.mean(values)
 
-def mean(values: list[float]) -> float | None:
     if not values:
         return None
     return sum(values) / len(values)
 
 
-def stddev(values: list[float]) -> float | None:
+def stddev(values: Sequence[float]) -> float | None:
+    kernels = numpy_kernels()
+    if kernels is not None:
+        return kernels.stddev(values)
+
     if len(values) < 2:
         return None
 
@@ -19,7 +31,11 @@ def stddev(values: list[float]) -> float | None:
     return math.sqrt(variance)
 
 
-def downside_deviation(values: list[float], target: float = 0.0) -> float | None:
+def downside_deviation(values: Sequence[float], target: float = 0.0) -> float | None:
+    kernels = numpy_kernels()
+    if kernels is not None:
+        return kernels.downside_deviation(values, target=target)
+
     if not values:
         return None
 
@@ -28,7 +44,11 @@ def downside_deviation(values: list[float], target: float = 0.0) -> float | None
     return math.sqrt(variance)
 
 
-def sharpe_ratio(values: list[float], risk_free_rate: float = 0.0) -> float | None:
+def sharpe_ratio(values: Sequence[float], risk_free_rate: float = 0.0) -> float | None:
+    kernels = numpy_kernels()
+    if kernels is not None:
+        return kernels.sharpe_ratio(values, risk_free_rate=risk_free_rate)
+
     if len(values) < 2:
         return None
 
@@ -43,10 +63,14 @@ def sharpe_ratio(values: list[float], risk_free_rate: float = 0.0) -> float | No
 
 
 def sortino_ratio(
-    values: list[float],
+    values: Sequence[float],
     risk_free_rate: float = 0.0,
     target: float = 0.0,
 ) -> float | None:
+    kernels = numpy_kernels()
+    if kernels is not None:
+        return kernels.sortino_ratio(values, risk_free_rate=risk_free_rate, target=target)
+
     if len(values) < 2:
         return None
 
@@ -58,3 +82,101 @@ def sortino_ratio(
         return None
 
     return avg_excess / downside_volatility
+
+
+@dataclass(frozen=True)
+class RiskSummary:
+    observations: int
+    mean_return: float | None
+    volatility: float | None
+    downside_volatility: float | None
+    sharpe_ratio: float | None
+    sortino_ratio: float | None
+    max_drawdown: float | None
+
+    @classmethod
+    def from_sums(
+        cls,
+        count: int,
+        total: float,
+        excess_total: float,
+        downside_total: float,
+        m2: float,
+        max_drawdown: float | None,
+    ) -> "RiskSummary":
+        # Shared by both backends: turns running sums over `count` returns into the fields.
+        if count == 0:
+            return cls(0, None, None, None, None, None, max_drawdown)
+
+        volatility = math.sqrt(max(m2, 0.0) / count) if count >= 2 else None
+        downside_volatility = math.sqrt(downside_total / count)
+        avg_excess = excess_total / count
+        sharpe = None
+        sortino = None
+        if count >= 2:
+            sharpe = avg_excess / volatility if volatility else None
+            sortino = avg_excess / downside_volatility if downside_volatility else None
+
+        return cls(
+            observations=count,
+            mean_return=total / count,
+            volatility=volatility,
+            downside_volatility=downside_volatility,
+            sharpe_ratio=sharpe,
+            sortino_ratio=sortino,
+            max_drawdown=max_drawdown,
+        )
+
+
+def risk_summary(
+    closes: Sequence[float],
+    return_type: str = "log",
+    risk_free_rate: float = 0.0,
+    downside_target: float = 0.0,
+) -> RiskSummary:
+    kernels = numpy_kernels()
+    if kernels is not None:
+        return kernels.risk_summary(closes, return_type, risk_free_rate, downside_target)
+
+    if len(closes) == 0:
+        return RiskSummary(0, None, None, None, None, None, None)
+
+    # One pass over the closes: returns, running sums, Welford moments and the drawdown
+    # trough are all updated per price, so no returns or drawdown series is materialised.
+    simple = return_type == "simple"
+    count = 0
+    total = 0.0
+    excess_total = 0.0
+    downside_total = 0.0
+    running_mean = 0.0
+    m2 = 0.0
+
+    prev = closes[0]
+    peak = prev
+    max_drawdown = 0.0
+    for i in range(1, len(closes)):
+        price = closes[i]
+        if simple:
+            r = 0.0 if prev == 0 else (price / prev) - 1.0
+        elif prev <= 0 or price <= 0:
+            r = 0.0
+        else:
+            r = math.log(price / prev)
+        prev = price
+
+        count += 1
+        total += r
+        excess_total += r - risk_free_rate
+        shortfall = min(0.0, r - downside_target)
+        downside_total += shortfall * shortfall
+        delta = r - running_mean
+        running_mean += delta / count
+        m2 += delta * (r - running_mean)
+
+        if price > peak:
+            peak = price
+        drawdown = 0.0 if peak <= 0 else (price / peak) - 1.0
+        if drawdown < max_drawdown:
+            max_drawdown = drawdown
+
+    return RiskSummary.from_sums(count, total, excess_total, downside_total, m2, max_drawdown)
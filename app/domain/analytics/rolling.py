@@ -0,0 +1,104 @@
+import math
+from array import array
+from collections.abc import Sequence
+
+from app.domain.analytics.backend import numpy_kernels
+from app.domain.analytics.frame import SeriesFrame
+
+# Window sums are recomputed exactly this often so floating-point drift cannot accumulate.
+_RESYNC_INTERVAL = 1024
+# A window whose variance is below this fraction of its sum of squares is treated as flat: the
+# remainder is rounding noise (e.g. a run of zero returns after centring).
+FLAT_TOLERANCE = 1e-9
+
+
+def rolling_comoment_values(
+    x: Sequence[float],
+    y: Sequence[float],
+    window: int,
+) -> tuple[array, array]:
+    # Rolling correlation of x and y, and rolling beta of y on x, one value per full window.
+    kernels = numpy_kernels()
+    if kernels is not None:
+        return kernels.rolling_comoment_values(x, y, window)
+
+    correlations = array("d")
+    betas = array("d")
+    n = len(x)
+    if len(y) != n:
+        raise ValueError("rolling co-moments require aligned series of equal length")
+    if window <= 1 or n < window:
+        return correlations, betas
+
+    # Centring on the full-sample means is a shift, which leaves every window's co-moments
+    # intact but keeps the running sums small.
+    mean_x = sum(x) / n
+    mean_y = sum(y) / n
+    xs = [value - mean_x for value in x]
+    ys = [value - mean_y for value in y]
+
+    size = float(window)
+    sx, sy, sxx, syy, sxy = _window_sums(xs, ys, 0, window)
+    for i in range(window - 1, n):
+        if i >= window:
+            if (i - window + 1) % _RESYNC_INTERVAL == 0:
+                sx, sy, sxx, syy, sxy = _window_sums(xs, ys, i - window + 1, i + 1)
+            else:
+                # Slide by one: add the incoming pair and remove the outgoing one.
+                xi, yi = xs[i], ys[i]
+                xo, yo = xs[i - window], ys[i - window]
+                sx += xi - xo
+                sy += yi - yo
+                sxx += xi * xi - xo * xo
+                syy += yi * yi - yo * yo
+                sxy += xi * yi - xo * yo
+
+        cov = sxy - sx * sy / size
+        var_x = sxx - sx * sx / size
+        var_y = syy - sy * sy / size
+        flat_x = var_x <= FLAT_TOLERANCE * sxx
+        flat_y = var_y <= FLAT_TOLERANCE * syy
+        # Like pearson_correlation, a flat window yields 0.0 rather than an undefined value.
+        if flat_x or flat_y:
+            correlations.append(0.0)
+        else:
+            # Rounding in the running sums can push a perfectly correlated window just past 1.
+            correlations.append(max(-1.0, min(1.0, cov / math.sqrt(var_x * var_y))))
+        betas.append(0.0 if flat_x else cov / var_x)
+
+    return correlations, betas
+
+
+def rolling_comoments_frame(
+    aligned: SeriesFrame,
+    x_column: str,
+    y_column: str,
+    window: int,
+) -> SeriesFrame:
+    correlations, betas = rolling_comoment_values(
+        aligned.column(x_column),
+        aligned.column(y_column),
+        window,
+    )
+    if len(correlations) == 0:
+        return SeriesFrame.empty("correlation", "beta")
+    return SeriesFrame(
+        timestamps=aligned.timestamps[window - 1 :],
+        columns={"correlation": memoryview(correlations), "beta": memoryview(betas)},
+    )
+
+
+def _window_sums(
+    xs: list[float],
+    ys: list[float],
+    start: int,
+    stop: int,
+) -> tuple[float, float, float, float, float]:
+    sx = sy = sxx = syy = sxy = 0.0
+    for xi, yi in zip(xs[start:stop], ys[start:stop], strict=True):
+        sx += xi
+        sy += yi
+        sxx += xi * xi
+        syy += yi * yi
+        sxy += xi * yi
+    return sx, sy, sxx, syy, sxy
@@ -1,7 +1,12 @@
 import math
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 
+from app.domain.analytics.backend import numpy_kernels
+from app.domain.analytics.frame import SeriesFrame
+
 
 @dataclass(frozen=True)
 class VolPoint:
@@ -9,20 +14,70 @@ class VolPoint:
     value: float
 
 
-def rolling_std(values: list[tuple[datetime, float]], window: int) -> list[VolPoint]:
+# Running moments are recomputed exactly this often so floating-point drift cannot accumulate.
+_RESYNC_INTERVAL = 1024
+
+
+def rolling_std_values(values: Sequence[float], window: int) -> array:
+    kernels = numpy_kernels()
+    if kernels is not None:
+        return kernels.rolling_std_values(values, window)
+
+    out = array("d")
     if window <= 1:
-        return []
+        return out
     if len(values) < window:
-        return []
-
-    out: list[VolPoint] = []
-    for i in range(window - 1, len(values)):
-        ts = values[i][0]
-        slice_vals = [v for _, v in values[i - window + 1 : i + 1]]
-        mean = sum(slice_vals) / float(window)
-        var = 0.0
-        for x in slice_vals:
-            var += (x - mean) * (x - mean)
-        var = var / float(window)
-        out.append(VolPoint(timestamp_utc=ts, value=math.sqrt(var)))
+        return out
+
+    # Sliding Welford update: each step swaps one value in and one out, so the whole series
+    # costs O(n) instead of O(n * window).
+    size = float(window)
+    mean, m2 = _window_moments(values, 0, window)
+    out.append(math.sqrt(max(m2, 0.0) / size))
+    for i in range(window, len(values)):
+        if (i - window + 1) % _RESYNC_INTERVAL == 0:
+            mean, m2 = _window_moments(values, i - window + 1, i + 1)
+        else:
+            incoming = values[i]
+            outgoing = values[i - window]
+            delta = incoming - outgoing
+            next_mean = mean + delta / size
+            m2 += delta * (incoming - next_mean + outgoing - mean)
+            mean = next_mean
+        out.append(math.sqrt(max(m2, 0.0) / size))
     return out
+
+
+def _window_moments(values: Sequence[float], start: int, stop: int) -> tuple[float, float]:
+    window = values[start:stop]
+    mean = sum(window) / float(len(window))
+    m2 = 0.0
+    for x in window:
+        m2 += (x - mean) * (x - mean)
+    return mean, m2
+
+
+def rolling_std_frame(values: SeriesFrame, window: int, column: str = "value") -> SeriesFrame:
+    stds = rolling_std_values(values.column(column), window)
+    if len(stds) == 0:
+        return SeriesFrame.empty("value")
+    return SeriesFrame(
+        timestamps=values.timestamps[window - 1 :],
+        columns={"value": memoryview(stds)},
+    )
+
+
+def rolling_std_frames(
+    values: SeriesFrame,
+    windows: Sequence[int],
+    column: str = "value",
+) -> list[SeriesFrame]:
+    return [rolling_std_frame(values, window, column=column) for window in windows]
+
+
+def rolling_std(values: list[tuple[datetime, float]], window: int) -> list[VolPoint]:
+    stds = rolling_std_values([v for _, v in values], window)
+    return [
+        VolPoint(timestamp_utc=ts, value=std)
+        for (ts, _), std in zip(values[window - 1 :], stds, strict=True)
+    ]
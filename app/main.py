@@ -1,7 +1,38 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from app.api.router import router as api_router
+from app.core.compute import shutdown_compute
+from app.core.settings import (
+    get_analytics_backend,
+    get_normalized_data_dir,
+    get_series_cache_max_bytes,
+    get_warmup_max_bytes,
+    get_warmup_series,
+)
+from app.domain.analytics.backend import set_backend
+from app.services.market_data.access_stats import get_access_stats
+from app.services.market_data.warmup import get_warmup
+
+set_backend(get_analytics_backend())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Warm-up runs in the background; /health reports 503 until it has finished.
+    get_warmup().start(
+        get_normalized_data_dir(),
+        get_warmup_series(),
+        # Anything above the cache budget would only be evicted again.
+        max_bytes=min(get_warmup_max_bytes(), get_series_cache_max_bytes()),
+    )
+    yield
+    get_access_stats().flush(get_normalized_data_dir())
+    shutdown_compute()
+
 
-app = FastAPI(title="QuantLab Backend")
+app = FastAPI(title="QuantLab Backend", lifespan=lifespan)
 
 app.include_router(api_router)
@@ -20,3 +20,7 @@ class AssetSummaryOut(BaseModel):
 
 class AssetsOverviewOut(BaseModel):
     assets: list[AssetSummaryOut]
+
+
+class OverviewRefreshOut(BaseModel):
+    refreshed: list[str]
@@ -16,7 +16,7 @@ class NormalizedPerformanceSeriesOut(BaseModel):
 class NormalizedPerformanceOut(BaseModel):
     symbols: list[str]
     timeframe: str = Field(min_length=1)
-    limit: int
+    limit: int | None
     observations: int
     base_value: float
     series: list[NormalizedPerformanceSeriesOut]
@@ -3,7 +3,12 @@ from pydantic import BaseModel, Field
 
 class CorrelationRowOut(BaseModel):
     symbol: str
-    values: list[float]
+    values: list[float | None]
+
+
+class ObservationRowOut(BaseModel):
+    symbol: str
+    values: list[int]
 
 
 class CorrelationMatrixOut(BaseModel):
@@ -12,3 +17,5 @@ class CorrelationMatrixOut(BaseModel):
     limit: int
     observations: int
     rows: list[CorrelationRowOut]
+    covariance_rows: list[CorrelationRowOut] | None = None
+    observation_rows: list[ObservationRowOut] | None = None
@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class RollingPointOut(BaseModel):
+    timestamp_utc: datetime
+    value: float
+
+
+class RollingWindowOut(BaseModel):
+    window: int
+    points: list[RollingPointOut]
+
+
+class RollingCorrelationOut(BaseModel):
+    symbols: list[str]
+    timeframe: str = Field(min_length=1)
+    limit: int
+    observations: int
+    windows: list[RollingWindowOut]
+
+
+class RollingBetaOut(BaseModel):
+    symbol: str
+    benchmark: str
+    timeframe: str = Field(min_length=1)
+    limit: int
+    observations: int
+    windows: list[RollingWindowOut]
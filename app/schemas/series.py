@@ -24,6 +24,17 @@ class SeriesOut(BaseModel):
     points: list[SeriesPointOut]
 
 
+class WindowSeriesOut(BaseModel):
+    window: int
+    points: list[SeriesPointOut]
+
+
+class VolatilityOut(BaseModel):
+    symbol: str
+    points: list[SeriesPointOut]
+    windows: list[WindowSeriesOut]
+
+
 class PricesOut(BaseModel):
     symbol: str
     points: list[PricePointOut]
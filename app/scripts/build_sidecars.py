@@ -0,0 +1,39 @@
+import argparse
+from itertools import pairwise
+from pathlib import Path
+
+from app.services.market_data.columnar_store import write_sidecar
+from app.services.market_data.manifest import write_manifest
+from app.services.market_data.reader import NormalizedCsvReader
+from app.services.market_data.timestamp_index import build_index
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Build sidecars, manifests and indexes for existing normalized CSV files."
+    )
+    parser.add_argument(
+        "--normalized-dir",
+        default="data/normalized",
+        help="Directory with normalized CSV files.",
+    )
+    args = parser.parse_args()
+
+    normalized_dir = Path(args.normalized_dir)
+    if not normalized_dir.is_dir():
+        print(f"Normalized dir not found: {normalized_dir}")
+        return 1
+
+    reader = NormalizedCsvReader(normalized_dir=normalized_dir, use_sidecar=False)
+    for csv_path in sorted(normalized_dir.glob("*.csv")):
+        rows = reader.read_ohlcv_rows(csv_path, sort=False)
+        is_sorted = all(prev[0] <= cur[0] for prev, cur in pairwise(rows))
+        output_path = write_sidecar(csv_path, rows)
+        write_manifest(csv_path, rows=len(rows), is_sorted=is_sorted)
+        build_index(csv_path)
+        print(f"Sidecar: {output_path} ({len(rows)} rows, sorted={is_sorted})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
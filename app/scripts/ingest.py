@@ -29,6 +29,11 @@ def main() -> int:
         default="data/normalized",
         help="Output directory for normalized CSV.",
     )
+    parser.add_argument(
+        "--append",
+        action="store_true",
+        help="Append only bars newer than the existing normalized CSV instead of rewriting it.",
+    )
 
     args = parser.parse_args()
 
@@ -54,7 +59,8 @@ def main() -> int:
     bars = provider.normalize(raw_rows=raw_rows, src=src)
 
     repo = MarketDataRepository(normalized_dir=Path(args.normalized_dir))
-    output_path = repo.write_bars_csv(
+    write = repo.append_bars if args.append else repo.write_bars_csv
+    output_path = write(
         bars=bars,
         symbol=args.symbol,
         timeframe=args.timeframe,
@@ -3,6 +3,10 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 
+from app.services.market_data.columnar_store import write_sidecar
+from app.services.market_data.manifest import write_manifest
+from app.services.market_data.timestamp_index import build_index
+
 
 @dataclass(frozen=True)
 class StooqRow:
@@ -28,9 +32,12 @@ def _to_int(value: str) -> int:
     return int(float(v))
 
 
+def _date_to_datetime_utc(date_str: str) -> datetime:
+    return datetime.strptime(date_str.strip(), "%Y-%m-%d").replace(tzinfo=UTC)
+
+
 def _date_to_timestamp_utc(date_str: str) -> str:
-    dt = datetime.strptime(date_str.strip(), "%Y-%m-%d").replace(tzinfo=UTC)
-    return dt.isoformat()
+    return _date_to_datetime_utc(date_str).isoformat()
 
 
 def _pick(r: dict, keys: list[str]) -> str:
@@ -113,6 +120,24 @@ def _write_normalized_csv(
                 ]
             )
 
+    write_sidecar(
+        out_path,
+        (
+            (
+                int(_date_to_datetime_utc(r.date).timestamp()),
+                _to_float(r.open),
+                _to_float(r.high),
+                _to_float(r.low),
+                _to_float(r.close),
+                float(_to_int(r.volume)),
+            )
+            for r in rows
+        ),
+    )
+    # _read_stooq_csv sorts rows by ISO date, so the file is written in timestamp order.
+    write_manifest(out_path, rows=len(rows), is_sorted=True)
+    build_index(out_path)
+
 
 def normalize_one_file(raw_path: Path, normalized_dir: Path) -> Path | None:
     name = raw_path.name.lower()
@@ -0,0 +1,106 @@
+import json
+import os
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent flushes from several processes may lose counts.
+    fcntl = None
+
+ACCESS_STATS_FILE = ".access_stats.json"
+# Persisted counts halve every week, so the ranking follows recent traffic.
+_HALF_LIFE_SECONDS = 7 * 24 * 3600.0
+
+
+def _decayed(count: float, updated: float, now: float) -> float:
+    return count * 0.5 ** (max(0.0, now - updated) / _HALF_LIFE_SECONDS)
+
+
+# Per-process counts of series reads. `flush` merges them into a file shared by every process
+# that serves the same data directory; `ranked` orders series by their decayed counts there.
+class AccessStats:
+    def __init__(self) -> None:
+        self._counts: Counter[tuple[str, str]] = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, symbol: str, timeframe: str) -> None:
+        with self._lock:
+            self._counts[(symbol, timeframe)] += 1
+
+    def flush(self, normalized_dir: Path) -> None:
+        with self._lock:
+            counts = self._counts
+            self._counts = Counter()
+        if not counts:
+            return
+
+        path = normalized_dir / ACCESS_STATS_FILE
+        try:
+            with path.with_name(path.name + ".lock").open("a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+                now = time.time()
+                entries = _read_entries(path)
+                for (symbol, timeframe), count in counts.items():
+                    name = f"{symbol}_{timeframe}"
+                    previous = entries.get(name)
+                    if previous is not None:
+                        count += _decayed(previous["count"], previous["updated"], now)
+                    entries[name] = {"count": count, "updated": now}
+
+                tmp_path = path.with_name(path.name + ".tmp")
+                tmp_path.write_text(json.dumps(entries, sort_keys=True), encoding="utf-8")
+                os.replace(tmp_path, path)
+        except OSError:
+            # Losing a process' counts only makes the next warm-up less precise.
+            return
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+def ranked_series(normalized_dir: Path) -> list[tuple[str, str]]:
+    # Most-read series first, as persisted by AccessStats.flush.
+    now = time.time()
+    scores: list[tuple[float, str, str]] = []
+    for name, entry in _read_entries(normalized_dir / ACCESS_STATS_FILE).items():
+        symbol, _, timeframe = name.rpartition("_")
+        if symbol == "" or timeframe == "":
+            continue
+        scores.append((_decayed(entry["count"], entry["updated"], now), symbol, timeframe))
+    scores.sort(key=lambda score: (-score[0], score[1], score[2]))
+    return [(symbol, timeframe) for _, symbol, timeframe in scores]
+
+
+def _read_entries(path: Path) -> dict[str, dict[str, float]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+
+    entries: dict[str, dict[str, float]] = {}
+    for name, entry in payload.items():
+        try:
+            entries[name] = {"count": float(entry["count"]), "updated": float(entry["updated"])}
+        except (KeyError, TypeError, ValueError):
+            continue
+    return entries
+
+
+_shared_stats: AccessStats | None = None
+_shared_stats_lock = threading.Lock()
+
+
+def get_access_stats() -> AccessStats:
+    global _shared_stats
+    with _shared_stats_lock:
+        if _shared_stats is None:
+            _shared_stats = AccessStats()
+        return _shared_stats
@@ -0,0 +1,128 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.services.market_data.series_state import read_state
+
+# Directory mtimes are only as fine as the filesystem clock: a listing taken this soon after
+# the last change may have missed a second change with the same mtime, so it is redone.
+_RACY_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class FileMetadata:
+    rows: int
+    first_timestamp: int | None
+    last_timestamp: int | None
+    size_bytes: int
+    mtime_ns: int
+
+
+# symbol -> timeframe -> normalized CSV, listed from `<SYMBOL>_<TIMEFRAME>.csv` file names.
+# The listing is redone only when the directory's mtime changes (files added, removed or
+# replaced); per-file metadata is kept until the file's size or mtime changes.
+class AssetCatalog:
+    def __init__(self, normalized_dir: Path) -> None:
+        self._dir = normalized_dir
+        self._files: dict[str, dict[str, Path]] = {}
+        self._dir_mtime_ns: int | None = None
+        self._racy = True
+        self._metadata: dict[Path, FileMetadata] = {}
+        self._lock = threading.Lock()
+
+    def timeframes_by_symbol(self) -> dict[str, list[str]]:
+        files = self._current_files()
+        return {symbol: sorted(files[symbol]) for symbol in sorted(files)}
+
+    def contains(self, symbol: str, timeframe: str) -> bool:
+        return timeframe in self._current_files().get(symbol, {})
+
+    def metadata(self, symbol: str, timeframe: str) -> FileMetadata | None:
+        # None when the file is gone or has no up-to-date analytics state to describe it.
+        path = self._current_files().get(symbol, {}).get(timeframe)
+        if path is None:
+            return None
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+
+        with self._lock:
+            cached = self._metadata.get(path)
+        if (
+            cached is not None
+            and cached.size_bytes == stat.st_size
+            and cached.mtime_ns == stat.st_mtime_ns
+        ):
+            return cached
+
+        state = read_state(path)
+        if state is None:
+            return None
+        metadata = FileMetadata(
+            rows=state.rows,
+            first_timestamp=state.first_timestamp,
+            last_timestamp=state.last_timestamp,
+            size_bytes=state.source_size,
+            mtime_ns=state.source_mtime_ns,
+        )
+        with self._lock:
+            self._metadata[path] = metadata
+        return metadata
+
+    def _current_files(self) -> dict[str, dict[str, Path]]:
+        try:
+            dir_mtime_ns: int | None = os.stat(self._dir).st_mtime_ns
+        except FileNotFoundError:
+            dir_mtime_ns = None
+
+        with self._lock:
+            if dir_mtime_ns == self._dir_mtime_ns and not self._racy:
+                return self._files
+
+            files = _list_files(self._dir) if dir_mtime_ns is not None else {}
+            listed = {path for timeframes in files.values() for path in timeframes.values()}
+            self._metadata = {p: m for p, m in self._metadata.items() if p in listed}
+            self._files = files
+            self._dir_mtime_ns = dir_mtime_ns
+            self._racy = dir_mtime_ns is None or time.time_ns() - dir_mtime_ns < _RACY_NS
+            return files
+
+
+def _list_files(normalized_dir: Path) -> dict[str, dict[str, Path]]:
+    files: dict[str, dict[str, Path]] = {}
+    try:
+        entries = list(os.scandir(normalized_dir))
+    except (FileNotFoundError, NotADirectoryError):
+        return files
+
+    for entry in entries:
+        if not entry.name.endswith(".csv"):
+            continue
+
+        # Split on the last underscore so symbols may contain underscores themselves.
+        stem = entry.name[: -len(".csv")]
+        symbol, _, timeframe = stem.rpartition("_")
+        symbol = symbol.strip()
+        timeframe = timeframe.strip()
+        if symbol == "" or timeframe == "":
+            continue
+
+        files.setdefault(symbol, {})[timeframe] = Path(entry.path)
+    return files
+
+
+_catalogs: dict[str, AssetCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_asset_catalog(normalized_dir: Path) -> AssetCatalog:
+    key = str(normalized_dir)
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = AssetCatalog(normalized_dir)
+            _catalogs[key] = catalog
+        return catalog
@@ -1,54 +1,56 @@
-import os
 from pathlib import Path
 
+from app.core.settings import get_normalized_data_dir
+from app.domain.analytics.frame import epoch_to_datetime
+from app.services.market_data.asset_catalog import FileMetadata, get_asset_catalog
+from app.services.market_data.reader import NormalizedCsvReader
 
-def _get_normalized_data_dir() -> Path:
-    env_value = os.environ.get("NORMALIZED_DATA_DIR")
-    if env_value:
-        return Path(env_value)
-    return Path("data") / "normalized"
 
+def build_assets_inventory(
+    normalized_dir: Path | None = None,
+    details: bool = False,
+) -> list[dict[str, object]]:
+    if normalized_dir is None:
+        normalized_dir = get_normalized_data_dir()
+    catalog = get_asset_catalog(normalized_dir)
+    reader = NormalizedCsvReader(normalized_dir=normalized_dir, track_access=False)
 
-def build_assets_inventory() -> list[dict[str, object]]:
-    normalized_dir = _get_normalized_data_dir()
-    inventory: dict[str, list[str]] = {}
-
-    if not normalized_dir.exists() or not normalized_dir.is_dir():
-        return []
-
-    for file_path in normalized_dir.glob("*.csv"):
-        stem = file_path.stem  # e.g. "BTCUSDT_1h"
-        if "_" not in stem:
-            continue
-
-        # split by last underscore to support symbols that might contain underscores later
-        parts = stem.rsplit("_", 1)
-        if len(parts) != 2:
-            continue
-
-        symbol = parts[0].strip()
-        timeframe = parts[1].strip()
-
-        if symbol == "" or timeframe == "":
-            continue
-
-        if symbol not in inventory:
-            inventory[symbol] = []
-
-        if timeframe not in inventory[symbol]:
-            inventory[symbol].append(timeframe)
-
-    # Stable output: sort symbols and timeframes
+    # Stable output: the catalog sorts symbols and timeframes
     assets: list[dict[str, object]] = []
-    for symbol in sorted(inventory.keys()):
-        timeframes = sorted(inventory[symbol])
-        assets.append(
-            {
-                "symbol": symbol,
-                "name": symbol,
-                "asset_class": "unknown",
-                "currency": "unknown",
-                "timeframes": timeframes,
-            }
-        )
+    for symbol, timeframes in catalog.timeframes_by_symbol().items():
+        asset: dict[str, object] = {
+            "symbol": symbol,
+            "name": symbol,
+            "asset_class": "unknown",
+            "currency": "unknown",
+            "timeframes": timeframes,
+        }
+        if details:
+            files: list[dict[str, object]] = []
+            for timeframe in timeframes:
+                metadata = catalog.metadata(symbol, timeframe)
+                if metadata is None:
+                    # No current analytics state yet: build it once, then describe the file.
+                    try:
+                        reader.build_series_state(symbol, timeframe)
+                    except FileNotFoundError:
+                        continue
+                    metadata = catalog.metadata(symbol, timeframe)
+                if metadata is not None:
+                    files.append(_describe_file(timeframe, metadata))
+            asset["files"] = files
+        assets.append(asset)
     return assets
+
+
+def _describe_file(timeframe: str, metadata: FileMetadata) -> dict[str, object]:
+    first = metadata.first_timestamp
+    last = metadata.last_timestamp
+    return {
+        "timeframe": timeframe,
+        "rows": metadata.rows,
+        "first_timestamp_utc": epoch_to_datetime(first) if first is not None else None,
+        "last_timestamp_utc": epoch_to_datetime(last) if last is not None else None,
+        "size_bytes": metadata.size_bytes,
+        "modified_utc": epoch_to_datetime(metadata.mtime_ns // 1_000_000_000),
+    }
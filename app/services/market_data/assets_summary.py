@@ -1,12 +1,16 @@
+import threading
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 
 from app.core.settings import get_normalized_data_dir
-from app.domain.analytics.drawdown import drawdown_series
-from app.domain.analytics.returns import log_returns
-from app.domain.analytics.volatility import rolling_std
+from app.domain.analytics.frame import epoch_to_datetime
+from app.domain.analytics.returns import log_return_values
+from app.domain.analytics.volatility import rolling_std_values
 from app.services.market_data.assets_inventory import build_assets_inventory
 from app.services.market_data.reader import NormalizedCsvReader
+from app.services.market_data.series_cache import SeriesCacheKey, series_cache_key
 
 SUMMARY_WINDOW = 30
 
@@ -35,69 +39,134 @@ def _pick_summary_timeframe(timeframes: list[str]) -> str:
     return timeframes[0]
 
 
-def _compute_return_30(close_points: list[tuple[datetime, float]]) -> float | None:
-    if len(close_points) <= SUMMARY_WINDOW:
+def _compute_return_30(closes: Sequence[float]) -> float | None:
+    if len(closes) <= SUMMARY_WINDOW:
         return None
 
-    base_close = close_points[-(SUMMARY_WINDOW + 1)][1]
-    last_close = close_points[-1][1]
+    base_close = closes[-(SUMMARY_WINDOW + 1)]
+    last_close = closes[-1]
     if base_close == 0:
         return None
     return (last_close / base_close) - 1.0
 
 
-def _compute_volatility_30(close_points: list[tuple[datetime, float]]) -> float | None:
-    returns_points = log_returns(close_points)
-    values = [(r.timestamp_utc, r.value) for r in returns_points]
-    volatility_points = rolling_std(values=values, window=SUMMARY_WINDOW)
-    if not volatility_points:
+def _compute_volatility_30(closes: Sequence[float]) -> float | None:
+    volatility = rolling_std_values(log_return_values(closes), window=SUMMARY_WINDOW)
+    if not volatility:
         return None
-    return volatility_points[-1].value
+    return volatility[-1]
+
+
+def _summarize(
+    reader: NormalizedCsvReader,
+    asset: dict[str, object],
+    timeframes: list[str],
+    summary_timeframe: str,
+) -> AssetSummary:
+    symbol = str(asset["symbol"])
+    # Headline numbers come from the persisted analytics state, which ingestion keeps
+    # current; a missing or stale state is rebuilt from the series once.
+    state = reader.read_series_state(symbol, summary_timeframe)
+    if state is None:
+        state = reader.build_series_state(symbol, summary_timeframe)
+    closes = state.recent_closes
+
+    last_timestamp_utc = (
+        epoch_to_datetime(state.last_timestamp) if state.last_timestamp is not None else None
+    )
+
+    return AssetSummary(
+        symbol=symbol,
+        name=str(asset["name"]),
+        asset_class=str(asset["asset_class"]),
+        currency=str(asset["currency"]),
+        available_timeframes=timeframes,
+        summary_timeframe=summary_timeframe,
+        summary_window=SUMMARY_WINDOW,
+        last_timestamp_utc=last_timestamp_utc,
+        last_close=state.last_close,
+        return_30=_compute_return_30(closes),
+        volatility_30=_compute_volatility_30(closes[-(SUMMARY_WINDOW + 1) :]),
+        max_drawdown=state.max_drawdown,
+    )
+
+
+# An overview row stays valid while its timeframes and the (path, mtime, size) of the file it
+# summarizes are unchanged.
+@dataclass(frozen=True)
+class _OverviewEntry:
+    timeframes: tuple[str, ...]
+    key: SeriesCacheKey
+    summary: AssetSummary
+
+
+# Materialized overview: rows are kept between requests and only assets whose file changed
+# are recomputed.
+class MaterializedOverview:
+    def __init__(self) -> None:
+        self._entries: dict[str, _OverviewEntry] = {}
+        self._lock = threading.Lock()
+
+    def rows(self, normalized_dir: Path) -> list[AssetSummary]:
+        summaries, _ = self._update(normalized_dir)
+        return summaries
+
+    def refresh(self, normalized_dir: Path) -> list[str]:
+        # Recomputes stale rows only and returns their symbols.
+        _, refreshed = self._update(normalized_dir)
+        return refreshed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _update(self, normalized_dir: Path) -> tuple[list[AssetSummary], list[str]]:
+        reader = NormalizedCsvReader(normalized_dir=normalized_dir, track_access=False)
+        with self._lock:
+            entries = dict(self._entries)
+
+        current: dict[str, _OverviewEntry] = {}
+        refreshed: list[str] = []
+        for asset in build_assets_inventory(normalized_dir):
+            timeframes = list(asset["timeframes"])
+            if not timeframes:
+                continue
+
+            symbol = str(asset["symbol"])
+            summary_timeframe = _pick_summary_timeframe(timeframes)
+            try:
+                key = series_cache_key(normalized_dir / f"{symbol}_{summary_timeframe}.csv")
+            except FileNotFoundError:
+                continue
+
+            entry = entries.get(symbol)
+            if entry is None or entry.key != key or entry.timeframes != tuple(timeframes):
+                summary = _summarize(reader, asset, timeframes, summary_timeframe)
+                entry = _OverviewEntry(timeframes=tuple(timeframes), key=key, summary=summary)
+                refreshed.append(symbol)
+            current[symbol] = entry
+
+        # Assets whose files are gone drop out of the table.
+        with self._lock:
+            self._entries = current
+        return [entry.summary for entry in current.values()], refreshed
+
+
+_shared_overview: MaterializedOverview | None = None
+_shared_overview_lock = threading.Lock()
+
+
+def get_materialized_overview() -> MaterializedOverview:
+    global _shared_overview
+    with _shared_overview_lock:
+        if _shared_overview is None:
+            _shared_overview = MaterializedOverview()
+        return _shared_overview
 
 
-def _compute_max_drawdown(close_points: list[tuple[datetime, float]]) -> float | None:
-    dd_points = drawdown_series(close_points)
-    if not dd_points:
-        return None
-    return min(point.value for point in dd_points)
+def build_assets_overview() -> list[AssetSummary]:
+    return get_materialized_overview().rows(get_normalized_data_dir())
 
 
-def build_assets_overview() -> list[AssetSummary]:
-    assets = build_assets_inventory()
-    reader = NormalizedCsvReader(normalized_dir=get_normalized_data_dir())
-
-    summaries: list[AssetSummary] = []
-    for asset in assets:
-        timeframes = list(asset["timeframes"])
-        if not timeframes:
-            continue
-
-        summary_timeframe = _pick_summary_timeframe(timeframes)
-        points = reader.read_close_series(
-            symbol=str(asset["symbol"]),
-            timeframe=summary_timeframe,
-            limit=5000,
-        )
-        close_points = [(p.timestamp_utc, p.close) for p in points]
-
-        last_timestamp_utc = points[-1].timestamp_utc if points else None
-        last_close = points[-1].close if points else None
-
-        summaries.append(
-            AssetSummary(
-                symbol=str(asset["symbol"]),
-                name=str(asset["name"]),
-                asset_class=str(asset["asset_class"]),
-                currency=str(asset["currency"]),
-                available_timeframes=timeframes,
-                summary_timeframe=summary_timeframe,
-                summary_window=SUMMARY_WINDOW,
-                last_timestamp_utc=last_timestamp_utc,
-                last_close=last_close,
-                return_30=_compute_return_30(close_points),
-                volatility_30=_compute_volatility_30(close_points),
-                max_drawdown=_compute_max_drawdown(close_points),
-            )
-        )
-
-    return summaries
+def refresh_assets_overview() -> list[str]:
+    return get_materialized_overview().refresh(get_normalized_data_dir())
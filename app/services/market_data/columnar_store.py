@@ -0,0 +1,138 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+# Layout: header, then one contiguous little-endian column per field, each `rows * 8` bytes:
+# timestamp (int64 epoch seconds), open, high, low, close, volume (float64).
+SIDECAR_SUFFIX = ".qlc"
+SIDECAR_MAGIC = b"QLCOL\x00\x01\x00"
+SIDECAR_HEADER = struct.Struct("<8sQqq")  # magic, rows, source size, source mtime_ns
+VALUE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+OhlcvRow = tuple[int, float, float, float, float, float]
+
+
+@dataclass(frozen=True)
+class ColumnarSeries:
+    timestamps: memoryview
+    open: memoryview
+    high: memoryview
+    low: memoryview
+    close: memoryview
+    volume: memoryview
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def tail(self, limit: int) -> "ColumnarSeries":
+        return self.slice(max(0, len(self) - limit), len(self))
+
+    def slice(self, start: int, stop: int) -> "ColumnarSeries":
+        return ColumnarSeries(
+            timestamps=self.timestamps[start:stop],
+            open=self.open[start:stop],
+            high=self.high[start:stop],
+            low=self.low[start:stop],
+            close=self.close[start:stop],
+            volume=self.volume[start:stop],
+        )
+
+
+def sidecar_path(csv_path: Path) -> Path:
+    return csv_path.with_suffix(SIDECAR_SUFFIX)
+
+
+def write_sidecar(
+    csv_path: Path,
+    rows: Iterable[OhlcvRow],
+    source: os.stat_result | None = None,
+) -> Path:
+    # Stamped with `source` when the rows were read from an earlier version of the CSV.
+    ordered = sorted(rows, key=lambda row: row[0])
+    timestamps = array("q", (row[0] for row in ordered))
+    columns = [array("d", (row[i] for row in ordered)) for i in range(1, 6)]
+    return _write_columns(csv_path, timestamps, columns, source=source)
+
+
+def extend_sidecar(csv_path: Path, previous: ColumnarSeries, rows: Sequence[OhlcvRow]) -> Path:
+    # `previous` maps the sidecar as it was before `rows` were appended to the CSV; its columns
+    # are copied as raw bytes, so only the new rows are converted.
+    timestamps = array("q")
+    timestamps.frombytes(previous.timestamps.cast("B"))
+    timestamps.extend(row[0] for row in rows)
+    columns: list[array] = []
+    for i, name in enumerate(VALUE_COLUMNS, start=1):
+        column = array("d")
+        column.frombytes(getattr(previous, name).cast("B"))
+        column.extend(row[i] for row in rows)
+        columns.append(column)
+    return _write_columns(csv_path, timestamps, columns)
+
+
+def _write_columns(
+    csv_path: Path,
+    timestamps: array,
+    columns: list[array],
+    source: os.stat_result | None = None,
+) -> Path:
+    if sys.byteorder != "little":
+        timestamps.byteswap()
+        for column in columns:
+            column.byteswap()
+
+    stat = source if source is not None else csv_path.stat()
+    output_path = sidecar_path(csv_path)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    with tmp_path.open("wb") as f:
+        f.write(SIDECAR_HEADER.pack(SIDECAR_MAGIC, len(timestamps), stat.st_size, stat.st_mtime_ns))
+        f.write(timestamps.tobytes())
+        for column in columns:
+            f.write(column.tobytes())
+
+    # Atomic replace keeps existing memory maps of the previous version valid.
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+def open_sidecar(csv_path: Path) -> ColumnarSeries | None:
+    # Zero-copy views need native little-endian int64/float64.
+    if sys.byteorder != "little":
+        return None
+
+    path = sidecar_path(csv_path)
+    try:
+        source_stat = csv_path.stat()
+        with path.open("rb") as f:
+            header = f.read(SIDECAR_HEADER.size)
+            if len(header) < SIDECAR_HEADER.size:
+                return None
+
+            magic, rows, source_size, source_mtime_ns = SIDECAR_HEADER.unpack(header)
+            if magic != SIDECAR_MAGIC:
+                return None
+            if source_size != source_stat.st_size or source_mtime_ns != source_stat.st_mtime_ns:
+                return None
+
+            expected_size = SIDECAR_HEADER.size + rows * 8 * (1 + len(VALUE_COLUMNS))
+            if os.fstat(f.fileno()).st_size != expected_size:
+                return None
+
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        return None
+
+    buffer = memoryview(mapped)
+    column_size = rows * 8
+    offset = SIDECAR_HEADER.size
+    timestamps = buffer[offset : offset + column_size].cast("q")
+    values: list[memoryview] = []
+    for i in range(len(VALUE_COLUMNS)):
+        start = offset + column_size * (i + 1)
+        values.append(buffer[start : start + column_size].cast("d"))
+
+    return ColumnarSeries(timestamps, *values)
@@ -0,0 +1,57 @@
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+MANIFEST_SUFFIX = ".meta.json"
+
+
+@dataclass(frozen=True)
+class SeriesManifest:
+    source_size: int
+    source_mtime_ns: int
+    rows: int
+    is_sorted: bool
+
+
+def manifest_path(csv_path: Path) -> Path:
+    return csv_path.with_name(csv_path.stem + MANIFEST_SUFFIX)
+
+
+def write_manifest(
+    csv_path: Path,
+    rows: int,
+    is_sorted: bool,
+    source: os.stat_result | None = None,
+) -> Path:
+    # Stamped with `source` when the rows were counted in an earlier version of the CSV.
+    stat = source if source is not None else csv_path.stat()
+    manifest = SeriesManifest(
+        source_size=stat.st_size,
+        source_mtime_ns=stat.st_mtime_ns,
+        rows=rows,
+        is_sorted=is_sorted,
+    )
+
+    output_path = manifest_path(csv_path)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(asdict(manifest)), encoding="utf-8")
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+def read_manifest(csv_path: Path) -> SeriesManifest | None:
+    try:
+        source_stat = csv_path.stat()
+        payload = json.loads(manifest_path(csv_path).read_text(encoding="utf-8"))
+        manifest = SeriesManifest(**payload)
+    except (FileNotFoundError, ValueError, TypeError):
+        return None
+
+    # A manifest describes one exact version of the CSV; any rewrite makes it stale.
+    if (
+        manifest.source_size != source_stat.st_size
+        or manifest.source_mtime_ns != source_stat.st_mtime_ns
+    ):
+        return None
+    return manifest
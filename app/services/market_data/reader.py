@@ -1,7 +1,48 @@
 import csv
+import math
+import multiprocessing
+import os
+import sys
+import threading
+from array import array
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO
+
+from app.core.settings import get_read_processes, get_read_workers
+from app.domain.analytics.frame import SeriesFrame, epoch_to_datetime
+from app.services.market_data.access_stats import get_access_stats
+from app.services.market_data.asset_catalog import AssetCatalog, get_asset_catalog
+from app.services.market_data.columnar_store import ColumnarSeries, OhlcvRow, open_sidecar
+from app.services.market_data.manifest import SeriesManifest, read_manifest, write_manifest
+from app.services.market_data.series_cache import (
+    SeriesCache,
+    SeriesCacheKey,
+    get_series_cache,
+    series_cache_key,
+)
+from app.services.market_data.series_state import SeriesState, build_state, read_state, write_state
+from app.services.market_data.shared_store import SharedSeriesStore, get_shared_series_store
+from app.services.market_data.timestamp_index import open_index
+from app.services.market_data.timestamps import (
+    as_utc,
+    make_epoch_decoder,
+    parse_timestamp_utc,
+)
+
+_OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+_TAIL_MIN_BLOCK_SIZE = 4096
+_TAIL_ROW_SIZE_ESTIMATE = 96
+# Streamed series are read in 256 KiB pieces and sent in frames of at most 4096 rows.
+_STREAM_READ_BYTES = 256 * 1024
+_STREAM_BLOCK_ROWS = 4096
+# Below this size a file parses faster in-process than the round trip to a worker costs.
+_PROCESS_PARSE_MIN_BYTES = 256 * 1024
+# Fixed per-entry overhead (frame, dict, memoryviews) added to the column bytes for budgeting.
+_FRAME_OVERHEAD_BYTES = 512
 
 
 @dataclass(frozen=True)
@@ -10,52 +51,531 @@ class PricePoint:
     close: float
 
 
+# Frames of the symbols that could be read, in request order, and the error raised for each
+# symbol that could not.
+@dataclass(frozen=True)
+class ReadManyResult:
+    frames: dict[str, SeriesFrame]
+    errors: dict[str, Exception]
+
+
+# A cache entry holds either the whole series or, after a tail read, only its newest rows.
+@dataclass(frozen=True)
+class _CachedCloseFrame:
+    frame: SeriesFrame
+    complete: bool
+
+
 class NormalizedCsvReader:
-    def __init__(self, normalized_dir: Path) -> None:
+    def __init__(
+        self,
+        normalized_dir: Path,
+        cache: SeriesCache | None = None,
+        use_sidecar: bool = True,
+        catalog: AssetCatalog | None = None,
+        shared_store: SharedSeriesStore | None = None,
+        track_access: bool = True,
+    ) -> None:
         self._dir = normalized_dir
+        self._cache = cache if cache is not None else get_series_cache()
+        self._use_sidecar = use_sidecar
+        self._catalog = catalog if catalog is not None else get_asset_catalog(normalized_dir)
+        self._store = shared_store if shared_store is not None else get_shared_series_store()
+        # Reads made for the API count towards the series ranked first by the warm-up.
+        self._access_stats = get_access_stats() if track_access else None
+
+    def _series_path(self, symbol: str, timeframe: str) -> Path:
+        # Unknown series are rejected from the catalog without touching the file system.
+        path = self._dir / f"{symbol}_{timeframe}.csv"
+        if not self._catalog.contains(symbol, timeframe):
+            raise FileNotFoundError(str(path))
+        if self._access_stats is not None:
+            self._access_stats.record(symbol, timeframe)
+        return path
 
     def _parse_timestamp(self, raw: str) -> datetime:
-        value = raw.strip()
-        if value == "":
-            raise ValueError("empty timestamp")
+        return parse_timestamp_utc(raw)
 
-        # If format is "YYYY-MM-DD HH:MM:SS" (CryptoDataDownload), treat as UTC.
-        if "T" not in value and " " in value:
-            dt = datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
-            return dt.replace(tzinfo=UTC)
+    def read_close_series(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[PricePoint]:
+        frame = self.read_close_frame(symbol, timeframe, limit, start=start, end=end)
+        return [
+            PricePoint(timestamp_utc=epoch_to_datetime(ts), close=close)
+            for ts, close in zip(frame.timestamps, frame.column("close"), strict=True)
+        ]
 
-        # Otherwise try ISO 8601 (with or without timezone).
-        dt = datetime.fromisoformat(value)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=UTC)
-        return dt
+    def read_close_frame(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> SeriesFrame:
+        path = self._series_path(symbol, timeframe)
+        try:
+            key = series_cache_key(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(str(path)) from None
 
-    def read_close_series(self, symbol: str, timeframe: str, limit: int) -> list[PricePoint]:
-        if limit <= 0:
-            return []
+        start_ts = math.ceil(as_utc(start).timestamp()) if start is not None else None
+        end_ts = math.floor(as_utc(end).timestamp()) if end is not None else None
+        if limit <= 0 or (start_ts is not None and end_ts is not None and start_ts > end_ts):
+            return SeriesFrame.empty("close")
 
-        path = self._dir / f"{symbol}_{timeframe}.csv"
-        if not path.exists():
-            raise FileNotFoundError(str(path))
+        cached = self._cache.get(key)
+        if isinstance(cached, _CachedCloseFrame) and _covers(cached, limit, start_ts, end_ts):
+            return cached.frame.between(start_ts, end_ts).tail(limit)
+
+        if self._use_sidecar:
+            columns = self._open_columns(path, key)
+            if columns is not None:
+                frame = SeriesFrame(timestamps=columns.timestamps, columns={"close": columns.close})
+                return frame.between(start_ts, end_ts).tail(limit)
+
+        if start_ts is not None or end_ts is not None:
+            ranged = self._read_indexed_close_frame(path, limit, start_ts, end_ts)
+            if ranged is not None:
+                return ranged
+        else:
+            manifest = read_manifest(path)
+            if manifest is not None and manifest.is_sorted:
+                tail = self._read_tail_close_frame(path, limit)
+                if tail is not None:
+                    entry = _CachedCloseFrame(frame=tail, complete=len(tail) < limit)
+                    self._cache.put(key, entry, size_bytes=tail.nbytes + _FRAME_OVERHEAD_BYTES)
+                    return tail
+
+        frame = self._parse_close_frame(path)
+        entry = _CachedCloseFrame(frame=frame, complete=True)
+        self._cache.put(key, entry, size_bytes=frame.nbytes + _FRAME_OVERHEAD_BYTES)
+        return frame.between(start_ts, end_ts).tail(limit)
+
+    def iter_close_blocks(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Iterator[SeriesFrame]:
+        # The closes inside [start, end] in timestamp order, as frames of a few thousand rows.
+        # A sorted CSV that is not cached or mapped yet is parsed while it is streamed, so
+        # memory stays constant whatever the length of the history. A missing series raises
+        # here rather than on the first iteration.
+        path = self._series_path(symbol, timeframe)
+        try:
+            key = series_cache_key(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(str(path)) from None
+
+        start_ts = math.ceil(as_utc(start).timestamp()) if start is not None else None
+        end_ts = math.floor(as_utc(end).timestamp()) if end is not None else None
+        if start_ts is not None and end_ts is not None and start_ts > end_ts:
+            return iter(())
+
+        cached = self._cache.get(key)
+        if isinstance(cached, _CachedCloseFrame) and cached.complete:
+            return cached.frame.between(start_ts, end_ts).blocks(_STREAM_BLOCK_ROWS)
 
-        points: list[PricePoint] = []
-        with path.open("r", encoding="utf-8", newline="") as f:
+        if self._use_sidecar:
+            columns = self._open_columns(path, key)
+            if columns is not None:
+                frame = SeriesFrame(timestamps=columns.timestamps, columns={"close": columns.close})
+                return frame.between(start_ts, end_ts).blocks(_STREAM_BLOCK_ROWS)
+
+        manifest = read_manifest(path)
+        if manifest is None:
+            manifest = _scan_manifest(path)
+        if manifest is not None and manifest.is_sorted:
+            return _stream_close_blocks(path, start_ts, end_ts)
+
+        frame = self.read_close_frame(symbol, timeframe, sys.maxsize, start=start, end=end)
+        return frame.blocks(_STREAM_BLOCK_ROWS)
+
+    def read_many(
+        self,
+        symbols: Sequence[str],
+        timeframe: str,
+        limit: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> ReadManyResult:
+        # Symbols are read concurrently on a shared, bounded pool; file reads and memory maps
+        # release the GIL, so a batch costs about as much as its slowest file.
+        def read(symbol: str) -> SeriesFrame:
+            return self.read_close_frame(symbol, timeframe, limit, start=start, end=end)
+
+        executor = _get_read_executor()
+        futures = [executor.submit(read, symbol) for symbol in symbols]
+
+        frames: dict[str, SeriesFrame] = {}
+        errors: dict[str, Exception] = {}
+        for symbol, future in zip(symbols, futures, strict=True):
+            error = future.exception()
+            if error is None:
+                frames[symbol] = future.result()
+            elif isinstance(error, Exception):
+                errors[symbol] = error
+            else:
+                raise error
+        return ReadManyResult(frames=frames, errors=errors)
+
+    def read_series_state(self, symbol: str, timeframe: str) -> SeriesState | None:
+        # The persisted state, or None when it is missing or describes an older CSV.
+        return read_state(self._series_path(symbol, timeframe))
+
+    def build_series_state(self, symbol: str, timeframe: str) -> SeriesState:
+        path = self._series_path(symbol, timeframe)
+        try:
+            source = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(str(path)) from None
+
+        frame = self.read_close_frame(symbol, timeframe, limit=sys.maxsize)
+        state = build_state(frame.timestamps, frame.column("close"))
+        try:
+            # Stamped with the version read above, so a concurrent rewrite leaves it stale.
+            return write_state(path, state, source=source)
+        except OSError:
+            return state
+
+    def read_columns(self, symbol: str, timeframe: str, limit: int) -> ColumnarSeries:
+        path = self._series_path(symbol, timeframe)
+        columns = None
+        if self._use_sidecar:
+            try:
+                columns = self._open_columns(path, series_cache_key(path))
+            except FileNotFoundError:
+                raise FileNotFoundError(str(path)) from None
+        if columns is None:
+            rows = self.read_ohlcv_rows(path)
+            columns = ColumnarSeries(
+                memoryview(array("q", (row[0] for row in rows))),
+                *(memoryview(array("d", (row[i] for row in rows))) for i in range(1, 6)),
+            )
+
+        return columns.tail(max(limit, 0))
+
+    def _open_columns(self, path: Path, key: SeriesCacheKey) -> ColumnarSeries | None:
+        if self._store is None:
+            return open_sidecar(path)
+        # With a shared store the first read on the host builds the sidecar; other processes
+        # and later reads map it instead of parsing the CSV themselves.
+        return self._store.load(path, key, lambda csv_path: self.read_ohlcv_rows(csv_path, False))
+
+    def read_ohlcv_rows(self, path: Path, sort: bool = True) -> list[OhlcvRow]:
+        rows: list[OhlcvRow] = []
+        decode = make_epoch_decoder()
+        with path.open("r", encoding="utf-8-sig", newline="") as f:
             reader = csv.DictReader(f)
             for row in reader:
+                # Rows are kept or skipped by the same rule as the close readers, so sidecars
+                # built from these rows hold the same series as the CSV; only the other fields
+                # default to 0.
                 ts_str = (row.get("timestamp_utc") or row.get("date") or "").strip()
                 close_str = (row.get("close") or "").strip()
                 if ts_str == "" or close_str == "":
                     continue
 
                 try:
-                    ts = self._parse_timestamp(ts_str)
+                    ts = decode(ts_str)
                     close = float(close_str)
                 except ValueError:
                     continue
 
-                points.append(PricePoint(timestamp_utc=ts, close=close))
+                values = [
+                    close if name == "close" else _optional_float(row.get(name))
+                    for name in _OHLCV_FIELDS
+                ]
+                rows.append((ts, *values))
+
+        if sort:
+            rows.sort(key=lambda r: r[0])
+        return rows
+
+    def _read_indexed_close_frame(
+        self,
+        path: Path,
+        limit: int,
+        start_ts: int | None,
+        end_ts: int | None,
+    ) -> SeriesFrame | None:
+        index = open_index(path)
+        if index is None:
+            return None
+
+        lo, hi = index.row_range(start_ts, end_ts)
+        lo = max(lo, hi - limit)
+        if lo >= hi:
+            return SeriesFrame.empty("close")
+
+        # Only the bytes of the selected rows are read, whatever the size of the file.
+        begin, stop = index.byte_range(lo, hi)
+        with path.open("rb") as f:
+            columns = _read_header_columns(f)
+            if columns is None:
+                return None
+            f.seek(begin)
+            lines = f.read(stop - begin).decode("utf-8").split("\n")
+
+        timestamps, closes = _parse_close_lines(lines, *columns)
+        return SeriesFrame(
+            timestamps=memoryview(timestamps),
+            columns={"close": memoryview(closes)},
+        )
+
+    def _read_tail_close_frame(self, path: Path, limit: int) -> SeriesFrame | None:
+        # Reads blocks backwards from EOF until `limit` valid rows are found or the header is
+        # reached, so the cost depends on `limit` rather than on the length of the history.
+        with path.open("rb") as f:
+            columns = _read_header_columns(f)
+            if columns is None:
+                return None
+
+            data_start = f.tell()
+            position = f.seek(0, os.SEEK_END)
+            blocks: list[tuple[array, array]] = []
+            rows = 0
+            remainder = b""
+            block_size = max(_TAIL_MIN_BLOCK_SIZE, (limit + 1) * _TAIL_ROW_SIZE_ESTIMATE)
+            while True:
+                read_size = min(block_size, position - data_start)
+                position -= read_size
+                f.seek(position)
+                lines = (f.read(read_size) + remainder).split(b"\n")
+                block_size *= 2
+
+                # The first line may start mid-row; keep it for the next, earlier block.
+                remainder = lines.pop(0) if position > data_start else b""
+                block = _parse_close_lines([line.decode("utf-8") for line in lines], *columns)
+                blocks.append(block)
+                rows += len(block[0])
+                if rows >= limit or position <= data_start:
+                    break
+
+        timestamps = array("q")
+        closes = array("d")
+        for block_timestamps, block_closes in reversed(blocks):
+            timestamps.extend(block_timestamps)
+            closes.extend(block_closes)
+
+        # The manifest is trusted for ordering, but a disordered tail is still caught here.
+        if not _is_sorted(timestamps):
+            return None
+
+        frame = SeriesFrame(
+            timestamps=memoryview(timestamps), columns={"close": memoryview(closes)}
+        )
+        return frame.tail(limit)
+
+    def _parse_close_frame(self, path: Path) -> SeriesFrame:
+        # Large files are parsed in a worker process when READ_PROCESSES is set, so the
+        # threads of a read_many batch do not all wait on this process' GIL.
+        executor = _get_parse_executor()
+        if executor is not None and path.stat().st_size >= _PROCESS_PARSE_MIN_BYTES:
+            timestamps, closes = executor.submit(_parse_close_arrays, path).result()
+        else:
+            timestamps, closes = _parse_close_arrays(path)
+        return SeriesFrame(timestamps=memoryview(timestamps), columns={"close": memoryview(closes)})
+
+
+def _parse_close_arrays(path: Path) -> tuple[array, array]:
+    timestamps = array("q")
+    closes = array("d")
+    decode = make_epoch_decoder()
+    with path.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            ts_str = (row.get("timestamp_utc") or row.get("date") or "").strip()
+            close_str = (row.get("close") or "").strip()
+            if ts_str == "" or close_str == "":
+                continue
+
+            try:
+                ts = decode(ts_str)
+                close = float(close_str)
+            except ValueError:
+                continue
+
+            timestamps.append(ts)
+            closes.append(close)
+
+    if not _is_sorted(timestamps):
+        # Stable, like sorting the rows themselves: equal timestamps keep file order.
+        order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+        timestamps = array("q", (timestamps[i] for i in order))
+        closes = array("d", (closes[i] for i in order))
+
+    return timestamps, closes
+
+
+def _stream_close_blocks(
+    path: Path,
+    start_ts: int | None,
+    end_ts: int | None,
+) -> Iterator[SeriesFrame]:
+    # Relies on the manifest for ordering: rows before `start_ts` are skipped through the index
+    # when there is one, and reading stops at the first row after `end_ts`.
+    index = open_index(path) if start_ts is not None else None
+    with path.open("rb") as f:
+        columns = _read_header_columns(f)
+        if columns is None:
+            return
+        if index is not None:
+            lo, _ = index.row_range(start_ts, None)
+            f.seek(index.byte_range(lo, lo)[0])
+
+        remainder = b""
+        while True:
+            data = f.read(_STREAM_READ_BYTES)
+            lines = (remainder + data).split(b"\n")
+            # The last line may be cut off; it is completed by the next read.
+            remainder = lines.pop() if data else b""
+            timestamps, closes = _parse_close_lines(
+                [line.decode("utf-8") for line in lines], *columns
+            )
+            block = SeriesFrame(
+                timestamps=memoryview(timestamps), columns={"close": memoryview(closes)}
+            )
+            block = block.between(start_ts, end_ts)
+            if len(block) > 0:
+                yield block
+            if not data or (end_ts is not None and timestamps and timestamps[-1] > end_ts):
+                return
+
+
+def _scan_manifest(path: Path) -> SeriesManifest | None:
+    # One streaming pass that finds out whether the CSV is sorted and records it, so this and
+    # later reads of the file can stream it (or read its tail) instead of parsing it whole.
+    try:
+        source = path.stat()
+    except FileNotFoundError:
+        return None
+
+    rows = 0
+    is_sorted = True
+    last: int | None = None
+    for block in _stream_close_blocks(path, None, None):
+        timestamps = block.timestamps
+        if (last is not None and timestamps[0] < last) or not _is_sorted(timestamps):
+            is_sorted = False
+        rows += len(block)
+        last = timestamps[-1]
+
+    try:
+        write_manifest(path, rows=rows, is_sorted=is_sorted, source=source)
+    except OSError:
+        pass
+    return SeriesManifest(
+        source_size=source.st_size,
+        source_mtime_ns=source.st_mtime_ns,
+        rows=rows,
+        is_sorted=is_sorted,
+    )
+
+
+def _parse_close_lines(lines: list[str], ts_index: int, close_index: int) -> tuple[array, array]:
+    timestamps = array("q")
+    closes = array("d")
+    decode = make_epoch_decoder()
+    for row in csv.reader(lines):
+        if len(row) <= max(ts_index, close_index):
+            continue
+
+        ts_str = row[ts_index].strip()
+        close_str = row[close_index].strip()
+        if ts_str == "" or close_str == "":
+            continue
+
+        try:
+            ts = decode(ts_str)
+            close = float(close_str)
+        except ValueError:
+            continue
+
+        timestamps.append(ts)
+        closes.append(close)
+    return timestamps, closes
+
+
+def _read_header_columns(f: BinaryIO) -> tuple[int, int] | None:
+    header = next(csv.reader([f.readline().decode("utf-8-sig")]), [])
+    ts_index = _column_index(header, ("timestamp_utc", "date"))
+    close_index = _column_index(header, ("close",))
+    if ts_index is None or close_index is None:
+        return None
+    return ts_index, close_index
+
+
+def _column_index(header: list[str], names: tuple[str, ...]) -> int | None:
+    stripped = [name.strip() for name in header]
+    for name in names:
+        if name in stripped:
+            return stripped.index(name)
+    return None
+
+
+def _optional_float(value: str | None) -> float:
+    try:
+        return float((value or "").strip())
+    except ValueError:
+        return 0.0
+
+
+def _is_sorted(timestamps: array) -> bool:
+    return all(timestamps[i - 1] <= timestamps[i] for i in range(1, len(timestamps)))
+
+
+def _covers(
+    cached: _CachedCloseFrame,
+    limit: int,
+    start_ts: int | None,
+    end_ts: int | None,
+) -> bool:
+    if cached.complete:
+        return True
+    if len(cached.frame) == 0:
+        return False
+    # A partial entry is a suffix of the series, so it covers any range starting inside it.
+    if start_ts is not None:
+        return cached.frame.timestamps[0] <= start_ts
+    if end_ts is not None:
+        return False
+    return len(cached.frame) >= limit
+
+
+_read_executor: ThreadPoolExecutor | None = None
+_parse_executor: ProcessPoolExecutor | None = None
+_executors_lock = threading.Lock()
+
+
+def _get_read_executor() -> ThreadPoolExecutor:
+    global _read_executor
+    with _executors_lock:
+        if _read_executor is None:
+            _read_executor = ThreadPoolExecutor(
+                max_workers=get_read_workers(),
+                thread_name_prefix="series-read",
+            )
+        return _read_executor
+
 
-        points.sort(key=lambda p: p.timestamp_utc)
-        if len(points) > limit:
-            points = points[-limit:]
-        return points
+def _get_parse_executor() -> ProcessPoolExecutor | None:
+    global _parse_executor
+    processes = get_read_processes()
+    if processes == 0:
+        return None
+    with _executors_lock:
+        if _parse_executor is None:
+            # Spawned rather than forked: the server process runs threads.
+            _parse_executor = ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _parse_executor
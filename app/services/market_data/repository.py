@@ -1,8 +1,38 @@
 import csv
+import io
+import os
 from collections.abc import Iterable
 from pathlib import Path
 
 from app.schemas.market_data import OhlcvBar
+from app.services.market_data.columnar_store import (
+    OhlcvRow,
+    extend_sidecar,
+    open_sidecar,
+    write_sidecar,
+)
+from app.services.market_data.manifest import read_manifest, write_manifest
+from app.services.market_data.reader import NormalizedCsvReader
+from app.services.market_data.series_cache import get_series_cache
+from app.services.market_data.series_state import (
+    advance_state,
+    build_state,
+    read_state,
+    write_state,
+)
+from app.services.market_data.timestamp_index import build_index, extend_index, open_index
+
+_CSV_HEADER = [
+    "symbol",
+    "timestamp_utc",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "source",
+    "timeframe",
+]
 
 
 class MarketDataRepository:
@@ -10,35 +40,107 @@ class MarketDataRepository:
         self._normalized_dir = normalized_dir
 
     def write_bars_csv(self, bars: Iterable[OhlcvBar], symbol: str, timeframe: str) -> Path:
+        bars = sorted(bars, key=lambda bar: bar.timestamp_utc)
         self._normalized_dir.mkdir(parents=True, exist_ok=True)
         output_path = self._normalized_dir / f"{symbol}_{timeframe}.csv"
         with output_path.open("w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
-            writer.writerow(
-                [
-                    "symbol",
-                    "timestamp_utc",
-                    "open",
-                    "high",
-                    "low",
-                    "close",
-                    "volume",
-                    "source",
-                    "timeframe",
-                ]
-            )
+            writer.writerow(_CSV_HEADER)
             for bar in bars:
-                writer.writerow(
-                    [
-                        bar.symbol,
-                        bar.timestamp_utc.isoformat(),
-                        bar.open,
-                        bar.high,
-                        bar.low,
-                        bar.close,
-                        bar.volume,
-                        bar.source,
-                        bar.timeframe,
-                    ]
-                )
+                writer.writerow(_csv_row(bar))
+
+        write_sidecar(output_path, (_ohlcv_row(bar) for bar in bars))
+        write_manifest(output_path, rows=len(bars), is_sorted=True)
+        build_index(output_path)
+        write_state(
+            output_path,
+            build_state(
+                [int(bar.timestamp_utc.timestamp()) for bar in bars],
+                [bar.close for bar in bars],
+            ),
+        )
+        get_series_cache().invalidate(output_path)
+        return output_path
+
+    def append_bars(self, bars: Iterable[OhlcvBar], symbol: str, timeframe: str) -> Path:
+        # Appends only bars newer than the series' last timestamp and advances the sidecar,
+        # index and analytics state by those rows instead of rebuilding them from the CSV.
+        output_path = self._normalized_dir / f"{symbol}_{timeframe}.csv"
+        if not output_path.exists():
+            return self.write_bars_csv(bars, symbol=symbol, timeframe=timeframe)
+
+        state = read_state(output_path)
+        if state is None:
+            reader = NormalizedCsvReader(normalized_dir=self._normalized_dir, track_access=False)
+            state = reader.build_series_state(symbol, timeframe)
+
+        new_bars: list[OhlcvBar] = []
+        last_timestamp = state.last_timestamp
+        for bar in sorted(bars, key=lambda bar: bar.timestamp_utc):
+            ts = int(bar.timestamp_utc.timestamp())
+            if last_timestamp is None or ts > last_timestamp:
+                new_bars.append(bar)
+                last_timestamp = ts
+        if not new_bars:
+            return output_path
+
+        # Only artifacts that match the CSV before the append can be extended.
+        manifest = read_manifest(output_path)
+        columns = open_sidecar(output_path)
+        index = open_index(output_path)
+
+        rows = [_ohlcv_row(bar) for bar in new_bars]
+        offsets: list[int] = []
+        with output_path.open("r+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            if end > 0:
+                f.seek(end - 1)
+                if f.read(1) != b"\n":
+                    f.write(b"\r\n")
+                    end += 2
+            for bar in new_bars:
+                line = io.StringIO()
+                csv.writer(line).writerow(_csv_row(bar))
+                encoded = line.getvalue().encode("utf-8")
+                offsets.append(end)
+                f.write(encoded)
+                end += len(encoded)
+
+        if manifest is not None:
+            # Appended rows are newer than every existing row, so ordering is unchanged.
+            write_manifest(
+                output_path, rows=manifest.rows + len(rows), is_sorted=manifest.is_sorted
+            )
+        if columns is not None:
+            extend_sidecar(output_path, columns, rows)
+        if index is not None:
+            # Every appended row comes from a validated bar, so each one gets an index entry.
+            extend_index(output_path, index, [row[0] for row in rows], offsets)
+        write_state(output_path, advance_state(state, ((row[0], row[4]) for row in rows)))
+        get_series_cache().invalidate(output_path)
         return output_path
+
+
+def _csv_row(bar: OhlcvBar) -> list[object]:
+    return [
+        bar.symbol,
+        bar.timestamp_utc.isoformat(),
+        bar.open,
+        bar.high,
+        bar.low,
+        bar.close,
+        bar.volume,
+        bar.source,
+        bar.timeframe,
+    ]
+
+
+def _ohlcv_row(bar: OhlcvBar) -> OhlcvRow:
+    return (
+        int(bar.timestamp_utc.timestamp()),
+        bar.open,
+        bar.high,
+        bar.low,
+        bar.close,
+        bar.volume,
+    )
@@ -0,0 +1,106 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.core.settings import get_series_cache_max_bytes
+
+
+@dataclass(frozen=True)
+class SeriesCacheKey:
+    path: str
+    mtime_ns: int
+    size: int
+
+
+@dataclass(frozen=True)
+class SeriesCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+
+
+def series_cache_key(path: Path) -> SeriesCacheKey:
+    stat = path.stat()
+    return SeriesCacheKey(path=str(path.resolve()), mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+
+
+# A rewritten file gets a new (mtime, size) key, so stale entries are never served;
+# the previous entry for the same path is dropped as soon as the new one is stored.
+class SeriesCache:
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[SeriesCacheKey, tuple[object, int]] = OrderedDict()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: SeriesCacheKey) -> object | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: SeriesCacheKey, value: object, size_bytes: int) -> None:
+        with self._lock:
+            for existing in [k for k in self._entries if k.path == key.path]:
+                self._remove(existing)
+
+            if size_bytes > self._max_bytes:
+                return
+
+            self._entries[key] = (value, size_bytes)
+            self._current_bytes += size_bytes
+
+            while self._current_bytes > self._max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+    def invalidate(self, path: Path) -> None:
+        resolved = str(path.resolve())
+        with self._lock:
+            for existing in [k for k in self._entries if k.path == resolved]:
+                self._remove(existing)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def stats(self) -> SeriesCacheStats:
+        with self._lock:
+            return SeriesCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self._max_bytes,
+            )
+
+    def _remove(self, key: SeriesCacheKey) -> None:
+        _, size_bytes = self._entries.pop(key)
+        self._current_bytes -= size_bytes
+
+
+_shared_cache: SeriesCache | None = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_series_cache() -> SeriesCache:
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = SeriesCache(max_bytes=get_series_cache_max_bytes())
+        return _shared_cache
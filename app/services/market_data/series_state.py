@@ -0,0 +1,118 @@
+import json
+import os
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+
+STATE_SUFFIX = ".state.json"
+# Newest closes kept in the state: enough for the default risk-summary window.
+STATE_WINDOW = 365
+
+
+# Running analytics for one normalized CSV. Appending bars advances it without revisiting the
+# history: the peak and max drawdown cover every row, `recent_closes` only the newest ones.
+@dataclass(frozen=True)
+class SeriesState:
+    source_size: int
+    source_mtime_ns: int
+    rows: int
+    first_timestamp: int | None
+    last_timestamp: int | None
+    peak: float | None
+    max_drawdown: float | None
+    recent_closes: list[float]
+
+    @property
+    def last_close(self) -> float | None:
+        return self.recent_closes[-1] if self.recent_closes else None
+
+    def tail(self, limit: int) -> list[float] | None:
+        # The newest `limit` closes, or None when older closes are no longer held.
+        if limit <= len(self.recent_closes):
+            return self.recent_closes[len(self.recent_closes) - max(limit, 0) :]
+        if self.rows == len(self.recent_closes):
+            return list(self.recent_closes)
+        return None
+
+
+def state_path(csv_path: Path) -> Path:
+    return csv_path.with_name(csv_path.stem + STATE_SUFFIX)
+
+
+def build_state(timestamps: Sequence[int], closes: Sequence[float]) -> SeriesState:
+    empty = SeriesState(
+        source_size=0,
+        source_mtime_ns=0,
+        rows=0,
+        first_timestamp=None,
+        last_timestamp=None,
+        peak=None,
+        max_drawdown=None,
+        recent_closes=[],
+    )
+    return advance_state(empty, zip(timestamps, closes, strict=True))
+
+
+def advance_state(state: SeriesState, rows: Iterable[tuple[int, float]]) -> SeriesState:
+    # O(1) per row; `rows` must be newer than everything the state has seen.
+    count = state.rows
+    first_timestamp = state.first_timestamp
+    last_timestamp = state.last_timestamp
+    peak = state.peak
+    worst = state.max_drawdown
+    recent = deque(state.recent_closes, maxlen=STATE_WINDOW)
+    for ts, close in rows:
+        # Same rules as drawdown.max_drawdown: the first close opens the peak at 0% drawdown.
+        if peak is None or close > peak:
+            peak = close
+        if worst is None:
+            worst = 0.0
+        if peak > 0:
+            worst = min(worst, (close / peak) - 1.0)
+
+        count += 1
+        if first_timestamp is None:
+            first_timestamp = ts
+        last_timestamp = ts
+        recent.append(close)
+
+    return replace(
+        state,
+        rows=count,
+        first_timestamp=first_timestamp,
+        last_timestamp=last_timestamp,
+        peak=peak,
+        max_drawdown=worst,
+        recent_closes=list(recent),
+    )
+
+
+def write_state(
+    csv_path: Path,
+    state: SeriesState,
+    source: os.stat_result | None = None,
+) -> SeriesState:
+    # Stamped with the CSV version it describes: `source` when the CSV was read before this
+    # call, the current file otherwise.
+    stat = source if source is not None else csv_path.stat()
+    stamped = replace(state, source_size=stat.st_size, source_mtime_ns=stat.st_mtime_ns)
+
+    output_path = state_path(csv_path)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(asdict(stamped)), encoding="utf-8")
+    os.replace(tmp_path, output_path)
+    return stamped
+
+
+def read_state(csv_path: Path) -> SeriesState | None:
+    try:
+        source_stat = csv_path.stat()
+        payload = json.loads(state_path(csv_path).read_text(encoding="utf-8"))
+        state = SeriesState(**payload)
+    except (FileNotFoundError, ValueError, TypeError):
+        return None
+
+    if state.source_size != source_stat.st_size or state.source_mtime_ns != source_stat.st_mtime_ns:
+        return None
+    return state
@@ -0,0 +1,94 @@
+import os
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from app.core.settings import get_shared_series_store_enabled
+from app.services.market_data.columnar_store import (
+    ColumnarSeries,
+    OhlcvRow,
+    open_sidecar,
+    write_sidecar,
+)
+from app.services.market_data.series_cache import SeriesCacheKey
+
+try:
+    import fcntl
+except ImportError:  # Windows: builds are not coordinated across processes.
+    fcntl = None
+
+LOCK_SUFFIX = ".qlc.lock"
+
+
+def lock_path(csv_path: Path) -> Path:
+    return csv_path.with_name(csv_path.stem + LOCK_SUFFIX)
+
+
+# Sidecars used as a series store shared by every server process on the host. The first process
+# that needs a series parses the CSV once, under a file lock, into its `.qlc` sidecar; every
+# process then maps that file read-only, so the columns live once in the OS page cache instead
+# of once per worker. The registry keeps one mapping per series version in this process.
+class SharedSeriesStore:
+    def __init__(self) -> None:
+        self._mapped: dict[str, tuple[SeriesCacheKey, ColumnarSeries]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, csv_path: Path, key: SeriesCacheKey) -> ColumnarSeries | None:
+        # The mapped columns of this version of the CSV, or None when it has no sidecar yet.
+        with self._lock:
+            entry = self._mapped.get(key.path)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+
+        columns = open_sidecar(csv_path)
+        if columns is not None:
+            with self._lock:
+                self._mapped[key.path] = (key, columns)
+        return columns
+
+    def load(
+        self,
+        csv_path: Path,
+        key: SeriesCacheKey,
+        parse: Callable[[Path], Iterable[OhlcvRow]],
+    ) -> ColumnarSeries | None:
+        # Builds the sidecar from `parse(csv_path)` unless another process already has. None
+        # when it cannot be written (read-only directory) or the CSV changed meanwhile.
+        columns = self.get(csv_path, key)
+        if columns is not None:
+            return columns
+
+        try:
+            with lock_path(csv_path).open("a") as lock_file:
+                if fcntl is not None:
+                    # Released when the file is closed, also if this process dies.
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+                # Whoever held the lock before may have built it while this process waited.
+                columns = self.get(csv_path, key)
+                if columns is None:
+                    source = os.stat(csv_path)
+                    write_sidecar(csv_path, parse(csv_path), source=source)
+                    columns = self.get(csv_path, key)
+        except OSError:
+            return None
+        return columns
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mapped.clear()
+
+
+_shared_store: SharedSeriesStore | None = None
+_shared_store_lock = threading.Lock()
+
+
+def get_shared_series_store() -> SharedSeriesStore | None:
+    # None unless SHARED_SERIES_STORE is enabled.
+    global _shared_store
+    if not get_shared_series_store_enabled():
+        return None
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = SharedSeriesStore()
+        return _shared_store
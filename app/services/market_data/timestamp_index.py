@@ -0,0 +1,150 @@
+import csv
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.services.market_data.timestamps import make_epoch_decoder
+
+# Dense index over a timestamp-sorted CSV: for every data row, its int64 epoch timestamp and
+# the int64 byte offset where the row starts. Both columns are little-endian and mmap-able.
+INDEX_SUFFIX = ".idx"
+INDEX_MAGIC = b"QLIDX\x00\x01\x00"
+INDEX_HEADER = struct.Struct("<8sQqq")  # magic, rows, source size, source mtime_ns
+
+
+@dataclass(frozen=True)
+class TimestampIndex:
+    timestamps: memoryview
+    offsets: memoryview
+    data_end: int
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def row_range(self, start: int | None, end: int | None) -> tuple[int, int]:
+        lo = 0 if start is None else bisect_left(self.timestamps, start)
+        hi = len(self) if end is None else bisect_right(self.timestamps, end)
+        return lo, max(lo, hi)
+
+    def byte_range(self, lo: int, hi: int) -> tuple[int, int]:
+        begin = self.offsets[lo] if lo < len(self) else self.data_end
+        stop = self.offsets[hi] if hi < len(self) else self.data_end
+        return begin, stop
+
+
+def index_path(csv_path: Path) -> Path:
+    return csv_path.with_suffix(INDEX_SUFFIX)
+
+
+def build_index(csv_path: Path) -> Path | None:
+    timestamps = array("q")
+    offsets = array("q")
+    with csv_path.open("rb") as f:
+        header = next(csv.reader([f.readline().decode("utf-8-sig")]), [])
+        stripped = [name.strip() for name in header]
+        ts_name = "timestamp_utc" if "timestamp_utc" in stripped else "date"
+        if ts_name not in stripped or "close" not in stripped:
+            return None
+        ts_index = stripped.index(ts_name)
+        close_index = stripped.index("close")
+
+        decode = make_epoch_decoder()
+        offset = f.tell()
+        for line in f:
+            # Only rows the close readers keep are indexed, so an index range of n rows parses
+            # to exactly n closes.
+            row = next(csv.reader([line.decode("utf-8")]), [])
+            try:
+                ts_str = row[ts_index].strip()
+                close_str = row[close_index].strip()
+                if ts_str == "" or close_str == "":
+                    raise ValueError("blank timestamp or close")
+                ts = decode(ts_str)
+                float(close_str)
+            except (IndexError, ValueError):
+                offset += len(line)
+                continue
+
+            if timestamps and ts < timestamps[-1]:
+                # Binary search needs file order to match time order.
+                index_path(csv_path).unlink(missing_ok=True)
+                return None
+
+            timestamps.append(ts)
+            offsets.append(offset)
+            offset += len(line)
+
+    return _write_index(csv_path, timestamps, offsets)
+
+
+def extend_index(
+    csv_path: Path,
+    previous: TimestampIndex,
+    timestamps: Sequence[int],
+    offsets: Sequence[int],
+) -> Path:
+    # `previous` is the index from before rows starting at `offsets` were appended to the CSV.
+    all_timestamps = array("q")
+    all_timestamps.frombytes(previous.timestamps.cast("B"))
+    all_timestamps.extend(timestamps)
+    all_offsets = array("q")
+    all_offsets.frombytes(previous.offsets.cast("B"))
+    all_offsets.extend(offsets)
+    return _write_index(csv_path, all_timestamps, all_offsets)
+
+
+def _write_index(csv_path: Path, timestamps: array, offsets: array) -> Path:
+    if sys.byteorder != "little":
+        timestamps.byteswap()
+        offsets.byteswap()
+
+    stat = csv_path.stat()
+    output_path = index_path(csv_path)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    with tmp_path.open("wb") as f:
+        f.write(INDEX_HEADER.pack(INDEX_MAGIC, len(timestamps), stat.st_size, stat.st_mtime_ns))
+        f.write(timestamps.tobytes())
+        f.write(offsets.tobytes())
+
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+def open_index(csv_path: Path) -> TimestampIndex | None:
+    if sys.byteorder != "little":
+        return None
+
+    path = index_path(csv_path)
+    try:
+        source_stat = csv_path.stat()
+        with path.open("rb") as f:
+            header = f.read(INDEX_HEADER.size)
+            if len(header) < INDEX_HEADER.size:
+                return None
+
+            magic, rows, source_size, source_mtime_ns = INDEX_HEADER.unpack(header)
+            if magic != INDEX_MAGIC:
+                return None
+            if source_size != source_stat.st_size or source_mtime_ns != source_stat.st_mtime_ns:
+                return None
+            if os.fstat(f.fileno()).st_size != INDEX_HEADER.size + rows * 16:
+                return None
+
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        return None
+
+    buffer = memoryview(mapped)
+    column_size = rows * 8
+    offset = INDEX_HEADER.size
+    return TimestampIndex(
+        timestamps=buffer[offset : offset + column_size].cast("q"),
+        offsets=buffer[offset + column_size : offset + 2 * column_size].cast("q"),
+        data_end=source_size,
+    )
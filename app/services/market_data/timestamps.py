@@ -0,0 +1,106 @@
+import re
+from collections.abc import Callable
+from datetime import UTC, date, datetime
+
+EpochDecoder = Callable[[str], int]
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_SECONDS_PER_DAY = 86400
+_MAX_CACHED_SUFFIXES = 4096
+
+# "YYYY-MM-DD", optionally followed by "[T ]HH:MM:SS" and "Z" or "+HH:MM" / "-HH:MM".
+_FIXED_WIDTH_LAYOUT = re.compile(
+    r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}:\d{2}(?:Z|[+-]\d{2}:\d{2})?)?"
+)
+_TIME_SUFFIX = re.compile(r"(?:[T ](\d{2}):(\d{2}):(\d{2})(?:(Z)|([+-])(\d{2}):(\d{2}))?)?")
+
+
+def parse_timestamp_utc(raw: str) -> datetime:
+    value = raw.strip()
+    if value == "":
+        raise ValueError("empty timestamp")
+
+    # If format is "YYYY-MM-DD HH:MM:SS" (CryptoDataDownload), treat as UTC.
+    if "T" not in value and " " in value:
+        dt = datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+        return dt.replace(tzinfo=UTC)
+
+    # Otherwise try ISO 8601 (with or without timezone).
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt
+
+
+def parse_timestamp_epoch(raw: str) -> int:
+    return int(parse_timestamp_utc(raw).timestamp())
+
+
+def as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def make_epoch_decoder() -> EpochDecoder:
+    # One decoder per file: the layout is detected from the first value. For fixed-width
+    # layouts only the date part is parsed per row; the "time + offset" suffix is decoded
+    # once and memoised, which makes daily files (constant "T00:00:00+00:00") cheap.
+    # Values that do not fit the detected layout go through the generic ISO parser.
+    suffix_seconds: dict[str, int] = {}
+    date_from_iso = date.fromisoformat
+    decode: EpochDecoder | None = None
+
+    def decode_fixed_width(raw: str) -> int:
+        suffix = raw[10:]
+        seconds = suffix_seconds.get(suffix)
+        if seconds is None:
+            seconds = _suffix_seconds(suffix)
+            if seconds is None:
+                return parse_timestamp_epoch(raw)
+            if len(suffix_seconds) < _MAX_CACHED_SUFFIXES:
+                suffix_seconds[suffix] = seconds
+
+        try:
+            days = date_from_iso(raw[:10]).toordinal() - _EPOCH_ORDINAL
+        except ValueError:
+            return parse_timestamp_epoch(raw)
+        return days * _SECONDS_PER_DAY + seconds
+
+    def detect(raw: str) -> int:
+        nonlocal decode
+        if _FIXED_WIDTH_LAYOUT.fullmatch(raw):
+            decode = decode_fixed_width
+        elif raw.strip() != "":
+            decode = parse_timestamp_epoch
+        return parse_timestamp_epoch(raw)
+
+    def decoder(raw: str) -> int:
+        if decode is None:
+            return detect(raw)
+        return decode(raw)
+
+    return decoder
+
+
+def _suffix_seconds(suffix: str) -> int | None:
+    match = _TIME_SUFFIX.fullmatch(suffix)
+    if match is None:
+        return None
+
+    hour, minute, second, _, sign, offset_hour, offset_minute = match.groups()
+    if hour is None:
+        return 0
+
+    h, m, s = int(hour), int(minute), int(second)
+    if h > 23 or m > 59 or s > 59:
+        return None
+
+    seconds = h * 3600 + m * 60 + s
+    if sign is not None:
+        oh, om = int(offset_hour), int(offset_minute)
+        if oh > 23 or om > 59:
+            return None
+        offset = oh * 3600 + om * 60
+        seconds -= offset if sign == "+" else -offset
+    return seconds
@@ -0,0 +1,153 @@
+import sys
+import threading
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from app.services.market_data.access_stats import ranked_series
+from app.services.market_data.asset_catalog import AssetCatalog, get_asset_catalog
+from app.services.market_data.assets_summary import get_materialized_overview
+from app.services.market_data.reader import NormalizedCsvReader
+
+WARMUP_AUTO = "auto"
+# Bytes per row of a cached close frame: int64 timestamp and float64 close.
+_ROW_BYTES = 16
+
+WARMUP_DISABLED = "disabled"
+WARMUP_WARMING = "warming"
+WARMUP_READY = "ready"
+WARMUP_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class WarmupStatus:
+    state: str
+    series_loaded: int
+    series_total: int
+    loaded_bytes: int
+    overview_ready: bool
+    error: str | None = None
+
+
+# Preloads the most-used series into the series cache, then materializes the overview, on a
+# background thread so the server accepts requests (and health checks) meanwhile.
+class Warmup:
+    def __init__(self) -> None:
+        self._status = WarmupStatus(
+            state=WARMUP_DISABLED,
+            series_loaded=0,
+            series_total=0,
+            loaded_bytes=0,
+            overview_ready=False,
+        )
+        self._done = threading.Event()
+        self._done.set()
+        self._lock = threading.Lock()
+
+    def status(self) -> WarmupStatus:
+        with self._lock:
+            return self._status
+
+    def start(self, normalized_dir: Path, series: str, max_bytes: int) -> None:
+        # `series` is the WARMUP_SERIES setting; empty leaves the warm-up disabled.
+        if series == "":
+            return
+
+        with self._lock:
+            if not self._done.is_set():
+                return
+            self._done.clear()
+            self._status = WarmupStatus(
+                state=WARMUP_WARMING,
+                series_loaded=0,
+                series_total=0,
+                loaded_bytes=0,
+                overview_ready=False,
+            )
+
+        thread = threading.Thread(
+            target=self._run,
+            args=(normalized_dir, series, max_bytes),
+            name="series-warmup",
+            daemon=True,
+        )
+        thread.start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._done.wait(timeout)
+
+    def _run(self, normalized_dir: Path, series: str, max_bytes: int) -> None:
+        try:
+            self._warm(normalized_dir, series, max_bytes)
+            self._update(state=WARMUP_READY)
+        except Exception as exc:
+            # A failed warm-up still lets the instance serve; requests just start cold.
+            self._update(state=WARMUP_FAILED, error=f"{type(exc).__name__}: {exc}")
+        finally:
+            self._done.set()
+
+    def _warm(self, normalized_dir: Path, series: str, max_bytes: int) -> None:
+        catalog = get_asset_catalog(normalized_dir)
+        selected = select_warmup_series(catalog, normalized_dir, series)
+        self._update(series_total=len(selected))
+
+        reader = NormalizedCsvReader(
+            normalized_dir=normalized_dir, catalog=catalog, track_access=False
+        )
+        loaded = 0
+        loaded_bytes = 0
+        for symbol, timeframe in selected:
+            if loaded_bytes >= max_bytes:
+                break
+            # Series known to overflow the budget are skipped so smaller ones can still fit.
+            metadata = catalog.metadata(symbol, timeframe)
+            if metadata is not None and loaded_bytes + metadata.rows * _ROW_BYTES > max_bytes:
+                continue
+
+            try:
+                frame = reader.read_close_frame(symbol, timeframe, limit=sys.maxsize)
+            except FileNotFoundError:
+                continue
+            loaded += 1
+            loaded_bytes += frame.nbytes
+            self._update(series_loaded=loaded, loaded_bytes=loaded_bytes)
+
+        get_materialized_overview().rows(normalized_dir)
+        self._update(overview_ready=True)
+
+    def _update(self, **changes: object) -> None:
+        with self._lock:
+            self._status = replace(self._status, **changes)
+
+
+def select_warmup_series(
+    catalog: AssetCatalog,
+    normalized_dir: Path,
+    series: str,
+) -> list[tuple[str, str]]:
+    # Series to preload in priority order, limited to those present in the data directory.
+    if series.lower() == WARMUP_AUTO:
+        candidates = ranked_series(normalized_dir)
+    else:
+        candidates = []
+        for name in series.split(","):
+            symbol, _, timeframe = name.strip().rpartition("_")
+            if symbol != "" and timeframe != "":
+                candidates.append((symbol, timeframe))
+
+    selected: list[tuple[str, str]] = []
+    for candidate in candidates:
+        if candidate not in selected and catalog.contains(*candidate):
+            selected.append(candidate)
+    return selected
+
+
+_shared_warmup: Warmup | None = None
+_shared_warmup_lock = threading.Lock()
+
+
+def get_warmup() -> Warmup:
+    global _shared_warmup
+    with _shared_warmup_lock:
+        if _shared_warmup is None:
+            _shared_warmup = Warmup()
+        return _shared_warmup
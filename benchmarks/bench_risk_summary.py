@@ -0,0 +1,99 @@
+import math
+import timeit
+from pathlib import Path
+
+from app.domain.analytics.drawdown import drawdown_values
+from app.domain.analytics.returns import log_return_values, simple_return_values
+from app.domain.analytics.risk import (
+    RiskSummary,
+    downside_deviation,
+    mean,
+    risk_summary,
+    sharpe_ratio,
+    sortino_ratio,
+    stddev,
+)
+from app.services.market_data.reader import NormalizedCsvReader
+from app.services.market_data.series_cache import SeriesCache
+
+DATA_DIR = Path("data/normalized")
+SERIES = (("SPX", "1d"), ("EURUSD", "1d"), ("BTCUSDT", "1h"))
+LIMIT = 5000
+RISK_FREE_RATE = 0.0001
+DOWNSIDE_TARGET = 0.0
+
+
+def _multi_pass(closes, return_type: str) -> RiskSummary:
+    # The risk-summary route before the fused kernel.
+    if return_type == "simple":
+        values = simple_return_values(closes)
+    else:
+        values = log_return_values(closes)
+    drawdowns, _ = drawdown_values(closes)
+    return RiskSummary(
+        observations=len(values),
+        mean_return=mean(values),
+        volatility=stddev(values),
+        downside_volatility=downside_deviation(values, target=DOWNSIDE_TARGET),
+        sharpe_ratio=sharpe_ratio(values, risk_free_rate=RISK_FREE_RATE),
+        sortino_ratio=sortino_ratio(
+            values,
+            risk_free_rate=RISK_FREE_RATE,
+            target=DOWNSIDE_TARGET,
+        ),
+        max_drawdown=min(drawdowns, default=None),
+    )
+
+
+def _fused(closes, return_type: str) -> RiskSummary:
+    return risk_summary(
+        closes,
+        return_type=return_type,
+        risk_free_rate=RISK_FREE_RATE,
+        downside_target=DOWNSIDE_TARGET,
+    )
+
+
+def _max_relative_difference(left: RiskSummary, right: RiskSummary) -> float:
+    worst = 0.0
+    for name in RiskSummary.__dataclass_fields__:
+        a, b = getattr(left, name), getattr(right, name)
+        assert (a is None) == (b is None), name
+        if a is not None and a != b:
+            worst = max(worst, abs(a - b) / max(abs(a), abs(b)))
+    return worst
+
+
+def _best_ms(func, *args) -> float:
+    return min(timeit.repeat(lambda: func(*args), number=5, repeat=7)) / 5 * 1e3
+
+
+def main() -> int:
+    reader = NormalizedCsvReader(normalized_dir=DATA_DIR, cache=SeriesCache(max_bytes=0))
+    print(
+        f"{'series':<12}{'type':<8}{'rows':>6}{'multi-pass ms':>15}{'fused ms':>10}"
+        f"{'speed-up':>10}{'max rel diff':>14}"
+    )
+    for symbol, timeframe in SERIES:
+        if not (DATA_DIR / f"{symbol}_{timeframe}.csv").exists():
+            continue
+
+        closes = reader.read_close_frame(symbol, timeframe, LIMIT).column("close")
+        for return_type in ("log", "simple"):
+            diff = _max_relative_difference(
+                _multi_pass(closes, return_type),
+                _fused(closes, return_type),
+            )
+            assert diff < 1e-9 or math.isnan(diff)
+
+            before = _best_ms(_multi_pass, closes, return_type)
+            after = _best_ms(_fused, closes, return_type)
+            print(
+                f"{symbol + '_' + timeframe:<12}{return_type:<8}{len(closes):>6}"
+                f"{before:>15.2f}{after:>10.2f}{before / after:>9.1f}x{diff:>14.1e}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
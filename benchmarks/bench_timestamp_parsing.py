@@ -0,0 +1,53 @@
+import csv
+import timeit
+from pathlib import Path
+
+from app.services.market_data.timestamps import make_epoch_decoder, parse_timestamp_epoch
+
+DATA_DIR = Path("data/normalized")
+FILES = ("SPX_1d.csv", "BTCUSDT_1h.csv")
+
+
+def _load_timestamps(path: Path) -> list[str]:
+    with path.open("r", encoding="utf-8-sig", newline="") as f:
+        return [row["timestamp_utc"] for row in csv.DictReader(f)]
+
+
+def _per_row_ns(func, values: list[str]) -> float:
+    def run() -> None:
+        for value in values:
+            func(value)
+
+    best = min(timeit.repeat(run, number=3, repeat=7)) / 3
+    return best / len(values) * 1e9
+
+
+def _run_decoder(values: list[str]) -> float:
+    def run() -> None:
+        decode = make_epoch_decoder()
+        for value in values:
+            decode(value)
+
+    best = min(timeit.repeat(run, number=3, repeat=7)) / 3
+    return best / len(values) * 1e9
+
+
+def main() -> int:
+    print(f"{'file':<16}{'rows':>8}{'generic ns/row':>18}{'decoder ns/row':>18}{'speed-up':>10}")
+    for name in FILES:
+        path = DATA_DIR / name
+        if not path.exists():
+            continue
+
+        values = _load_timestamps(path)
+        decoder = make_epoch_decoder()
+        assert all(decoder(v) == parse_timestamp_epoch(v) for v in values)
+
+        before = _per_row_ns(parse_timestamp_epoch, values)
+        after = _run_decoder(values)
+        print(f"{name:<16}{len(values):>8}{before:>18.0f}{after:>18.0f}{before / after:>9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
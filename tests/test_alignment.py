@@ -0,0 +1,63 @@
+import math
+import random
+
+from app.domain.analytics.alignment import ForwardFillJoin, OuterJoin, align_frames
+from app.domain.analytics.frame import SeriesFrame
+
+
+def _frame(pairs: list[tuple[int, float]]) -> SeriesFrame:
+    return SeriesFrame.from_columns([ts for ts, _ in pairs], value=[v for _, v in pairs])
+
+
+def _align_pairs(series: dict[str, list[tuple[int, float]]]) -> dict[str, list[float]]:
+    # Reference inner join: the timestamps every symbol has, through a dict per timestamp.
+    rows: dict[int, dict[str, float]] = {}
+    for symbol, pairs in series.items():
+        for ts, value in pairs:
+            rows.setdefault(ts, {})[symbol] = value
+
+    shared = sorted(ts for ts, row in rows.items() if len(row) == len(series))
+    return {symbol: [rows[ts][symbol] for ts in shared] for symbol in series}
+
+
+def test_inner_join_matches_dict_alignment() -> None:
+    rng = random.Random(5)
+    series = {
+        symbol: sorted((rng.randrange(0, 400), float(i)) for i in range(rng.randrange(50, 300)))
+        for symbol in ("A", "B", "C", "D")
+    }
+
+    aligned = align_frames({symbol: _frame(pairs) for symbol, pairs in series.items()})
+
+    expected = _align_pairs(series)
+    assert {symbol: list(aligned.column(symbol)) for symbol in series} == expected
+
+
+def test_forward_fill_respects_max_gap() -> None:
+    frames = {
+        "A": _frame([(0, 1.0), (10, 2.0), (20, 3.0), (60, 4.0)]),
+        "B": _frame([(5, 10.0), (20, 30.0), (30, 40.0)]),
+    }
+
+    unlimited = align_frames(frames, policy=ForwardFillJoin())
+    limited = align_frames(frames, policy=ForwardFillJoin(max_gap_seconds=10))
+
+    assert list(unlimited.timestamps) == [5, 10, 20, 30, 60]
+    assert list(unlimited.column("A")) == [1.0, 2.0, 3.0, 3.0, 4.0]
+    assert list(unlimited.column("B")) == [10.0, 10.0, 30.0, 40.0, 40.0]
+    assert list(limited.timestamps) == [5, 10, 20, 30]
+
+
+def test_outer_join_marks_missing_rows_with_nan() -> None:
+    frames = {
+        "A": _frame([(0, 1.0), (10, 2.0)]),
+        "B": _frame([(10, 20.0), (20, 30.0), (20, 31.0)]),
+    }
+
+    aligned = align_frames(frames, policy=OuterJoin())
+
+    assert list(aligned.timestamps) == [0, 10, 20]
+    assert list(aligned.column("A"))[:2] == [1.0, 2.0]
+    assert math.isnan(aligned.column("A")[2])
+    assert math.isnan(aligned.column("B")[0])
+    assert list(aligned.column("B"))[1:] == [20.0, 31.0]
@@ -0,0 +1,57 @@
+import os
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.market_data.asset_catalog import AssetCatalog
+
+HEADER = "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+
+
+def test_catalog_follows_files_added_and_removed(tmp_path: Path) -> None:
+    (tmp_path / "SPY_1d.csv").write_text(HEADER, encoding="utf-8")
+    (tmp_path / "BTC_USD_1h.csv").write_text(HEADER, encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("", encoding="utf-8")
+
+    catalog = AssetCatalog(tmp_path)
+    assert catalog.timeframes_by_symbol() == {"BTC_USD": ["1h"], "SPY": ["1d"]}
+
+    (tmp_path / "SPY_1h.csv").write_text(HEADER, encoding="utf-8")
+    (tmp_path / "BTC_USD_1h.csv").unlink()
+
+    assert catalog.timeframes_by_symbol() == {"SPY": ["1d", "1h"]}
+    assert catalog.contains("SPY", "1h")
+    assert not catalog.contains("BTC_USD", "1h")
+    # No analytics state has been built yet, so there is nothing to describe.
+    assert catalog.metadata("SPY", "1d") is None
+
+
+def test_assets_endpoint_reports_file_details(tmp_path: Path) -> None:
+    normalized_dir = tmp_path / "normalized"
+    normalized_dir.mkdir(parents=True, exist_ok=True)
+
+    (normalized_dir / "SPY_1d.csv").write_text(
+        HEADER
+        + "SPY,2024-01-02T00:00:00+00:00,1,1,1,101,0,stooq,1d\n"
+        + "SPY,2024-01-01T00:00:00+00:00,1,1,1,100,0,stooq,1d\n",
+        encoding="utf-8",
+    )
+    (normalized_dir / "SPY_1h.csv").write_text(HEADER, encoding="utf-8")
+    os.environ["NORMALIZED_DATA_DIR"] = str(normalized_dir)
+
+    client = TestClient(app)
+    resp = client.get("/api/v1/assets?details=true")
+    assert resp.status_code == 200
+
+    files = {f["timeframe"]: f for f in resp.json()["assets"][0]["files"]}
+    assert files["1d"]["rows"] == 2
+    assert files["1d"]["first_timestamp_utc"] == "2024-01-01T00:00:00Z"
+    assert files["1d"]["last_timestamp_utc"] == "2024-01-02T00:00:00Z"
+    assert files["1d"]["size_bytes"] == (normalized_dir / "SPY_1d.csv").stat().st_size
+    # A header-only file is listed with no rows rather than failing the request.
+    assert files["1h"]["rows"] == 0
+    assert files["1h"]["first_timestamp_utc"] is None
+
+    resp = client.get("/api/v1/assets/QQQ/prices?timeframe=1d")
+    assert resp.status_code == 404
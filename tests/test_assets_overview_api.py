@@ -75,3 +75,38 @@ def test_assets_overview_uses_intraday_fallback_when_daily_is_missing(tmp_path:
     assert asset["summary_timeframe"] == "1h"
     assert asset["return_30"] is not None
     assert asset["last_close"] is not None
+
+
+def test_assets_overview_recomputes_only_changed_assets(tmp_path: Path) -> None:
+    normalized_dir = tmp_path / "normalized"
+    normalized_dir.mkdir(parents=True, exist_ok=True)
+
+    header = "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+    for symbol in ("SPY", "QQQ"):
+        rows = [
+            f"{symbol},2024-01-{day + 1:02d}T00:00:00+00:00,1,1,1,{100 + day},0,stooq,1d\n"
+            for day in range(5)
+        ]
+        (normalized_dir / f"{symbol}_1d.csv").write_text(header + "".join(rows), encoding="utf-8")
+    os.environ["NORMALIZED_DATA_DIR"] = str(normalized_dir)
+
+    client = TestClient(app)
+    resp = client.get("/api/v1/assets/overview")
+    assert resp.status_code == 200
+    assert [a["last_close"] for a in resp.json()["assets"]] == [104.0, 104.0]
+
+    resp = client.post("/api/v1/assets/overview/refresh")
+    assert resp.status_code == 200
+    assert resp.json() == {"refreshed": []}
+
+    with (normalized_dir / "SPY_1d.csv").open("a", encoding="utf-8") as f:
+        f.write("SPY,2024-01-06T00:00:00+00:00,1,1,1,90,0,stooq,1d\n")
+    (normalized_dir / "QQQ_1d.csv").unlink()
+
+    resp = client.post("/api/v1/assets/overview/refresh")
+    assert resp.json() == {"refreshed": ["SPY"]}
+
+    resp = client.get("/api/v1/assets/overview")
+    assets = resp.json()["assets"]
+    assert [a["symbol"] for a in assets] == ["SPY"]
+    assert assets[0]["last_close"] == 90.0
@@ -0,0 +1,69 @@
+import os
+from datetime import datetime
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+HEADER = "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+
+
+def _write_csv(normalized_dir: Path, symbol: str, closes: list[float]) -> None:
+    rows = "".join(
+        f"{symbol},2024-01-{day + 1:02d}T00:00:00+00:00,1,1,1,{close},0,stooq,1d\n"
+        for day, close in enumerate(closes)
+    )
+    (normalized_dir / f"{symbol}_1d.csv").write_text(HEADER + rows, encoding="utf-8")
+
+
+def _epoch(value: str) -> int:
+    return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+
+
+def test_columnar_series_match_the_points(tmp_path: Path) -> None:
+    _write_csv(tmp_path, "SPY", [100.0, 110.0, 99.0, 104.5])
+    os.environ["NORMALIZED_DATA_DIR"] = str(tmp_path)
+    client = TestClient(app)
+
+    for path, fields in (
+        ("prices", {"close": "values"}),
+        ("returns", {"value": "values"}),
+        ("drawdown", {"value": "values", "peak_close": "peak_close"}),
+    ):
+        url = f"/api/v1/assets/SPY/{path}?timeframe=1d"
+        points = client.get(url).json()["points"]
+        resp = client.get(url + "&format=columnar")
+        assert resp.status_code == 200
+        columnar = resp.json()
+
+        assert columnar["symbol"] == "SPY"
+        assert columnar["timestamps"] == [_epoch(p["timestamp_utc"]) for p in points]
+        for point_field, column in fields.items():
+            assert columnar[column] == [p[point_field] for p in points]
+        assert "etag" in resp.headers
+
+    resp = client.get("/api/v1/assets/SPY/prices?timeframe=1d&format=csv")
+    assert resp.status_code == 422
+
+
+def test_columnar_volatility_and_normalized_performance(tmp_path: Path) -> None:
+    _write_csv(tmp_path, "SPY", [100.0, 110.0, 99.0, 104.5, 101.0])
+    _write_csv(tmp_path, "QQQ", [200.0, 190.0, 210.0, 205.0, 207.0])
+    os.environ["NORMALIZED_DATA_DIR"] = str(tmp_path)
+    client = TestClient(app)
+
+    url = "/api/v1/assets/SPY/volatility?timeframe=1d&window=2&window=3"
+    points = client.get(url).json()
+    columnar = client.get(url + "&format=columnar").json()
+    assert columnar["values"] == [p["value"] for p in points["points"]]
+    assert [w["window"] for w in columnar["windows"]] == [2, 3]
+    assert columnar["windows"][1]["values"] == [p["value"] for p in points["windows"][1]["points"]]
+
+    url = "/api/v1/analytics/normalized-performance?symbols=SPY&symbols=QQQ"
+    points = client.get(url).json()
+    columnar = client.get(url + "&format=columnar").json()
+    assert columnar["observations"] == points["observations"]
+    for columnar_series, point_series in zip(columnar["series"], points["series"], strict=True):
+        assert columnar_series["symbol"] == point_series["symbol"]
+        assert columnar_series["values"] == [p["value"] for p in point_series["points"]]
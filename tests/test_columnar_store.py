@@ -0,0 +1,98 @@
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from app.schemas.market_data import OhlcvBar
+from app.services.market_data.columnar_store import open_sidecar, sidecar_path, write_sidecar
+from app.services.market_data.reader import NormalizedCsvReader
+from app.services.market_data.repository import MarketDataRepository
+from app.services.market_data.series_cache import SeriesCache
+
+
+def _bars(count: int) -> list[OhlcvBar]:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    return [
+        OhlcvBar(
+            symbol="BTCUSDT",
+            timestamp_utc=start + timedelta(hours=i),
+            open=100.0 + i,
+            high=101.0 + i,
+            low=99.0 + i,
+            close=100.5 + i,
+            volume=10.0 * i,
+            source="cryptodatadownload",
+            timeframe="1h",
+        )
+        for i in range(count)
+    ]
+
+
+def test_repository_writes_memory_mapped_sidecar(tmp_path: Path) -> None:
+    repo = MarketDataRepository(normalized_dir=tmp_path)
+    csv_path = repo.write_bars_csv(bars=_bars(5), symbol="BTCUSDT", timeframe="1h")
+
+    assert sidecar_path(csv_path).exists()
+    columns = open_sidecar(csv_path)
+    assert columns is not None
+    assert len(columns) == 5
+    assert columns.timestamps[0] == int(datetime(2024, 1, 1, tzinfo=UTC).timestamp())
+    assert list(columns.close) == [100.5, 101.5, 102.5, 103.5, 104.5]
+    assert list(columns.volume) == [0.0, 10.0, 20.0, 30.0, 40.0]
+
+
+def test_reader_uses_sidecar_tail_slices(tmp_path: Path) -> None:
+    repo = MarketDataRepository(normalized_dir=tmp_path)
+    repo.write_bars_csv(bars=_bars(5), symbol="BTCUSDT", timeframe="1h")
+    cache = SeriesCache(max_bytes=1024 * 1024)
+    reader = NormalizedCsvReader(normalized_dir=tmp_path, cache=cache)
+
+    columns = reader.read_columns(symbol="BTCUSDT", timeframe="1h", limit=2)
+    points = reader.read_close_series(symbol="BTCUSDT", timeframe="1h", limit=2)
+
+    assert list(columns.close) == [103.5, 104.5]
+    assert [p.close for p in points] == [103.5, 104.5]
+    assert points[-1].timestamp_utc == datetime(2024, 1, 1, 4, tzinfo=UTC)
+    assert cache.stats().entries == 0
+
+
+def test_stale_sidecar_is_ignored_after_csv_rewrite(tmp_path: Path) -> None:
+    repo = MarketDataRepository(normalized_dir=tmp_path)
+    csv_path = repo.write_bars_csv(bars=_bars(3), symbol="BTCUSDT", timeframe="1h")
+
+    with csv_path.open("a", encoding="utf-8") as f:
+        f.write("BTCUSDT,2024-01-01T03:00:00+00:00,1,1,1,999,0,cryptodatadownload,1h\n")
+
+    assert open_sidecar(csv_path) is None
+    reader = NormalizedCsvReader(normalized_dir=tmp_path, cache=SeriesCache(max_bytes=1024 * 1024))
+    points = reader.read_close_series(symbol="BTCUSDT", timeframe="1h", limit=1)
+    assert points[0].close == 999.0
+
+
+def test_sidecar_holds_the_same_rows_as_the_csv(tmp_path: Path) -> None:
+    # Blank or invalid timestamps and closes drop the row; other bad fields do not.
+    csv_path = tmp_path / "BTCUSDT_1h.csv"
+    csv_path.write_text(
+        "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+        "BTCUSDT,2024-01-01T00:00:00+00:00,1,1,1,100,5,cryptodatadownload,1h\n"
+        "BTCUSDT,2024-01-01T01:00:00+00:00,1,1,1,,5,cryptodatadownload,1h\n"
+        "BTCUSDT,2024-01-01T02:00:00+00:00,1,1,1,n/a,5,cryptodatadownload,1h\n"
+        "BTCUSDT,,1,1,1,104,5,cryptodatadownload,1h\n"
+        "BTCUSDT,not-a-date,1,1,1,105,5,cryptodatadownload,1h\n"
+        "BTCUSDT,2024-01-01T03:00:00+00:00,bad,1,1,110,,cryptodatadownload,1h\n"
+        "BTCUSDT,2024-01-01T04:00:00+00:00,1,1,1,120,5,cryptodatadownload,1h\n",
+        encoding="utf-8",
+    )
+
+    from_csv = NormalizedCsvReader(
+        normalized_dir=tmp_path, cache=SeriesCache(max_bytes=1 << 20), use_sidecar=False
+    ).read_close_frame(symbol="BTCUSDT", timeframe="1h", limit=10)
+    write_sidecar(csv_path, NormalizedCsvReader(normalized_dir=tmp_path).read_ohlcv_rows(csv_path))
+    columns = open_sidecar(csv_path)
+    from_sidecar = NormalizedCsvReader(
+        normalized_dir=tmp_path, cache=SeriesCache(max_bytes=1 << 20)
+    ).read_close_frame(symbol="BTCUSDT", timeframe="1h", limit=10)
+
+    assert columns is not None
+    assert list(from_csv.column("close")) == [100.0, 110.0, 120.0]
+    assert from_sidecar == from_csv
+    assert list(columns.open) == [1.0, 0.0, 1.0]
+    assert list(columns.volume) == [5.0, 0.0, 5.0]
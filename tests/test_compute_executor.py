@@ -0,0 +1,41 @@
+import pickle
+import time
+
+import pytest
+
+from app.core.compute import ComputeBusyError, ComputeExecutor, ComputeTimeoutError
+from app.domain.analytics.frame import SeriesFrame
+
+
+def test_series_frames_survive_pickling() -> None:
+    frame = SeriesFrame.from_columns([1, 2, 3], close=[10.0, 11.0, 12.0]).slice(1, 3)
+
+    restored = pickle.loads(pickle.dumps(frame))
+
+    assert list(restored.timestamps) == [2, 3]
+    assert list(restored.column("close")) == [11.0, 12.0]
+
+
+def test_inline_executor_runs_on_the_calling_thread() -> None:
+    executor = ComputeExecutor(mode="inline", workers=1, max_pending=1, timeout_seconds=0.01)
+
+    assert executor.run(sum, [1, 2, 3]) == 6
+
+    with pytest.raises(ValueError):
+        ComputeExecutor(mode="gpu", workers=1, max_pending=1, timeout_seconds=1.0)
+
+
+def test_process_executor_times_out_and_bounds_pending_tasks() -> None:
+    executor = ComputeExecutor(mode="process", workers=1, max_pending=1, timeout_seconds=1.0)
+    try:
+        # The first task also pays for starting the worker process.
+        assert executor.run(sum, [1, 2, 3]) == 6
+
+        with pytest.raises(ComputeTimeoutError):
+            executor.run(time.sleep, 1.5)
+
+        # The timed-out task keeps running in its worker and still holds the only slot.
+        with pytest.raises(ComputeBusyError):
+            executor.run(sum, [1])
+    finally:
+        executor.shutdown()
@@ -0,0 +1,62 @@
+import os
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.api.routes import correlation
+from app.main import app
+
+HEADER = "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+
+
+def _write_csv(normalized_dir: Path, symbol: str, closes: list[float]) -> None:
+    rows = "".join(
+        f"{symbol},2024-01-{day + 1:02d}T00:00:00+00:00,1,1,1,{close},0,stooq,1d\n"
+        for day, close in enumerate(closes)
+    )
+    (normalized_dir / f"{symbol}_1d.csv").write_text(HEADER + rows, encoding="utf-8")
+
+
+def test_unchanged_series_are_revalidated_with_304(tmp_path: Path) -> None:
+    _write_csv(tmp_path, "SPY", [100.0, 101.0, 103.0])
+    os.environ["NORMALIZED_DATA_DIR"] = str(tmp_path)
+    client = TestClient(app)
+    url = "/api/v1/assets/SPY/prices?timeframe=1d"
+
+    resp = client.get(url)
+    assert resp.status_code == 200
+    etag = resp.headers["etag"]
+    assert resp.headers["cache-control"] == "public, no-cache"
+
+    resp = client.get(url, headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+    assert client.get(url, headers={"If-None-Match": f'"other", W/{etag}'}).status_code == 304
+
+    # Other parameters or another version of the file give another tag.
+    assert client.get(url + "&limit=2").headers["etag"] != etag
+    _write_csv(tmp_path, "SPY", [100.0, 101.0, 103.0, 104.0])
+    resp = client.get(url, headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != etag
+    assert len(resp.json()["points"]) == 4
+
+
+def test_not_modified_is_answered_before_loading(tmp_path: Path, monkeypatch) -> None:
+    _write_csv(tmp_path, "SPY", [100.0, 101.0, 103.0, 102.0])
+    _write_csv(tmp_path, "QQQ", [200.0, 199.0, 204.0, 206.0])
+    os.environ["NORMALIZED_DATA_DIR"] = str(tmp_path)
+    client = TestClient(app)
+    url = "/api/v1/analytics/correlation?symbols=SPY&symbols=QQQ"
+
+    etag = client.get(url).headers["etag"]
+    resp = client.get("/api/v1/analytics/correlation?symbols=SPY&symbols=XYZ")
+    assert resp.status_code == 404
+    assert "etag" not in resp.headers
+
+    def fail(*args: object) -> None:
+        raise AssertionError("series were loaded")
+
+    monkeypatch.setattr(correlation, "read_close_frames", fail)
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
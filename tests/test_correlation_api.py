@@ -73,3 +73,67 @@ def test_correlation_endpoint_requires_overlapping_observations(tmp_path: Path)
     )
     assert resp.status_code == 422
     assert "overlapping observations" in resp.json()["detail"]
+
+
+def test_correlation_endpoint_can_include_covariance(tmp_path: Path) -> None:
+    normalized_dir = tmp_path / "normalized"
+    normalized_dir.mkdir(parents=True, exist_ok=True)
+
+    header = "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+    closes = {"SPY": [100, 102, 101, 105], "QQQ": [200, 201, 205, 204], "GLD": [50, 50, 50, 50]}
+    for symbol, values in closes.items():
+        rows = "".join(
+            f"{symbol},2024-01-0{day + 1}T00:00:00+00:00,{v},{v},{v},{v},0,stooq,1d\n"
+            for day, v in enumerate(values)
+        )
+        (normalized_dir / f"{symbol}_1d.csv").write_text(header + rows, encoding="utf-8")
+
+    os.environ["NORMALIZED_DATA_DIR"] = str(normalized_dir)
+
+    client = TestClient(app)
+    base = "/api/v1/analytics/correlation?symbols=SPY&symbols=QQQ&symbols=GLD"
+    assert client.get(base).json()["covariance_rows"] is None
+
+    data = client.get(base + "&include_covariance=true").json()
+    correlation = [row["values"] for row in data["rows"]]
+    covariance = [row["values"] for row in data["covariance_rows"]]
+
+    assert correlation[0][1] == correlation[1][0]
+    assert correlation[2] == [0.0, 0.0, 1.0]
+    assert covariance[2] == [0.0, 0.0, 0.0]
+    assert covariance[0][1] == covariance[1][0]
+    implied = covariance[0][1] / (covariance[0][0] * covariance[1][1]) ** 0.5
+    assert abs(implied - correlation[0][1]) < 1e-12
+
+
+def test_correlation_endpoint_pairwise_uses_each_pair_overlap(tmp_path: Path) -> None:
+    normalized_dir = tmp_path / "normalized"
+    normalized_dir.mkdir(parents=True, exist_ok=True)
+
+    header = "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+    closes = {
+        "SPY": [100, 102, 101, 105, 104, 108],
+        "QQQ": [200, 205, 203, 211, 209, 218],
+        "BTC": [None, None, None, 30, 31, 29],
+    }
+    for symbol, values in closes.items():
+        rows = "".join(
+            f"{symbol},2024-01-0{day + 1}T00:00:00+00:00,{v},{v},{v},{v},0,binance,1d\n"
+            for day, v in enumerate(values)
+            if v is not None
+        )
+        (normalized_dir / f"{symbol}_1d.csv").write_text(header + rows, encoding="utf-8")
+
+    os.environ["NORMALIZED_DATA_DIR"] = str(normalized_dir)
+
+    client = TestClient(app)
+    base = "/api/v1/analytics/correlation?symbols=SPY&symbols=QQQ&symbols=BTC"
+    assert client.get(base).json()["observations"] == 2
+
+    data = client.get(base + "&pairwise=true").json()
+    assert [row["values"] for row in data["observation_rows"]] == [[5, 5, 2], [5, 5, 2], [2, 2, 2]]
+    assert data["observations"] == 2
+
+    only_pair = client.get("/api/v1/analytics/correlation?symbols=SPY&symbols=QQQ").json()
+    assert abs(data["rows"][0]["values"][1] - only_pair["rows"][0]["values"][1]) < 1e-12
+    assert client.get(base + "&pairwise=true&join=ffill").status_code == 422
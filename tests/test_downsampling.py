@@ -0,0 +1,102 @@
+import math
+import os
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.domain.analytics.downsampling import LTTB, MIN_MAX, downsample_frame
+from app.domain.analytics.drawdown import drawdown_trough
+from app.domain.analytics.frame import SeriesFrame
+from app.main import app
+
+HEADER = "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+START = datetime(1995, 1, 1, tzinfo=UTC)
+
+
+def _closes(count: int, phase: float = 0.0) -> list[float]:
+    # A rising wave with a deep dip two thirds of the way in.
+    closes = [100.0 + day * 0.01 + 10.0 * math.sin(day / 40.0 + phase) for day in range(count)]
+    closes[count * 2 // 3] = 50.0
+    return closes
+
+
+def _write_csv(normalized_dir: Path, symbol: str, closes: list[float]) -> None:
+    rows = "".join(
+        f"{symbol},{(START + timedelta(days=day)).isoformat()},1,1,1,{close},0,stooq,1d\n"
+        for day, close in enumerate(closes)
+    )
+    (normalized_dir / f"{symbol}_1d.csv").write_text(HEADER + rows, encoding="utf-8")
+
+
+def test_downsampling_keeps_extremes_and_the_drawdown() -> None:
+    closes = _closes(10_000)
+    frame = SeriesFrame.from_columns(range(len(closes)), close=closes)
+    peak, trough = drawdown_trough(closes)
+
+    for method in (LTTB, MIN_MAX):
+        sampled = downsample_frame(frame, 500, method)
+        timestamps = list(sampled.timestamps)
+        values = list(sampled.column("close"))
+
+        assert 400 < len(sampled) <= 500
+        assert timestamps == sorted(set(timestamps))
+        assert timestamps[0] == 0 and timestamps[-1] == len(closes) - 1
+        assert min(values) == min(closes) and max(values) == max(closes)
+        assert {peak, trough} <= set(timestamps)
+        assert all(value == closes[ts] for ts, value in zip(timestamps, values, strict=True))
+
+    assert downsample_frame(frame.tail(300), 500) == frame.tail(300)
+
+
+def test_lttb_picks_the_spikes_of_a_flat_series() -> None:
+    values = [0.0] * 100
+    values[30] = 5.0
+    values[70] = -5.0
+    frame = SeriesFrame.from_columns(range(100), value=values)
+
+    sampled = downsample_frame(frame, 10, LTTB)
+
+    assert {30, 70} <= set(sampled.timestamps)
+
+
+def test_prices_and_normalized_performance_accept_max_points(tmp_path: Path) -> None:
+    # Thirty years of daily bars: more than a JSON response may list, but fine to chart.
+    spx = _closes(11_000)
+    _write_csv(tmp_path, "SPX", spx)
+    _write_csv(tmp_path, "QQQ", _closes(11_000, phase=1.0))
+    os.environ["NORMALIZED_DATA_DIR"] = str(tmp_path)
+    client = TestClient(app)
+
+    response = client.get(
+        "/api/v1/assets/SPX/prices",
+        params={"timeframe": "1d", "max_points": 1000, "format": "columnar"},
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert len(payload["timestamps"]) <= 1000
+    assert payload["values"][0] == spx[0] and payload["values"][-1] == spx[-1]
+    assert min(payload["values"]) == 50.0
+
+    response = client.get(
+        "/api/v1/assets/SPX/prices",
+        params={"timeframe": "1d", "max_points": 200, "downsample": "minmax", "limit": 2000},
+    )
+    points = response.json()["points"]
+    assert len(points) <= 200
+    assert points[0]["close"] == spx[-2000]
+
+    response = client.get(
+        "/api/v1/analytics/normalized-performance",
+        params={"symbols": ["SPX", "QQQ"], "max_points": 500},
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["observations"] == 11_000
+    assert payload["limit"] is None
+    series = payload["series"]
+    assert len(series[0]["points"]) == len(series[1]["points"]) <= 500
+    assert series[0]["points"][0]["timestamp_utc"] == "1995-01-01T00:00:00Z"
+
+    response = client.get("/api/v1/assets/SPX/prices", params={"timeframe": "1d", "max_points": 2})
+    assert response.status_code == 422
@@ -0,0 +1,123 @@
+import os
+import struct
+from array import array
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.api.export import (
+    BINARY_HEADER,
+    BINARY_MAGIC,
+    BINARY_MEDIA_TYPE,
+    CSV_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    accepted_media_type,
+)
+from app.main import app
+from app.schemas.market_data import OhlcvBar
+from app.services.market_data.repository import MarketDataRepository
+
+HEADER = "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+
+
+def _write_csv(normalized_dir: Path, symbol: str, closes: list[float]) -> None:
+    rows = "".join(
+        f"{symbol},2024-01-{day + 1:02d}T00:00:00+00:00,1,1,1,{close},0,stooq,1d\n"
+        for day, close in enumerate(closes)
+    )
+    (normalized_dir / f"{symbol}_1d.csv").write_text(HEADER + rows, encoding="utf-8")
+
+
+def _decode_binary(body: bytes) -> dict[str, list[float]]:
+    magic, rows, count = BINARY_HEADER.unpack_from(body)
+    assert magic == BINARY_MAGIC
+    offset = BINARY_HEADER.size
+    names = ["timestamps"]
+    for _ in range(count):
+        (length,) = struct.unpack_from("<H", body, offset)
+        names.append(body[offset + 2 : offset + 2 + length].decode("utf-8"))
+        offset += 2 + length
+    offset += -offset % 8
+
+    columns: dict[str, list[float]] = {}
+    for i, name in enumerate(names):
+        column = array("q" if i == 0 else "d")
+        column.frombytes(body[offset : offset + rows * 8])
+        columns[name] = column.tolist()
+        offset += rows * 8
+    assert offset == len(body)
+    return columns
+
+
+def test_accept_header_selects_the_representation() -> None:
+    assert accepted_media_type(None) == JSON_MEDIA_TYPE
+    assert accepted_media_type("text/html,application/xhtml+xml,*/*;q=0.8") == JSON_MEDIA_TYPE
+    assert accepted_media_type("application/octet-stream") == BINARY_MEDIA_TYPE
+    assert accepted_media_type("text/*") == CSV_MEDIA_TYPE
+    assert accepted_media_type("application/json;q=0.5, text/csv") == CSV_MEDIA_TYPE
+    assert accepted_media_type("image/png") == JSON_MEDIA_TYPE
+
+
+def test_binary_export_streams_the_mapped_columns(tmp_path: Path) -> None:
+    # Written through the repository, so the series is read from its memory-mapped sidecar.
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    bars = [
+        OhlcvBar(
+            symbol="SPY",
+            timestamp_utc=start + timedelta(days=day),
+            open=1.0,
+            high=1.0,
+            low=1.0,
+            close=100.0 + day,
+            volume=0.0,
+            source="stooq",
+            timeframe="1d",
+        )
+        for day in range(6000)
+    ]
+    MarketDataRepository(normalized_dir=tmp_path).write_bars_csv(bars, "SPY", "1d")
+    os.environ["NORMALIZED_DATA_DIR"] = str(tmp_path)
+    client = TestClient(app)
+    url = "/api/v1/assets/SPY/prices?timeframe=1d&limit=6000"
+
+    # JSON keeps its row limit; exports may return whole histories.
+    assert client.get(url).status_code == 422
+    resp = client.get(url, headers={"Accept": BINARY_MEDIA_TYPE})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == BINARY_MEDIA_TYPE
+    assert resp.headers["vary"] == "Accept"
+    assert int(resp.headers["content-length"]) == len(resp.content)
+
+    columns = _decode_binary(resp.content)
+    assert list(columns) == ["timestamps", "close"]
+    epoch = int(start.timestamp())
+    assert columns["timestamps"][:2] == [epoch, epoch + 86_400]
+    assert columns["close"] == [100.0 + day for day in range(6000)]
+
+    etag = resp.headers["etag"]
+    assert client.get(url, headers={"Accept": CSV_MEDIA_TYPE}).headers["etag"] != etag
+
+
+def test_csv_and_binary_exports_of_derived_series(tmp_path: Path) -> None:
+    _write_csv(tmp_path, "SPY", [100.0, 110.0, 99.0])
+    _write_csv(tmp_path, "QQQ", [200.0, 190.0, 210.0])
+    os.environ["NORMALIZED_DATA_DIR"] = str(tmp_path)
+    client = TestClient(app)
+
+    resp = client.get("/api/v1/assets/SPY/drawdown?timeframe=1d", headers={"Accept": "text/csv"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert resp.text.splitlines() == [
+        "timestamp_utc,value,peak_close",
+        "2024-01-01T00:00:00+00:00,0.0,100.0",
+        "2024-01-02T00:00:00+00:00,0.0,110.0",
+        f"2024-01-03T00:00:00+00:00,{99.0 / 110.0 - 1.0!r},110.0",
+    ]
+
+    url = "/api/v1/analytics/normalized-performance?symbols=SPY&symbols=QQQ"
+    points = client.get(url).json()
+    columns = _decode_binary(client.get(url, headers={"Accept": BINARY_MEDIA_TYPE}).content)
+    assert list(columns) == ["timestamps", "SPY", "QQQ"]
+    for series in points["series"]:
+        assert columns[series["symbol"]] == [p["value"] for p in series["points"]]
@@ -68,3 +68,35 @@ def test_normalized_performance_endpoint_requires_overlapping_points(tmp_path: P
     )
     assert resp.status_code == 422
     assert "overlapping observations" in resp.json()["detail"]
+
+
+def test_normalized_performance_endpoint_forward_fills_within_max_gap(tmp_path: Path) -> None:
+    normalized_dir = tmp_path / "normalized"
+    normalized_dir.mkdir(parents=True, exist_ok=True)
+
+    header = "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+    (normalized_dir / "SPY_1d.csv").write_text(
+        header
+        + "SPY,2024-01-01T00:00:00+00:00,100,100,100,100,0,stooq,1d\n"
+        + "SPY,2024-01-03T00:00:00+00:00,120,120,120,120,0,stooq,1d\n",
+        encoding="utf-8",
+    )
+    (normalized_dir / "BTCUSDT_1d.csv").write_text(
+        header
+        + "BTCUSDT,2024-01-01T00:00:00+00:00,200,200,200,200,0,binance,1d\n"
+        + "BTCUSDT,2024-01-02T00:00:00+00:00,220,220,220,220,0,binance,1d\n"
+        + "BTCUSDT,2024-01-03T00:00:00+00:00,210,210,210,210,0,binance,1d\n",
+        encoding="utf-8",
+    )
+
+    os.environ["NORMALIZED_DATA_DIR"] = str(normalized_dir)
+
+    client = TestClient(app)
+    url = "/api/v1/analytics/normalized-performance?symbols=SPY&symbols=BTCUSDT&timeframe=1d"
+    inner = client.get(url).json()
+    filled = client.get(url + "&join=ffill&max_gap=86400").json()
+
+    assert inner["observations"] == 2
+    assert filled["observations"] == 3
+    assert [p["value"] for p in filled["series"][0]["points"]] == [100.0, 100.0, 120.0]
+    assert client.get(url + "&join=outer").status_code == 422
@@ -0,0 +1,179 @@
+import math
+import random
+from collections.abc import Iterator
+
+import pytest
+
+from app.domain.analytics import drawdown, returns, risk, rolling, volatility
+from app.domain.analytics.backend import NUMPY_BACKEND, PYTHON_BACKEND, set_backend
+from app.domain.analytics.correlation import (
+    comoment_matrix,
+    pairwise_comoments,
+    pearson_correlation,
+)
+
+pytest.importorskip("numpy")
+
+SERIES = [
+    [],
+    [100.0],
+    [100.0, 110.0],
+    [100.0, 0.0, 50.0, -5.0, 20.0, 20.0],
+    [0.0, 0.0, 3.0, 1.0],
+    [random.Random(7).uniform(1.0, 200.0) for _ in range(500)],
+]
+RISK_FIELDS = (
+    "mean_return",
+    "volatility",
+    "downside_volatility",
+    "sharpe_ratio",
+    "sortino_ratio",
+    "max_drawdown",
+)
+
+
+@pytest.fixture
+def backends() -> Iterator[None]:
+    yield
+    set_backend(PYTHON_BACKEND)
+
+
+def _run(backend: str, fn, *args, **kwargs):
+    set_backend(backend)
+    return fn(*args, **kwargs)
+
+
+def _assert_close(left, right) -> None:
+    if left is None or right is None:
+        assert left is right
+        return
+    if isinstance(left, tuple):
+        for a, b in zip(left, right, strict=True):
+            _assert_close(a, b)
+        return
+    if isinstance(left, float):
+        assert math.isclose(left, right, rel_tol=1e-9, abs_tol=1e-12)
+        return
+    assert len(left) == len(right)
+    for a, b in zip(left, right, strict=True):
+        assert math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-12)
+
+
+@pytest.mark.parametrize("closes", SERIES)
+def test_series_kernels_match_python_backend(backends: None, closes: list[float]) -> None:
+    for fn, args in (
+        (returns.simple_return_values, (closes,)),
+        (returns.log_return_values, (closes,)),
+        (drawdown.drawdown_values, (closes,)),
+        (volatility.rolling_std_values, (closes, 1)),
+        (volatility.rolling_std_values, (closes, 2)),
+        (volatility.rolling_std_values, (closes, 30)),
+    ):
+        _assert_close(_run(NUMPY_BACKEND, fn, *args), _run(PYTHON_BACKEND, fn, *args))
+
+
+def test_rolling_std_matches_python_backend_at_large_windows(backends: None) -> None:
+    rng = random.Random(11)
+    values = [rng.gauss(0.0, 0.01) for _ in range(5000)]
+
+    for window in (250, 1000):
+        expected = _run(PYTHON_BACKEND, volatility.rolling_std_values, values, window)
+        actual = _run(NUMPY_BACKEND, volatility.rolling_std_values, values, window)
+        assert len(actual) == len(values) - window + 1
+        _assert_close(actual, expected)
+
+
+@pytest.mark.parametrize("closes", SERIES)
+def test_risk_kernels_match_python_backend(backends: None, closes: list[float]) -> None:
+    values = list(returns.log_return_values(closes))
+    for fn, kwargs in (
+        (risk.mean, {}),
+        (risk.stddev, {}),
+        (risk.downside_deviation, {"target": 0.001}),
+        (risk.sharpe_ratio, {"risk_free_rate": 0.0001}),
+        (risk.sortino_ratio, {"risk_free_rate": 0.0001, "target": 0.001}),
+    ):
+        _assert_close(
+            _run(NUMPY_BACKEND, fn, values, **kwargs),
+            _run(PYTHON_BACKEND, fn, values, **kwargs),
+        )
+
+
+@pytest.mark.parametrize("closes", SERIES)
+def test_risk_summary_matches_python_backend(backends: None, closes: list[float]) -> None:
+    for return_type in ("log", "simple"):
+        kwargs = {"return_type": return_type, "risk_free_rate": 0.0001, "downside_target": 0.001}
+        fast = _run(NUMPY_BACKEND, risk.risk_summary, closes, **kwargs)
+        slow = _run(PYTHON_BACKEND, risk.risk_summary, closes, **kwargs)
+        assert fast.observations == slow.observations
+        for name in RISK_FIELDS:
+            _assert_close(getattr(fast, name), getattr(slow, name))
+        _assert_close(
+            _run(NUMPY_BACKEND, drawdown.max_drawdown, closes),
+            _run(PYTHON_BACKEND, drawdown.max_drawdown, closes),
+        )
+
+
+def test_pearson_correlation_matches_python_backend(backends: None) -> None:
+    rng = random.Random(11)
+    left = [rng.gauss(0.0, 1.0) for _ in range(200)]
+    right = [value * 0.5 + rng.gauss(0.0, 1.0) for value in left]
+
+    for a, b in ((left, right), (left, [1.0] * 200)):
+        _assert_close(
+            _run(NUMPY_BACKEND, pearson_correlation, a, b),
+            _run(PYTHON_BACKEND, pearson_correlation, a, b),
+        )
+
+    set_backend(NUMPY_BACKEND)
+    with pytest.raises(ValueError):
+        pearson_correlation([1.0], [1.0])
+
+
+def test_comoment_matrix_matches_python_backend(backends: None) -> None:
+    rng = random.Random(13)
+    aligned = {symbol: [rng.gauss(0.0, 0.01) for _ in range(250)] for symbol in "ABCDE"}
+    aligned["F"] = [0.0] * 250
+    symbols = list(aligned)
+
+    fast = _run(NUMPY_BACKEND, comoment_matrix, symbols, aligned)
+    slow = _run(PYTHON_BACKEND, comoment_matrix, symbols, aligned)
+
+    for fast_row, slow_row in zip(fast.correlation_rows(), slow.correlation_rows(), strict=True):
+        _assert_close(fast_row.values, slow_row.values)
+    for fast_row, slow_row in zip(fast.covariance_rows(), slow.covariance_rows(), strict=True):
+        _assert_close(fast_row.values, slow_row.values)
+
+
+def test_pairwise_comoments_match_python_backend(backends: None) -> None:
+    rng = random.Random(17)
+    nan = float("nan")
+    outer = {
+        symbol: [nan if rng.random() < gap else rng.gauss(0.0, 0.01) for _ in range(300)]
+        for symbol, gap in (("A", 0.0), ("B", 0.3), ("C", 0.9), ("D", 1.0))
+    }
+    symbols = list(outer)
+
+    fast = _run(NUMPY_BACKEND, pairwise_comoments, symbols, outer)
+    slow = _run(PYTHON_BACKEND, pairwise_comoments, symbols, outer)
+
+    assert fast.observations == slow.observations
+    for fast_row, slow_row in zip(fast.correlation_rows(), slow.correlation_rows(), strict=True):
+        for a, b in zip(fast_row.values, slow_row.values, strict=True):
+            assert (a is None and b is None) or math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-12)
+
+
+def test_rolling_comoments_match_python_backend(backends: None) -> None:
+    rng = random.Random(19)
+    x = [rng.gauss(0.0, 0.01) for _ in range(600)] + [0.0] * 40
+    y = [value * 1.3 + rng.gauss(0.0, 0.005) for value in x[:600]] + [0.0] * 40
+
+    for window in (5, 20, 250):
+        fast = _run(NUMPY_BACKEND, rolling.rolling_comoment_values, x, y, window)
+        slow = _run(PYTHON_BACKEND, rolling.rolling_comoment_values, x, y, window)
+        _assert_close(fast, slow)
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        set_backend("fortran")
@@ -0,0 +1,47 @@
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from app.services.market_data.reader import NormalizedCsvReader
+from app.services.market_data.series_cache import SeriesCache
+
+HEADER = "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+
+
+def test_read_many_returns_frames_in_order_and_per_symbol_errors(tmp_path: Path) -> None:
+    for offset, symbol in enumerate(("SPY", "QQQ", "IWM")):
+        rows = "".join(
+            f"{symbol},2024-01-0{day + 1}T00:00:00+00:00,1,1,1,{100 + offset + day},0,stooq,1d\n"
+            for day in range(3)
+        )
+        (tmp_path / f"{symbol}_1d.csv").write_text(HEADER + rows, encoding="utf-8")
+
+    reader = NormalizedCsvReader(normalized_dir=tmp_path, cache=SeriesCache(max_bytes=1 << 20))
+    result = reader.read_many(["IWM", "XYZ", "SPY", "QQQ"], timeframe="1d", limit=2)
+
+    assert list(result.frames) == ["IWM", "SPY", "QQQ"]
+    assert list(result.frames["IWM"].column("close")) == [103.0, 104.0]
+    assert list(result.frames["SPY"].column("close")) == [101.0, 102.0]
+    assert list(result.errors) == ["XYZ"]
+    assert isinstance(result.errors["XYZ"], FileNotFoundError)
+
+
+def test_large_files_parse_in_worker_processes(tmp_path: Path, monkeypatch) -> None:
+    start = datetime(2000, 1, 1, tzinfo=UTC)
+    rows = "".join(
+        f"SPY,{(start + timedelta(days=day)).isoformat()},1,1,1,{100 + day % 7},0,stooq,1d\n"
+        for day in range(6000)
+    )
+    (tmp_path / "SPY_1d.csv").write_text(HEADER + rows, encoding="utf-8")
+    (tmp_path / "QQQ_1d.csv").write_text(HEADER + rows.replace("SPY", "QQQ"), encoding="utf-8")
+    assert (tmp_path / "SPY_1d.csv").stat().st_size >= 256 * 1024
+
+    inline = NormalizedCsvReader(normalized_dir=tmp_path, cache=SeriesCache(max_bytes=1 << 24))
+    expected = inline.read_close_frame("SPY", timeframe="1d", limit=10_000)
+
+    monkeypatch.setenv("READ_PROCESSES", "2")
+    reader = NormalizedCsvReader(normalized_dir=tmp_path, cache=SeriesCache(max_bytes=1 << 24))
+    result = reader.read_many(["SPY", "QQQ"], timeframe="1d", limit=10_000)
+
+    assert result.errors == {}
+    assert list(result.frames["SPY"].timestamps) == list(expected.timestamps)
+    assert list(result.frames["QQQ"].column("close")) == list(expected.column("close"))
@@ -1,6 +1,12 @@
+import math
+
+from app.domain.analytics.drawdown import drawdown_values, max_drawdown
+from app.domain.analytics.returns import log_return_values, simple_return_values
 from app.domain.analytics.risk import (
+    RiskSummary,
     downside_deviation,
     mean,
+    risk_summary,
     sharpe_ratio,
     sortino_ratio,
     stddev,
@@ -26,3 +32,40 @@ def test_sharpe_and_sortino() -> None:
     values = [0.02, 0.01, -0.01, 0.03]
     assert sharpe_ratio(values) is not None
     assert sortino_ratio(values) is not None
+
+
+def test_risk_summary_matches_individual_metrics() -> None:
+    closes = [100.0, 104.0, 98.0, 0.0, 50.0, 55.0, 52.0, 60.0]
+    for return_type, returns_of in (("log", log_return_values), ("simple", simple_return_values)):
+        values = returns_of(closes)
+        drawdowns, _ = drawdown_values(closes)
+
+        summary = risk_summary(
+            closes,
+            return_type=return_type,
+            risk_free_rate=0.001,
+            downside_target=0.01,
+        )
+
+        assert summary.observations == len(values)
+        expected = {
+            "mean_return": mean(values),
+            "volatility": stddev(values),
+            "downside_volatility": downside_deviation(values, target=0.01),
+            "sharpe_ratio": sharpe_ratio(values, risk_free_rate=0.001),
+            "sortino_ratio": sortino_ratio(values, risk_free_rate=0.001, target=0.01),
+            "max_drawdown": min(drawdowns),
+        }
+        for name, value in expected.items():
+            assert math.isclose(getattr(summary, name), value, rel_tol=1e-12), name
+        assert max_drawdown(closes) == min(drawdowns)
+
+
+def test_risk_summary_edge_cases() -> None:
+    assert risk_summary([]) == RiskSummary(0, None, None, None, None, None, None)
+    assert risk_summary([10.0]) == RiskSummary(0, None, None, None, None, None, 0.0)
+
+    flat = risk_summary([10.0, 10.0, 10.0])
+    assert flat.volatility == 0.0
+    assert flat.sharpe_ratio is None
+    assert flat.sortino_ratio is None
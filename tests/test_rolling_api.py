@@ -0,0 +1,60 @@
+import math
+import os
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.domain.analytics.rolling import rolling_comoment_values
+from app.main import app
+
+HEADER = "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+
+
+def _write(normalized_dir: Path, symbol: str, closes: list[float]) -> None:
+    rows = "".join(
+        f"{symbol},2024-01-{day + 1:02d}T00:00:00+00:00,{v},{v},{v},{v},0,stooq,1d\n"
+        for day, v in enumerate(closes)
+    )
+    (normalized_dir / f"{symbol}_1d.csv").write_text(HEADER + rows, encoding="utf-8")
+
+
+def test_rolling_comoments_handle_scaled_and_flat_windows() -> None:
+    x = [0.01, -0.02, 0.015, 0.0, 0.0, 0.0, 0.0, 0.03]
+    y = [2.0 * value + 0.001 for value in x]
+
+    correlations, betas = rolling_comoment_values(x, y, window=3)
+
+    assert len(correlations) == 6
+    assert math.isclose(correlations[0], 1.0, rel_tol=1e-9)
+    assert math.isclose(betas[0], 2.0, rel_tol=1e-9)
+    assert correlations[3] == 0.0
+    assert betas[3] == 0.0
+
+
+def test_rolling_correlation_and_beta_endpoints(tmp_path: Path) -> None:
+    normalized_dir = tmp_path / "normalized"
+    normalized_dir.mkdir(parents=True, exist_ok=True)
+    _write(normalized_dir, "SPY", [100, 101, 99, 102, 104, 103, 106, 105])
+    _write(normalized_dir, "QQQ", [200, 203, 197, 205, 210, 207, 214, 212])
+
+    os.environ["NORMALIZED_DATA_DIR"] = str(normalized_dir)
+
+    client = TestClient(app)
+    resp = client.get(
+        "/api/v1/analytics/rolling-correlation?symbols=SPY&symbols=QQQ&window=3&window=5"
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["observations"] == 7
+    assert [len(series["points"]) for series in data["windows"]] == [5, 3]
+    assert all(-1.0 <= p["value"] <= 1.0 for p in data["windows"][0]["points"])
+
+    resp = client.get("/api/v1/analytics/rolling-beta?symbol=QQQ&benchmark=SPY&window=4")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["benchmark"] == "SPY"
+    assert len(data["windows"][0]["points"]) == 4
+    assert all(p["value"] > 0.0 for p in data["windows"][0]["points"])
+
+    resp = client.get("/api/v1/analytics/rolling-beta?symbol=SPY&benchmark=SPY")
+    assert resp.status_code == 422
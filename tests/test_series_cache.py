@@ -0,0 +1,69 @@
+import os
+from pathlib import Path
+
+from app.services.market_data.reader import NormalizedCsvReader
+from app.services.market_data.series_cache import SeriesCache, series_cache_key
+
+HEADER = "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+
+
+def _write_series(path: Path, closes: list[float]) -> None:
+    rows = [HEADER]
+    for day, close in enumerate(closes, start=1):
+        rows.append(
+            f"SPY,2024-01-{day:02d}T00:00:00+00:00,{close},{close},{close},{close},0,stooq,1d\n"
+        )
+    path.write_text("".join(rows), encoding="utf-8")
+
+
+def test_reader_serves_repeated_reads_from_cache(tmp_path: Path) -> None:
+    _write_series(tmp_path / "SPY_1d.csv", [100.0, 101.0, 102.0])
+    cache = SeriesCache(max_bytes=1024 * 1024)
+    reader = NormalizedCsvReader(normalized_dir=tmp_path, cache=cache)
+
+    first = reader.read_close_series(symbol="SPY", timeframe="1d", limit=2)
+    second = reader.read_close_series(symbol="SPY", timeframe="1d", limit=3)
+
+    assert [p.close for p in first] == [101.0, 102.0]
+    assert [p.close for p in second] == [100.0, 101.0, 102.0]
+    stats = cache.stats()
+    assert stats.misses == 1
+    assert stats.hits == 1
+    assert stats.entries == 1
+
+
+def test_reader_reparses_file_after_rewrite(tmp_path: Path) -> None:
+    path = tmp_path / "SPY_1d.csv"
+    _write_series(path, [100.0, 101.0])
+    cache = SeriesCache(max_bytes=1024 * 1024)
+    reader = NormalizedCsvReader(normalized_dir=tmp_path, cache=cache)
+    reader.read_close_series(symbol="SPY", timeframe="1d", limit=10)
+
+    _write_series(path, [100.0, 101.0, 105.0])
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    points = reader.read_close_series(symbol="SPY", timeframe="1d", limit=10)
+
+    assert [p.close for p in points] == [100.0, 101.0, 105.0]
+    assert cache.stats().misses == 2
+    assert cache.stats().entries == 1
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    cache = SeriesCache(max_bytes=250)
+    paths = [tmp_path / f"{name}_1d.csv" for name in ("A", "B", "C")]
+    for path in paths:
+        path.write_text("x", encoding="utf-8")
+    keys = [series_cache_key(path) for path in paths]
+
+    cache.put(keys[0], ["a"], size_bytes=100)
+    cache.put(keys[1], ["b"], size_bytes=100)
+    assert cache.get(keys[0]) == ["a"]
+    cache.put(keys[2], ["c"], size_bytes=100)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == ["a"]
+    assert cache.get(keys[2]) == ["c"]
+    assert cache.stats().evictions == 1
+    assert cache.stats().current_bytes == 200
@@ -0,0 +1,51 @@
+from datetime import UTC, datetime
+from pathlib import Path
+
+from app.domain.analytics.drawdown import drawdown_frame, drawdown_series
+from app.domain.analytics.frame import SeriesFrame, epoch_to_datetime
+from app.domain.analytics.returns import log_returns, log_returns_frame
+from app.services.market_data.reader import NormalizedCsvReader
+from app.services.market_data.series_cache import SeriesCache
+
+HEADER = "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+
+
+def test_frame_slices_share_buffers() -> None:
+    frame = SeriesFrame.from_columns([1, 2, 3, 4], close=[10.0, 11.0, 12.0, 13.0])
+
+    tail = frame.tail(2)
+    between = frame.between(2, 3)
+
+    assert list(tail.timestamps) == [3, 4]
+    assert list(between.column("close")) == [11.0, 12.0]
+    assert tail.column("close").obj is frame.column("close").obj
+
+
+def test_frame_kernels_match_point_based_functions() -> None:
+    closes = [100.0, 110.0, 99.0, 120.0]
+    timestamps = [int(datetime(2024, 1, day, tzinfo=UTC).timestamp()) for day in range(1, 5)]
+    frame = SeriesFrame.from_columns(timestamps, close=closes)
+    points = [(epoch_to_datetime(ts), close) for ts, close in zip(timestamps, closes, strict=True)]
+
+    returns = log_returns_frame(frame)
+    drawdowns = drawdown_frame(frame)
+
+    assert list(returns.column()) == [p.value for p in log_returns(points)]
+    assert returns.datetimes() == [p.timestamp_utc for p in log_returns(points)]
+    assert list(drawdowns.column("peak_close")) == [p.peak_close for p in drawdown_series(points)]
+
+
+def test_reader_returns_sorted_close_frame(tmp_path: Path) -> None:
+    (tmp_path / "SPY_1d.csv").write_text(
+        HEADER
+        + "SPY,2024-01-02T00:00:00+00:00,2,2,2,2,0,stooq,1d\n"
+        + "SPY,2024-01-01T00:00:00+00:00,1,1,1,1,0,stooq,1d\n"
+        + "SPY,2024-01-03T00:00:00+00:00,3,3,3,3,0,stooq,1d\n",
+        encoding="utf-8",
+    )
+    reader = NormalizedCsvReader(normalized_dir=tmp_path, cache=SeriesCache(max_bytes=0))
+
+    frame = reader.read_close_frame(symbol="SPY", timeframe="1d", limit=2)
+
+    assert list(frame.column("close")) == [2.0, 3.0]
+    assert frame.datetimes()[-1] == datetime(2024, 1, 3, tzinfo=UTC)
@@ -0,0 +1,112 @@
+import os
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.domain.analytics.drawdown import max_drawdown
+from app.main import app
+from app.schemas.market_data import OhlcvBar
+from app.services.market_data.columnar_store import open_sidecar
+from app.services.market_data.reader import NormalizedCsvReader
+from app.services.market_data.repository import MarketDataRepository
+from app.services.market_data.series_cache import SeriesCache
+from app.services.market_data.series_state import STATE_WINDOW, read_state, state_path
+from app.services.market_data.timestamp_index import build_index, open_index
+
+
+def _bars(closes: list[float], start_hour: int = 0) -> list[OhlcvBar]:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    return [
+        OhlcvBar(
+            symbol="BTCUSDT",
+            timestamp_utc=start + timedelta(hours=start_hour + i),
+            open=close,
+            high=close,
+            low=close,
+            close=close,
+            volume=1.0,
+            source="cryptodatadownload",
+            timeframe="1h",
+        )
+        for i, close in enumerate(closes)
+    ]
+
+
+def test_append_advances_state_sidecar_and_index(tmp_path: Path) -> None:
+    repo = MarketDataRepository(normalized_dir=tmp_path)
+    csv_path = repo.write_bars_csv(bars=_bars([100, 120, 90]), symbol="BTCUSDT", timeframe="1h")
+    index_before = open_index(csv_path)
+    assert index_before is not None
+    index_before = list(index_before.offsets)
+
+    # The overlapping bar is skipped; only the two newer ones are appended.
+    repo.append_bars(bars=_bars([90, 130, 60], start_hour=2), symbol="BTCUSDT", timeframe="1h")
+
+    state = read_state(csv_path)
+    assert state is not None
+    assert state.rows == 5
+    assert state.last_close == 60.0
+    assert state.peak == 130.0
+    assert state.max_drawdown == max_drawdown([100, 120, 90, 130, 60])
+    assert state.last_timestamp == int(datetime(2024, 1, 1, 4, tzinfo=UTC).timestamp())
+
+    columns = open_sidecar(csv_path)
+    assert columns is not None
+    assert list(columns.close) == [100.0, 120.0, 90.0, 130.0, 60.0]
+
+    index = open_index(csv_path)
+    assert index is not None
+    offsets = list(index.offsets)
+    build_index(csv_path)
+    rebuilt = open_index(csv_path)
+    assert rebuilt is not None
+    assert offsets[:3] == index_before
+    assert offsets == list(rebuilt.offsets)
+
+    reader = NormalizedCsvReader(normalized_dir=tmp_path, cache=SeriesCache(max_bytes=1 << 20))
+    frame = reader.read_close_frame(symbol="BTCUSDT", timeframe="1h", limit=10)
+    assert list(frame.column("close")) == [100.0, 120.0, 90.0, 130.0, 60.0]
+
+
+def test_state_keeps_only_the_newest_closes(tmp_path: Path) -> None:
+    repo = MarketDataRepository(normalized_dir=tmp_path)
+    closes = [100.0 + i for i in range(STATE_WINDOW + 10)]
+    csv_path = repo.write_bars_csv(bars=_bars(closes), symbol="BTCUSDT", timeframe="1h")
+
+    state = read_state(csv_path)
+    assert state is not None
+    assert state.rows == len(closes)
+    assert state.recent_closes == closes[-STATE_WINDOW:]
+    assert state.tail(3) == closes[-3:]
+    assert state.tail(STATE_WINDOW + 1) is None
+
+
+def test_external_rewrite_makes_state_stale(tmp_path: Path) -> None:
+    normalized_dir = tmp_path / "normalized"
+    repo = MarketDataRepository(normalized_dir=normalized_dir)
+    csv_path = repo.write_bars_csv(bars=_bars([100, 110]), symbol="BTCUSDT", timeframe="1h")
+
+    with csv_path.open("a", encoding="utf-8") as f:
+        f.write("BTCUSDT,2024-01-01T02:00:00+00:00,1,1,1,55,0,cryptodatadownload,1h\n")
+    assert read_state(csv_path) is None
+
+    os.environ["NORMALIZED_DATA_DIR"] = str(normalized_dir)
+    client = TestClient(app)
+
+    resp = client.get("/api/v1/assets/BTCUSDT/risk-summary?timeframe=1h")
+    assert resp.status_code == 200
+    from_series = resp.json()
+    assert from_series["observations"] == 2
+
+    resp = client.get("/api/v1/assets/overview")
+    assert resp.status_code == 200
+    asset = resp.json()["assets"][0]
+    assert asset["last_close"] == 55.0
+    assert asset["max_drawdown"] == 55.0 / 110.0 - 1.0
+    assert state_path(csv_path).exists()
+    assert read_state(csv_path) is not None
+
+    # With a fresh state the same request is answered from the state alone.
+    resp = client.get("/api/v1/assets/BTCUSDT/risk-summary?timeframe=1h")
+    assert resp.json() == from_series
@@ -0,0 +1,91 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from app.services.market_data.columnar_store import OhlcvRow, sidecar_path
+from app.services.market_data.reader import NormalizedCsvReader
+from app.services.market_data.series_cache import SeriesCache, series_cache_key
+from app.services.market_data.shared_store import SharedSeriesStore
+
+
+def _write_csv(path: Path, closes: list[float]) -> None:
+    lines = ["symbol,timestamp_utc,open,high,low,close,volume,source,timeframe"]
+    for i, close in enumerate(closes):
+        ts = f"2024-01-01T{i:02d}:00:00+00:00"
+        lines.append(f"BTCUSDT,{ts},{close},{close},{close},{close},1,cryptodatadownload,1h")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_reader_builds_the_sidecar_once_and_maps_it(tmp_path: Path) -> None:
+    csv_path = tmp_path / "BTCUSDT_1h.csv"
+    _write_csv(csv_path, [100.0, 101.0, 99.0])
+    cache = SeriesCache(max_bytes=1 << 20)
+    reader = NormalizedCsvReader(
+        normalized_dir=tmp_path, cache=cache, shared_store=SharedSeriesStore()
+    )
+
+    frame = reader.read_close_frame(symbol="BTCUSDT", timeframe="1h", limit=2)
+
+    assert list(frame.column("close")) == [101.0, 99.0]
+    assert sidecar_path(csv_path).exists()
+    # The columns are mapped from the shared file, not copied into this process' cache.
+    assert cache.stats().entries == 0
+
+    # A rewritten CSV gets a new sidecar on its next read.
+    _write_csv(csv_path, [100.0, 101.0, 99.0, 98.0])
+    frame = reader.read_close_frame(symbol="BTCUSDT", timeframe="1h", limit=2)
+    assert list(frame.column("close")) == [99.0, 98.0]
+
+
+def test_concurrent_loads_parse_the_csv_once(tmp_path: Path) -> None:
+    csv_path = tmp_path / "BTCUSDT_1h.csv"
+    _write_csv(csv_path, [100.0, 101.0])
+    key = series_cache_key(csv_path)
+    parses: list[Path] = []
+
+    def parse(path: Path) -> list[OhlcvRow]:
+        parses.append(path)
+        time.sleep(0.05)
+        return [(1, 1.0, 1.0, 1.0, 100.0, 1.0), (2, 1.0, 1.0, 1.0, 101.0, 1.0)]
+
+    # One store per thread stands in for one store per server process.
+    results: list[list[float]] = []
+
+    def load() -> None:
+        columns = SharedSeriesStore().load(csv_path, key, parse)
+        assert columns is not None
+        results.append(list(columns.close))
+
+    threads = [threading.Thread(target=load) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(parses) == 1
+    assert results == [[100.0, 101.0]] * 4
+
+
+def test_shared_store_reads_the_same_series_as_the_csv(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_path = tmp_path / "BTCUSDT_1h.csv"
+    csv_path.write_text(
+        "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+        "BTCUSDT,2024-01-01T00:00:00+00:00,1,1,1,100,1,cryptodatadownload,1h\n"
+        "BTCUSDT,2024-01-01T01:00:00+00:00,1,1,1,,1,cryptodatadownload,1h\n"
+        "BTCUSDT,2024-01-01T02:00:00+00:00,,1,1,110,x,cryptodatadownload,1h\n",
+        encoding="utf-8",
+    )
+
+    frames = []
+    for enabled in ("0", "1"):
+        monkeypatch.setenv("SHARED_SERIES_STORE", enabled)
+        reader = NormalizedCsvReader(normalized_dir=tmp_path, cache=SeriesCache(max_bytes=1 << 20))
+        frames.append(reader.read_close_frame(symbol="BTCUSDT", timeframe="1h", limit=10))
+
+    assert sidecar_path(csv_path).exists()
+    assert list(frames[0].column("close")) == [100.0, 110.0]
+    assert frames[1] == frames[0]
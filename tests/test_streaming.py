@@ -0,0 +1,103 @@
+import csv
+import io
+import json
+import os
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.api.export import CSV_MEDIA_TYPE, NDJSON_MEDIA_TYPE
+from app.domain.analytics.returns import log_returns_frame, stream_log_returns
+from app.main import app
+from app.services.market_data.manifest import read_manifest
+from app.services.market_data.reader import NormalizedCsvReader
+
+HEADER = "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+START = datetime(2000, 1, 1, tzinfo=UTC)
+
+
+def _write_csv(normalized_dir: Path, symbol: str, closes: list[float]) -> None:
+    rows = "".join(
+        f"{symbol},{(START + timedelta(days=day)).isoformat()},1,1,1,{close},0,stooq,1d\n"
+        for day, close in enumerate(closes)
+    )
+    (normalized_dir / f"{symbol}_1d.csv").write_text(HEADER + rows, encoding="utf-8")
+
+
+def _closes(count: int) -> list[float]:
+    return [100.0 + (day % 37) - (day % 11) * 0.5 for day in range(count)]
+
+
+def test_unbounded_csv_and_ndjson_stream_the_whole_history(tmp_path: Path) -> None:
+    # Longer than one streamed block, with no manifest: the first stream records one.
+    closes = _closes(10_000)
+    _write_csv(tmp_path, "SPX", closes)
+    os.environ["NORMALIZED_DATA_DIR"] = str(tmp_path)
+    client = TestClient(app)
+
+    response = client.get(
+        "/api/v1/assets/SPX/prices",
+        params={"timeframe": "1d"},
+        headers={"Accept": NDJSON_MEDIA_TYPE},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(NDJSON_MEDIA_TYPE)
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["close"] for line in lines] == closes
+    assert lines[0]["timestamp_utc"] == "2000-01-01T00:00:00Z"
+    manifest = read_manifest(tmp_path / "SPX_1d.csv")
+    assert manifest is not None
+    assert manifest.is_sorted and manifest.rows == len(closes)
+
+    response = client.get(
+        "/api/v1/assets/SPX/prices",
+        params={"timeframe": "1d", "start": "2010-01-01", "end": "2011-12-31"},
+        headers={"Accept": CSV_MEDIA_TYPE},
+    )
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    first = (datetime(2010, 1, 1, tzinfo=UTC) - START).days
+    last = (datetime(2011, 12, 31, tzinfo=UTC) - START).days
+    assert [float(row["close"]) for row in rows] == closes[first : last + 1]
+
+    # An explicit limit keeps the newest rows, as for JSON.
+    response = client.get(
+        "/api/v1/assets/SPX/prices",
+        params={"timeframe": "1d", "limit": 3},
+        headers={"Accept": CSV_MEDIA_TYPE},
+    )
+    assert [float(row["close"]) for row in csv.DictReader(io.StringIO(response.text))] == closes[
+        -3:
+    ]
+
+    response = client.get(
+        "/api/v1/assets/NOPE/prices",
+        params={"timeframe": "1d"},
+        headers={"Accept": NDJSON_MEDIA_TYPE},
+    )
+    assert response.status_code == 404
+
+
+def test_streamed_returns_match_the_whole_series(tmp_path: Path) -> None:
+    closes = _closes(9_000)
+    _write_csv(tmp_path, "SPX", closes)
+    os.environ["NORMALIZED_DATA_DIR"] = str(tmp_path)
+
+    response = TestClient(app).get(
+        "/api/v1/assets/SPX/returns",
+        params={"timeframe": "1d", "type": "log"},
+        headers={"Accept": NDJSON_MEDIA_TYPE},
+    )
+    assert response.status_code == 200
+    streamed = [json.loads(line)["value"] for line in response.text.splitlines()]
+
+    frame = NormalizedCsvReader(normalized_dir=tmp_path).read_close_frame("SPX", "1d", 10_000)
+    expected = log_returns_frame(frame)
+    assert streamed == list(expected.column("value"))
+
+    # Block boundaries do not change the result.
+    blocks = list(stream_log_returns(frame.blocks(7)))
+    values = [value for block in blocks for value in block.column("value")]
+    timestamps = [ts for block in blocks for ts in block.timestamps]
+    assert values == list(expected.column("value"))
+    assert timestamps == list(expected.timestamps)
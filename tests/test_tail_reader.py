@@ -0,0 +1,72 @@
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from app.services.market_data.manifest import read_manifest, write_manifest
+from app.services.market_data.reader import NormalizedCsvReader
+from app.services.market_data.series_cache import SeriesCache, series_cache_key
+
+HEADER = "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\r\n"
+
+
+def _write_series(path: Path, count: int) -> None:
+    start = datetime(2000, 1, 1, tzinfo=UTC)
+    rows = [HEADER]
+    for day in range(count):
+        ts = start + timedelta(days=day)
+        rows.append(f"SPX,{ts.isoformat()},{day},{day},{day},{day},0,stooq,1d\r\n")
+    path.write_text("".join(rows), encoding="utf-8")
+
+
+def test_tail_read_matches_full_scan_for_sorted_file(tmp_path: Path) -> None:
+    path = tmp_path / "SPX_1d.csv"
+    _write_series(path, 3000)
+    write_manifest(path, rows=3000, is_sorted=True)
+    reader = NormalizedCsvReader(normalized_dir=tmp_path, cache=SeriesCache(max_bytes=0))
+
+    for limit in (1, 2, 365, 2999, 3000, 5000):
+        points = reader.read_close_series(symbol="SPX", timeframe="1d", limit=limit)
+        expected = [float(day) for day in range(max(0, 3000 - limit), 3000)]
+        assert [p.close for p in points] == expected
+
+
+def test_tail_read_only_parses_requested_rows(tmp_path: Path) -> None:
+    path = tmp_path / "SPX_1d.csv"
+    _write_series(path, 3000)
+    write_manifest(path, rows=3000, is_sorted=True)
+    cache = SeriesCache(max_bytes=1024 * 1024 * 1024)
+    reader = NormalizedCsvReader(normalized_dir=tmp_path, cache=cache)
+
+    reader.read_close_series(symbol="SPX", timeframe="1d", limit=10)
+
+    cached = cache.get(series_cache_key(path))
+    assert cached is not None
+    assert not cached.complete
+    assert len(cached.frame) < 3000
+
+
+def test_unsorted_file_falls_back_to_full_scan(tmp_path: Path) -> None:
+    path = tmp_path / "SPX_1d.csv"
+    path.write_text(
+        HEADER
+        + "SPX,2024-01-03T00:00:00+00:00,3,3,3,3,0,stooq,1d\r\n"
+        + "SPX,2024-01-01T00:00:00+00:00,1,1,1,1,0,stooq,1d\r\n"
+        + "SPX,2024-01-02T00:00:00+00:00,2,2,2,2,0,stooq,1d\r\n",
+        encoding="utf-8",
+    )
+    write_manifest(path, rows=3, is_sorted=True)
+    reader = NormalizedCsvReader(normalized_dir=tmp_path, cache=SeriesCache(max_bytes=0))
+
+    points = reader.read_close_series(symbol="SPX", timeframe="1d", limit=2)
+
+    assert [p.close for p in points] == [2.0, 3.0]
+
+
+def test_manifest_is_stale_after_csv_rewrite(tmp_path: Path) -> None:
+    path = tmp_path / "SPX_1d.csv"
+    _write_series(path, 3)
+    write_manifest(path, rows=3, is_sorted=True)
+    assert read_manifest(path) is not None
+
+    _write_series(path, 4)
+
+    assert read_manifest(path) is None
@@ -0,0 +1,125 @@
+import os
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.market_data.reader import NormalizedCsvReader
+from app.services.market_data.series_cache import SeriesCache
+from app.services.market_data.timestamp_index import build_index, open_index
+
+HEADER = "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+
+
+def _write_series(path: Path, count: int) -> None:
+    start = datetime(2008, 1, 1, tzinfo=UTC)
+    rows = [HEADER]
+    for day in range(count):
+        ts = start + timedelta(days=day)
+        rows.append(f"SPY,{ts.isoformat()},{day},{day},{day},{day},0,stooq,1d\n")
+    path.write_text("".join(rows), encoding="utf-8")
+
+
+def test_index_range_read_matches_full_scan(tmp_path: Path) -> None:
+    path = tmp_path / "SPY_1d.csv"
+    _write_series(path, 1000)
+    assert build_index(path) is not None
+    index = open_index(path)
+    assert index is not None
+    assert len(index) == 1000
+
+    reader = NormalizedCsvReader(normalized_dir=tmp_path, cache=SeriesCache(max_bytes=0))
+    start = datetime(2008, 3, 1, tzinfo=UTC)
+    end = datetime(2008, 3, 10, 12, tzinfo=UTC)
+
+    points = reader.read_close_series(
+        symbol="SPY", timeframe="1d", limit=5000, start=start, end=end
+    )
+    limited = reader.read_close_series(symbol="SPY", timeframe="1d", limit=3, start=start, end=end)
+    only_end = reader.read_close_series(symbol="SPY", timeframe="1d", limit=2, end=start)
+
+    assert [p.close for p in points] == [float(day) for day in range(60, 70)]
+    assert [p.close for p in limited] == [67.0, 68.0, 69.0]
+    assert [p.close for p in only_end] == [59.0, 60.0]
+
+
+def test_index_skips_rows_the_close_readers_skip(tmp_path: Path) -> None:
+    path = tmp_path / "SPY_1d.csv"
+    start = datetime(2008, 1, 1, tzinfo=UTC)
+    rows = [HEADER]
+    for day in range(100):
+        ts = (start + timedelta(days=day)).isoformat()
+        close = {40: "", 45: "n/a", 52: " "}.get(day, str(day))
+        rows.append(f"SPY,{ts},{day},{day},{day},{close},0,stooq,1d\n")
+    rows.append("SPY,not-a-date,1,1,1,1,0,stooq,1d\n")
+    path.write_text("".join(rows), encoding="utf-8")
+
+    range_start = datetime(2008, 1, 21, tzinfo=UTC)
+    range_end = datetime(2008, 3, 1, tzinfo=UTC)
+
+    def read(limit: int) -> list[tuple[datetime, float]]:
+        reader = NormalizedCsvReader(normalized_dir=tmp_path, cache=SeriesCache(max_bytes=0))
+        points = reader.read_close_series(
+            symbol="SPY", timeframe="1d", limit=limit, start=range_start, end=range_end
+        )
+        return [(p.timestamp_utc, p.close) for p in points]
+
+    assert build_index(path) is not None
+    index = open_index(path)
+    assert index is not None
+    assert len(index) == 97
+    indexed = {limit: read(limit) for limit in (5000, 30)}
+
+    path.with_suffix(".idx").unlink()
+    assert open_index(path) is None
+    for limit, points in indexed.items():
+        assert points == read(limit)
+    assert len(indexed[30]) == 30
+    assert len(indexed[5000]) == 38
+
+
+def test_index_is_not_written_for_unsorted_file(tmp_path: Path) -> None:
+    path = tmp_path / "SPY_1d.csv"
+    path.write_text(
+        HEADER
+        + "SPY,2024-01-02T00:00:00+00:00,2,2,2,2,0,stooq,1d\n"
+        + "SPY,2024-01-01T00:00:00+00:00,1,1,1,1,0,stooq,1d\n",
+        encoding="utf-8",
+    )
+
+    assert build_index(path) is None
+    assert open_index(path) is None
+
+
+def test_prices_endpoint_filters_by_start_and_end(tmp_path: Path) -> None:
+    normalized_dir = tmp_path / "normalized"
+    normalized_dir.mkdir(parents=True, exist_ok=True)
+    path = normalized_dir / "SPY_1d.csv"
+    _write_series(path, 800)
+    build_index(path)
+
+    os.environ["NORMALIZED_DATA_DIR"] = str(normalized_dir)
+
+    client = TestClient(app)
+    resp = client.get(
+        "/api/v1/assets/SPY/prices?timeframe=1d&start=2008-01-01&end=2009-12-31&limit=5000"
+    )
+    assert resp.status_code == 200
+
+    points = resp.json()["points"]
+    assert len(points) == 731
+    assert points[0]["timestamp_utc"].startswith("2008-01-01")
+    assert points[-1]["timestamp_utc"].startswith("2009-12-31")
+
+
+def test_series_endpoints_reject_inverted_range(tmp_path: Path) -> None:
+    normalized_dir = tmp_path / "normalized"
+    normalized_dir.mkdir(parents=True, exist_ok=True)
+    _write_series(normalized_dir / "SPY_1d.csv", 10)
+
+    os.environ["NORMALIZED_DATA_DIR"] = str(normalized_dir)
+
+    client = TestClient(app)
+    resp = client.get("/api/v1/assets/SPY/returns?timeframe=1d&start=2009-01-01&end=2008-01-01")
+    assert resp.status_code == 422
@@ -0,0 +1,41 @@
+import pytest
+
+from app.services.market_data.timestamps import make_epoch_decoder, parse_timestamp_epoch
+
+
+def test_epoch_decoder_matches_generic_parser_for_daily_layout() -> None:
+    decode = make_epoch_decoder()
+    values = [
+        "1789-05-01T00:00:00+00:00",
+        "1969-12-31T00:00:00+00:00",
+        "2024-02-29T00:00:00+00:00",
+        "2026-03-05T00:00:00+00:00",
+    ]
+    assert [decode(v) for v in values] == [parse_timestamp_epoch(v) for v in values]
+
+
+def test_epoch_decoder_applies_utc_offsets() -> None:
+    decode = make_epoch_decoder()
+    assert decode("2024-01-01T01:00:00+01:00") == decode("2024-01-01T00:00:00+00:00")
+    assert decode("2024-01-01T00:00:00-05:30") == parse_timestamp_epoch("2024-01-01T05:30:00Z")
+    assert decode("2024-01-01T00:30:00+01:00") == parse_timestamp_epoch("2023-12-31T23:30:00Z")
+
+
+def test_epoch_decoder_handles_other_layouts() -> None:
+    for value in ("2024-01-01 05:00:00", "2024-01-01", "2024-01-01T05:00:00Z"):
+        decode = make_epoch_decoder()
+        assert decode(value) == parse_timestamp_epoch(value)
+
+
+def test_epoch_decoder_falls_back_for_values_outside_detected_layout() -> None:
+    decode = make_epoch_decoder()
+    decode("2024-01-01T00:00:00+00:00")
+
+    assert decode(" 2024-01-02T00:00:00+00:00 ") == parse_timestamp_epoch("2024-01-02T00:00:00Z")
+    assert decode("2024-01-02T00:00:00.500000+00:00") == parse_timestamp_epoch(
+        "2024-01-02T00:00:00.5+00:00"
+    )
+    with pytest.raises(ValueError):
+        decode("2024-02-30T00:00:00+00:00")
+    with pytest.raises(ValueError):
+        decode("not a timestamp")
@@ -28,3 +28,31 @@ def test_volatility_endpoint_reads_normalized_csv(tmp_path: Path) -> None:
     assert data["symbol"] == "BTCUSDT"
     assert len(data["points"]) >= 1
     assert data["points"][0]["value"] >= 0.0
+
+
+def test_volatility_endpoint_returns_one_series_per_window(tmp_path: Path) -> None:
+    normalized_dir = tmp_path / "normalized"
+    normalized_dir.mkdir(parents=True, exist_ok=True)
+
+    rows = "".join(
+        f"BTCUSDT,2024-01-01T{hour:02d}:00:00+00:00,1,1,1,{100 + hour % 3},1,binance,1h\n"
+        for hour in range(12)
+    )
+    (normalized_dir / "BTCUSDT_1h.csv").write_text(
+        "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n" + rows,
+        encoding="utf-8",
+    )
+
+    os.environ["NORMALIZED_DATA_DIR"] = str(normalized_dir)
+
+    client = TestClient(app)
+    resp = client.get("/api/v1/assets/BTCUSDT/volatility?timeframe=1h&window=2&window=5")
+    assert resp.status_code == 200
+
+    data = resp.json()
+    assert [series["window"] for series in data["windows"]] == [2, 5]
+    assert [len(series["points"]) for series in data["windows"]] == [10, 7]
+    assert data["points"] == data["windows"][0]["points"]
+
+    resp = client.get("/api/v1/assets/BTCUSDT/volatility?timeframe=1h&window=1")
+    assert resp.status_code == 422
@@ -1,6 +1,8 @@
+import math
+import random
 from datetime import UTC, datetime
 
-from app.domain.analytics.volatility import rolling_std
+from app.domain.analytics.volatility import rolling_std, rolling_std_values
 
 
 def test_rolling_std_window_2() -> None:
@@ -12,3 +14,17 @@ def test_rolling_std_window_2() -> None:
     out = rolling_std(values=values, window=2)
     assert len(out) == 2
     assert out[0].value >= 0.0
+
+
+def test_rolling_std_streaming_matches_direct_computation() -> None:
+    rng = random.Random(3)
+    values = [rng.gauss(0.0, 0.02) for _ in range(3000)]
+
+    for window in (2, 30, 250):
+        out = rolling_std_values(values, window)
+        assert len(out) == len(values) - window + 1
+        for i, std in enumerate(out):
+            chunk = values[i : i + window]
+            mean = sum(chunk) / window
+            expected = math.sqrt(sum((x - mean) ** 2 for x in chunk) / window)
+            assert math.isclose(std, expected, rel_tol=1e-9, abs_tol=1e-12)
@@ -0,0 +1,95 @@
+import os
+import threading
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.market_data import warmup
+from app.services.market_data.access_stats import AccessStats, ranked_series
+from app.services.market_data.assets_summary import get_materialized_overview
+from app.services.market_data.series_cache import get_series_cache, series_cache_key
+
+HEADER = "symbol,timestamp_utc,open,high,low,close,volume,source,timeframe\n"
+
+
+def _write_csv(normalized_dir: Path, symbol: str, days: int) -> Path:
+    rows = "".join(
+        f"{symbol},2024-01-{day + 1:02d}T00:00:00+00:00,1,1,1,{100 + day},0,stooq,1d\n"
+        for day in range(days)
+    )
+    path = normalized_dir / f"{symbol}_1d.csv"
+    path.write_text(HEADER + rows, encoding="utf-8")
+    return path
+
+
+def test_health_reports_warming_until_series_and_overview_are_loaded(
+    tmp_path: Path, monkeypatch
+) -> None:
+    spy_path = _write_csv(tmp_path, "SPY", 5)
+    _write_csv(tmp_path, "QQQ", 3)
+    os.environ["NORMALIZED_DATA_DIR"] = str(tmp_path)
+    monkeypatch.setenv("WARMUP_SERIES", "QQQ_1d, SPY_1d, XYZ_1d")
+    monkeypatch.setattr(warmup, "_shared_warmup", warmup.Warmup())
+
+    # Hold the warm-up at the overview step to observe the warming state.
+    release = threading.Event()
+    overview = get_materialized_overview()
+
+    class _BlockedOverview:
+        def rows(self, normalized_dir: Path) -> object:
+            release.wait(5)
+            return overview.rows(normalized_dir)
+
+    monkeypatch.setattr(warmup, "get_materialized_overview", _BlockedOverview)
+
+    with TestClient(app) as client:
+        resp = client.get("/api/v1/health")
+        assert resp.status_code == 503
+        assert resp.json()["status"] == "warming"
+
+        release.set()
+        assert warmup.get_warmup().wait(5)
+
+        resp = client.get("/api/v1/health")
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["status"] == "ok"
+        assert body["warmup"]["state"] == "ready"
+        assert body["warmup"]["series_total"] == 2
+        assert body["warmup"]["series_loaded"] == 2
+        assert body["warmup"]["overview_ready"] is True
+
+    assert get_series_cache().get(series_cache_key(spy_path)) is not None
+
+
+def test_warmup_stays_within_its_memory_budget(tmp_path: Path) -> None:
+    for symbol, days in (("SPY", 20), ("QQQ", 5), ("IWM", 5)):
+        _write_csv(tmp_path, symbol, days)
+    runner = warmup.Warmup()
+
+    # The first series fills the budget, so nothing else is loaded after it.
+    runner.start(tmp_path, "QQQ_1d,SPY_1d,IWM_1d", max_bytes=5 * 16)
+    assert runner.wait(5)
+
+    status = runner.status()
+    assert status.state == "ready"
+    assert status.series_total == 3
+    assert status.series_loaded == 1
+    assert status.loaded_bytes == 5 * 16
+
+
+def test_access_stats_rank_series_by_merged_counts(tmp_path: Path) -> None:
+    first = AccessStats()
+    for _ in range(3):
+        first.record("SPY", "1d")
+    first.record("QQQ", "1d")
+    first.flush(tmp_path)
+    assert ranked_series(tmp_path) == [("SPY", "1d"), ("QQQ", "1d")]
+
+    # Another process' counts are added to the persisted ones.
+    second = AccessStats()
+    for _ in range(5):
+        second.record("QQQ", "1d")
+    second.flush(tmp_path)
+    assert ranked_series(tmp_path) == [("QQQ", "1d"), ("SPY", "1d")]